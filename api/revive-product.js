@@ -2,10 +2,53 @@
  * POST /api/revive-product
  * Body: { "productId": "...", "adminPin": "..." }
  * data/soldout_log.json 을 GitHub API로 갱신합니다.
+ * 크롤러 probe 명령이 남긴 data/revive_candidates.json 의 재입고 후보에서도 해당 상품을 제거합니다.
  */
 const { Octokit } = require('@octokit/rest');
 
 const LOG_PATH = 'data/soldout_log.json';
+const CANDIDATES_PATH = 'data/revive_candidates.json';
+
+/** 복원한 상품을 재입고 후보 목록에서 제거 (파일이 없거나 후보가 아니면 그대로 둠) */
+async function dropReviveCandidate(octokit, owner, repo, branch, productId) {
+  let fileData;
+  try {
+    ({ data: fileData } = await octokit.repos.getContent({
+      owner,
+      repo,
+      path: CANDIDATES_PATH,
+      ref: branch,
+    }));
+  } catch (e) {
+    const st = e && (e.status || (e.response && e.response.status));
+    if (st === 404) {
+      return false;
+    }
+    throw e;
+  }
+  if (fileData.type !== 'file' || !fileData.content) {
+    return false;
+  }
+
+  const content = JSON.parse(Buffer.from(fileData.content, 'base64').toString('utf8'));
+  const candidates = Array.isArray(content.candidates) ? content.candidates : [];
+  const remaining = candidates.filter((c) => String(c.id) !== productId);
+  if (remaining.length === candidates.length) {
+    return false;
+  }
+  content.candidates = remaining;
+
+  await octokit.repos.createOrUpdateFileContents({
+    owner,
+    repo,
+    path: CANDIDATES_PATH,
+    message: `복원: 재입고 후보 ${productId} 처리`,
+    content: Buffer.from(JSON.stringify(content, null, 2), 'utf8').toString('base64'),
+    branch,
+    sha: fileData.sha,
+  });
+  return true;
+}
 
 module.exports = async (req, res) => {
   res.setHeader('Content-Type', 'application/json; charset=utf-8');
@@ -102,7 +145,15 @@ module.exports = async (req, res) => {
 
     await octokit.repos.createOrUpdateFileContents(payload);
 
-    res.json({ success: true, productId });
+    // 후보 목록 정리는 부가 작업 — 실패해도 복원 자체는 성공으로 응답
+    let candidateCleared = false;
+    try {
+      candidateCleared = await dropReviveCandidate(octokit, owner, repo, branch, productId);
+    } catch (e) {
+      candidateCleared = false;
+    }
+
+    res.json({ success: true, productId, candidateCleared });
   } catch (err) {
     const msg = err && err.message ? err.message : 'unknown_error';
     res.status(500).json({ error: msg });
@@ -0,0 +1,169 @@
+"""
+async_fetch.py - 상품 상세 페이지 비동기 다운로드 엔진
+
+asyncio + aiohttp 로 item.php 페이지를 동시에 16~32건 내려받는다.
+  - 호스트별 동시 요청 수 제한 (asyncio.Semaphore)
+  - keep-alive 커넥션 풀 재사용 (aiohttp.TCPConnector)
+  - gzip/deflate (+ Brotli 설치 시 br) 압축 협상
+
+이벤트 루프는 전용 스레드에서 돌고, 호출 측은 submit()이 돌려주는
+concurrent.futures.Future 로 결과를 받는다 (동기 코드에서 그대로 사용 가능).
+
+cache(http_cache.ResponseCache)를 넘기면 TTL 이내 항목은 요청 없이 반환하고,
+나머지는 If-None-Match / If-Modified-Since 조건부 GET으로 재검증한다.
+
+사용:
+    with AsyncPageFetcher(HEADERS, cache=ResponseCache()) as fetcher:
+        page = fetcher.submit(url).result()
+"""
+
+import asyncio
+import threading
+from urllib.parse import urlsplit
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401  (aiohttp가 br 응답 해제에 사용)
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# 호스트당 동시 요청 수 기본값 (16~32 권장 — 쇼핑몰 서버 부하 고려)
+DEFAULT_PER_HOST = 24
+ACCEPT_ENCODING = "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate"
+
+
+class AsyncPageFetcher:
+    """전용 이벤트 루프 스레드에서 aiohttp 세션 하나를 공유하는 페이지 다운로더."""
+
+    def __init__(self, headers, per_host=DEFAULT_PER_HOST, timeout=15, retries=2, cache=None):
+        if not AIOHTTP_AVAILABLE:
+            raise RuntimeError("aiohttp 미설치: pip install -r requirements.txt")
+        self.headers = dict(headers)
+        self.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        self.per_host = per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.cache = cache
+        self._loop = None
+        self._thread = None
+        self._session = None
+        self._host_slots = {}
+
+    # ── 수명 관리 ──
+    def start(self):
+        if self._loop is not None:
+            return self
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="async-fetch", daemon=True
+        )
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._open(), self._loop).result()
+        return self
+
+    def close(self):
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+        self._session = None
+        self._host_slots = {}
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    async def _open(self):
+        connector = aiohttp.TCPConnector(
+            limit=0,  # 전체 상한은 호스트별 세마포어로 관리
+            limit_per_host=self.per_host,
+            keepalive_timeout=30,
+            ttl_dns_cache=300,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            auto_decompress=True,
+        )
+
+    # ── 요청 ──
+    def _slot(self, url):
+        """호스트별 세마포어 (루프 스레드에서만 호출)."""
+        host = urlsplit(url).netloc
+        sem = self._host_slots.get(host)
+        if sem is None:
+            sem = asyncio.Semaphore(self.per_host)
+            self._host_slots[host] = sem
+        return sem
+
+    def _cache_lookup(self, url):
+        """(신선한 캐시 page 또는 None, 캐시 항목, 조건부 GET 헤더) — 스레드 풀에서 실행."""
+        page, entry = self.cache.lookup(url)
+        return page, entry, None if page is not None else self.cache.conditional_headers(entry)
+
+    async def _fetch(self, url):
+        entry = None
+        extra_headers = None
+        if self.cache is not None:
+            # 캐시 조회·기록은 디스크 I/O — 이벤트 루프를 막지 않도록 기본 스레드 풀에서 실행
+            page, entry, extra_headers = await asyncio.to_thread(self._cache_lookup, url)
+            if page is not None:
+                return page
+
+        last_error = None
+        for _ in range(self.retries):
+            try:
+                # 세마포어 획득 후에 타임아웃을 재야 대기열 시간이 포함되지 않음
+                async with self._slot(url):
+                    async with self._session.get(
+                        url,
+                        headers=extra_headers,
+                        timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    ) as resp:
+                        body = await resp.read()
+                        final_url, status, headers = str(resp.url), resp.status, resp.headers.copy()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = e
+                await asyncio.sleep(0.6)
+                continue
+            if self.cache is not None:
+                # 호스트 슬롯을 놓은 뒤 기록 (디스크 쓰기 동안 다른 요청이 슬롯을 사용)
+                return await asyncio.to_thread(
+                    self.cache.resolve, url, entry, final_url, status, headers, body
+                )
+            return {
+                "url": url,
+                "final_url": final_url,
+                "status": status,
+                "text": body.decode("utf-8", errors="replace"),
+            }
+        raise last_error
+
+    def submit(self, url):
+        """url 다운로드를 예약하고 concurrent.futures.Future 를 반환."""
+        if self._loop is None:
+            self.start()
+        return asyncio.run_coroutine_threadsafe(self._fetch(url), self._loop)
+
+    def fetch_many(self, urls):
+        """동기 래퍼: {url: page dict 또는 None} (실패한 url은 None)."""
+        futures = {url: self.submit(url) for url in dict.fromkeys(urls)}
+        results = {}
+        for url, future in futures.items():
+            try:
+                results[url] = future.result()
+            except Exception:
+                results[url] = None
+        return results
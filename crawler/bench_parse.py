@@ -0,0 +1,378 @@
+"""
+bench_parse.py - 상세 페이지 파서 벤치마크 (보관된 HTML 기준, 네트워크 없음)
+
+고정된 상세 페이지 묶음(코퍼스)으로 파싱 핫 함수의 속도를 잰다.
+  - parse_product_page (= parse_product_detail의 파싱 단계)
+  - extract_game_fps_map / extract_games_from_fps_section / scan_game_fps (둘을 한 번에)
+  - PriceScan (가격 표 단일 스캔) / short_cpu·short_gpu / spec_catalog 조회 / classify_tier
+함수별로 초당 페이지 수, 페이지당 p50/p95 지연(ms), 최대 메모리(tracemalloc)를 출력하고
+저장된 기준값(baseline)보다 처리량이 떨어지거나 p95가 늘면 회귀로 표시(종료 코드 1)한다.
+
+코퍼스:
+  - 기본: 원문 보관소(.cache/archive)의 마지막 크롤링 대상 — 크롤러를 한 번 실행하면 채워짐
+  - --fixtures DIR: {it_id}.html / {it_id}.html.gz (+ 선택 corpus.json: 카테고리·URL)
+  - --freeze DIR: 지금 코퍼스를 DIR에 고정 저장 (보관소가 갱신돼도 같은 페이지로 비교)
+
+실행:
+    cd crawler
+    python bench_parse.py --freeze ../.cache/bench/corpus     # 코퍼스 고정 (1회)
+    python bench_parse.py --fixtures ../.cache/bench/corpus --save-baseline
+    python bench_parse.py --fixtures ../.cache/bench/corpus   # 파서 수정 후 비교
+    python bench_parse.py --legacy                            # BeautifulSoup 기존 추출기와 비교
+"""
+
+import argparse
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from crawl_products import (
+    PRICE_LABELS,
+    PriceScan,
+    classify_tier,
+    parse_product_page,
+    product_url,
+)
+from detail_extract import SPEC_KEYS, TABLE_SPEC_KEYS, extract_detail
+from game_fps import extract_game_fps_map, extract_games_from_fps_section, scan_game_fps
+from html_archive import HtmlArchive
+from spec_catalog import SPEC_CATALOG, short_cpu, short_gpu
+
+BASELINE_PATH = Path(__file__).resolve().parent.parent / ".cache" / "bench" / "parse_baseline.json"
+# 처리량 15% 이상 감소 또는 p95 15% 이상 증가 시 회귀
+REGRESSION_TOLERANCE = 0.15
+BENCH_CATEGORY = {"name": "BENCH", "games": [], "usage": []}
+
+
+# ─── 코퍼스 ────────────────────────────────────────────────────
+def load_archive_corpus(latest_run=True):
+    """원문 보관소 → [(it_id, category, page)]"""
+    archive = HtmlArchive()
+    corpus = []
+    for iid in archive.item_ids(latest_run=latest_run):
+        page, category = archive.item_page(iid)
+        if page is not None:
+            corpus.append((iid, category, page))
+    return corpus
+
+
+def load_fixture_corpus(folder):
+    """{it_id}.html(.gz) 폴더 → [(it_id, category, page)]. corpus.json이 있으면 카테고리·URL 사용."""
+    folder = Path(folder)
+    meta_path = folder / "corpus.json"
+    meta = json.loads(meta_path.read_text(encoding="utf-8")) if meta_path.exists() else {}
+    corpus = []
+    for path in sorted(folder.glob("*.html*")):
+        if path.suffix == ".gz":
+            data = gzip.decompress(path.read_bytes())
+        elif path.suffix == ".html":
+            data = path.read_bytes()
+        else:
+            continue
+        text = data.decode("utf-8", errors="replace")
+        m = re.match(r"(\d+)", path.name) or re.search(r"it_id=(\d+)", text)
+        iid = m.group(1) if m else path.name.split(".")[0]
+        info = meta.get(iid, {})
+        url = info.get("url") or product_url(iid)
+        page = {"url": url, "final_url": info.get("final_url") or url, "status": 200, "text": text}
+        corpus.append((iid, info.get("category") or BENCH_CATEGORY, page))
+    return corpus
+
+
+def freeze_corpus(corpus, folder):
+    """코퍼스를 {it_id}.html.gz + corpus.json 으로 고정 저장."""
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    meta = {}
+    for iid, category, page in corpus:
+        (folder / f"{iid}.html.gz").write_bytes(gzip.compress(page["text"].encode("utf-8")))
+        meta[iid] = {"category": category, "url": page["url"], "final_url": page["final_url"]}
+    (folder / "corpus.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def corpus_digest(corpus):
+    """코퍼스 식별값 (기준값과 같은 페이지 묶음인지 확인)."""
+    h = hashlib.sha256()
+    for iid, _, page in sorted(corpus, key=lambda item: item[0]):
+        h.update(iid.encode("utf-8"))
+        h.update(hashlib.sha256(page["text"].encode("utf-8")).digest())
+    return h.hexdigest()[:16]
+
+
+# ─── 측정 대상 ─────────────────────────────────────────────────
+class Case:
+    """페이지 1건의 측정 입력 (준비는 측정 밖에서 한 번만)."""
+
+    def __init__(self, iid, category, page):
+        self.iid = iid
+        self.category = category
+        self.page = page
+        doc = extract_detail(page["text"])
+        self.text = doc.text
+        self.name = doc.title.split("|")[0].strip()
+        self.cpu = doc.specs_raw.get("CPU", "")
+        self.gpu = doc.specs_raw.get("VGA", "")
+
+
+BENCHMARKS = [
+    ("parse_product_page", lambda c: parse_product_page(c.iid, c.category, c.page)),
+    ("extract_game_fps_map", lambda c: extract_game_fps_map(c.name, c.text)),
+    ("extract_games_from_fps_section", lambda c: extract_games_from_fps_section(c.text)),
+    ("scan_game_fps", lambda c: scan_game_fps(c.name, c.text)),
+    ("PriceScan", lambda c: PriceScan(c.text).by_label_order(PRICE_LABELS)),
+    ("short_cpu/short_gpu", lambda c: (short_cpu(c.cpu), short_gpu(c.gpu))),
+    ("spec_catalog cpu/gpu", lambda c: (SPEC_CATALOG.cpu(c.cpu), SPEC_CATALOG.gpu(c.gpu))),
+    ("classify_tier", lambda c: classify_tier(c.gpu)),
+]
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def measure(func, cases, repeat):
+    """페이지별 최소 시간(repeat회) → 초당 페이지 수 / p50·p95(ms) / 최대 메모리(KB)."""
+    for case in cases:  # 워밍업 (정규식 캐시·지연 import 등)
+        func(case)
+    times = []
+    for case in cases:
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            func(case)
+            best = min(best, time.perf_counter() - t0)
+        times.append(best)
+
+    # 메모리는 별도 1회 패스 (tracemalloc은 실행을 느리게 하므로 시간 측정과 분리)
+    tracemalloc.start()
+    for case in cases:
+        func(case)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    times.sort()
+    total = sum(times)
+    return {
+        "pages_per_sec": round(len(times) / total, 1) if total > 0 else 0.0,
+        "p50_ms": round(percentile(times, 0.50) * 1000, 4),
+        "p95_ms": round(percentile(times, 0.95) * 1000, 4),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def run_suite(corpus, repeat):
+    cases = [Case(iid, category, page) for iid, category, page in corpus]
+    results = {}
+    # 파서의 진행 로그([OK]/[SKIP] 등)는 측정에서 제외
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        for name, func in BENCHMARKS:
+            results[name] = measure(func, cases, repeat)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """기준값 대비 회귀 목록 [(함수, 설명)]"""
+    regressions = []
+    for name, cur in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if cur["pages_per_sec"] < base["pages_per_sec"] * (1 - tolerance):
+            regressions.append(
+                (name, f"처리량 {base['pages_per_sec']} → {cur['pages_per_sec']} 페이지/초")
+            )
+        if cur["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append((name, f"p95 {base['p95_ms']} → {cur['p95_ms']} ms"))
+    return regressions
+
+
+def print_results(results, baseline=None):
+    print(f"  {'함수':<32}{'페이지/초':>12}{'p50(ms)':>10}{'p95(ms)':>10}{'최대(KB)':>10}  기준 대비")
+    for name, r in results.items():
+        delta = ""
+        base = (baseline or {}).get(name)
+        if base and base["pages_per_sec"]:
+            delta = f"{(r['pages_per_sec'] / base['pages_per_sec'] - 1) * 100:+.0f}%"
+        print(
+            f"  {name:<32}{r['pages_per_sec']:>12,.1f}{r['p50_ms']:>10.3f}"
+            f"{r['p95_ms']:>10.3f}{r['peak_kb']:>10,.0f}  {delta}"
+        )
+
+
+# ─── BeautifulSoup 기존 추출기 비교 (--legacy) ─────────────────
+def legacy_extract(page_html):
+    """변경 전 parse_product_page()의 BeautifulSoup 탐색 (비교 기준)."""
+    soup = BeautifulSoup(page_html, "lxml")
+    title = soup.title.get_text(strip=True) if soup.title else ""
+    h2 = soup.find("h2")
+    h2_text = h2.get_text(strip=True) if h2 else None
+    soup.get_text()  # page_text_for_check (기존 코드는 본문을 두 번 만듦)
+    page_text = soup.get_text()
+    soldout_class = bool(soup.find(class_=re.compile(r"sold.?out|it_soldout", re.I)))
+    has_buy_text = bool(soup.find(string=re.compile(r"구매|바로구매|장바구니", re.I)))
+
+    specs_raw = {}
+    for div in soup.find_all("div"):
+        label = div.get_text(strip=True)
+        if label in SPEC_KEYS:
+            key = "쿨러" if "쿨러" in label else ("조립" if "조립" in label else label)
+            if key in specs_raw:
+                continue
+            nxt = div.find_next_sibling()
+            if nxt:
+                raw_val = nxt.get_text(strip=True)
+                clean = re.sub(r"^\[[^\]]*\]", "", raw_val).strip()
+                if clean and (len(clean) >= 15 or raw_val.startswith("[")):
+                    specs_raw[key] = clean
+    if not specs_raw.get("CPU") or not specs_raw.get("VGA"):
+        for table in soup.find_all("table"):
+            for row in table.find_all("tr"):
+                cells = row.find_all(["td", "th"])
+                if len(cells) >= 2:
+                    label = cells[0].get_text(strip=True)
+                    value = cells[1].get_text(strip=True)
+                    for key in TABLE_SPEC_KEYS:
+                        if key == label.strip() and key not in specs_raw:
+                            if len(value) > 10:
+                                half = len(value) // 2
+                                if value[:half] == value[half:]:
+                                    value = value[:half]
+                            specs_raw[key] = value[:60]
+                            break
+            if specs_raw.get("CPU") and specs_raw.get("VGA"):
+                break
+    return {
+        "title": title,
+        "h2": h2_text,
+        "text": page_text,
+        "soldout_class": soldout_class,
+        "has_buy_text": has_buy_text,
+        "specs_raw": specs_raw,
+    }
+
+
+def lxml_extract(page_html):
+    doc = extract_detail(page_html)
+    return {
+        "title": doc.title,
+        "h2": doc.h2,
+        "text": doc.text,
+        "soldout_class": doc.soldout_class,
+        "has_buy_text": doc.has_buy_text,
+        "specs_raw": doc.specs_raw,
+    }
+
+
+def run_legacy(corpus, repeat):
+    """BeautifulSoup 기존 추출 vs lxml 단일 패스: 시간 비교 + 결과 일치 확인. 불일치 시 False."""
+    pages = [(iid, page["text"]) for iid, _, page in corpus]
+    mismatches = []
+    for iid, html in pages:
+        before, after = legacy_extract(html), lxml_extract(html)
+        # </html> 뒤 공백은 libxml2가 트리에 남기지 않음 (bs4만 본문 끝에 붙임) — 비교에서 제외
+        before["text"], after["text"] = before["text"].rstrip(), after["text"].rstrip()
+        diff = [k for k in before if before[k] != after[k]]
+        if diff:
+            mismatches.append((iid, diff))
+
+    cases = [html for _, html in pages]
+    legacy = measure(legacy_extract, cases, repeat)
+    fast = measure(lxml_extract, cases, repeat)
+    print(f"  BeautifulSoup (기존): 페이지당 p50 {legacy['p50_ms']:.2f}ms / {legacy['pages_per_sec']:,.1f} 페이지/초")
+    print(f"  lxml 단일 패스      : 페이지당 p50 {fast['p50_ms']:.2f}ms / {fast['pages_per_sec']:,.1f} 페이지/초")
+    print(f"  속도 향상           : x{fast['pages_per_sec'] / legacy['pages_per_sec']:.1f}")
+    if mismatches:
+        print(f"[WARNING] 결과 불일치 {len(mismatches)}건")
+        for iid, diff in mismatches[:10]:
+            print(f"  - {iid}: {', '.join(diff)}")
+        return False
+    print("  결과 일치: 전체")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상세 페이지 파서 벤치마크")
+    parser.add_argument("--fixtures", help="고정 코퍼스 폴더 (기본: 원문 보관소 마지막 크롤링 대상)")
+    parser.add_argument("--repeat", type=int, default=5, help="페이지당 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--freeze", metavar="DIR", help="현재 코퍼스를 DIR에 고정 저장하고 종료")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="기준값 파일")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument(
+        "--tolerance", type=float, default=REGRESSION_TOLERANCE, help="회귀 판정 허용 비율 (기본 0.15)"
+    )
+    parser.add_argument("--legacy", action="store_true", help="BeautifulSoup 기존 추출기와 비교")
+    args = parser.parse_args()
+
+    corpus = load_fixture_corpus(args.fixtures) if args.fixtures else load_archive_corpus()
+    source = args.fixtures or "원문 보관소"
+    if not corpus:
+        print(f"[ERROR] 코퍼스 없음: {source} (크롤러를 한 번 실행하거나 --fixtures 지정)")
+        sys.exit(1)
+    digest = corpus_digest(corpus)
+    print(f"코퍼스 {len(corpus)}페이지 ({source}, id={digest}), 반복 {args.repeat}회")
+
+    if args.freeze:
+        freeze_corpus(corpus, args.freeze)
+        print(f"[저장 완료] 코퍼스 고정 → {args.freeze}")
+        return
+    if args.legacy:
+        sys.exit(0 if run_legacy(corpus, args.repeat) else 1)
+
+    results = run_suite(corpus, args.repeat)
+
+    baseline_path = Path(args.baseline)
+    baseline = None
+    if baseline_path.exists():
+        saved = json.loads(baseline_path.read_text(encoding="utf-8"))
+        if saved.get("corpus") == digest:
+            baseline = saved["results"]
+        else:
+            print(f"[WARNING] 기준값 코퍼스({saved.get('corpus')})가 달라 비교 생략 — --fixtures로 같은 코퍼스 사용")
+
+    print_results(results, baseline)
+
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(
+            json.dumps(
+                {
+                    "created_at": datetime.now(timezone(timedelta(hours=9))).isoformat(),
+                    "corpus": digest,
+                    "pages": len(corpus),
+                    "repeat": args.repeat,
+                    "results": results,
+                },
+                ensure_ascii=False,
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        print(f"[저장 완료] 기준값 → {baseline_path}")
+        return
+
+    if baseline is None:
+        return
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"[WARNING] 성능 회귀 {len(regressions)}건 (허용 {args.tolerance:.0%})")
+        for name, desc in regressions:
+            print(f"  - {name}: {desc}")
+        sys.exit(1)
+    print(f"  기준값 대비 회귀 없음 (허용 {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
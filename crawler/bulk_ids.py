@@ -0,0 +1,120 @@
+"""
+bulk_ids.py - 상품 ID 일괄 열거 (사이트맵 / 가격비교 EP 피드 / 넓은 목록)
+
+카테고리 45개+ 목록 순회 전에, 쇼핑몰 전체 상품 ID를 적은 요청으로 한 번에 얻는 소스를 차례로 시도한다.
+  - sitemap:   /sitemap.xml (사이트맵 인덱스면 하위 사이트맵까지) 의 item.php?it_id= URL
+  - ep_feed:   영카트 가격비교 EP (shop/price/naver.php) — <<<mapid>>> / item.php?it_id= 행
+  - wide_list: list.php?ca_id=h0 전체 목록 (page_rows 로 페이지 크기 확대 시도, 신규 ID가 없을 때까지 순회)
+min_ids개 이상 ID를 돌려준 첫 소스를 사용하고, 모두 실패하면 None → 호출 측은 기존 카테고리 수집.
+
+직전 실행의 열거 결과와 비교(diff)해 새로 생긴 ID가 없으면 카테고리 구성원이 바뀌지 않은 것으로 보고,
+카테고리·Recommend 목록을 읽지 않고 워터마크(list_watermark.py) ∩ 이번 열거 결과를 그대로 사용하며,
+동적 카테고리는 2차 확장 없이 직전 실행 목록을 재사용한다 (열거는 발견 단계보다 먼저 실행).
+새 ID가 있거나 워터마크가 없는 카테고리만 기존 수집기로 목록을 읽는다.
+
+사용:
+    result = enumerate_ids(get_text, bulk_sources(BASE_URL, SHOP_BASE), parse_list=find_item_ids)
+    diff = diff_ids(previous_state, result)
+"""
+
+import re
+
+MIN_IDS = 20              # 이보다 적게 나오면 열거 실패로 보고 다음 소스 시도
+MAX_SITEMAPS = 50         # 사이트맵 인덱스 하위 파일 상한
+WIDE_PAGE_ROWS = 500      # 넓은 목록 요청 페이지 크기 (무시되면 일반 페이지 크기로 순회)
+WIDE_MAX_PAGES = 300
+
+_LOC = re.compile(r"<loc>\s*([^<\s]+)\s*</loc>", re.I)
+_ITEM_URL_ID = re.compile(r"item\.php\?(?:[^\s\"'<>]*?&(?:amp;)?)?it_id=(\d+)")
+_EP_MAPID = re.compile(r"<<<mapid>>>\s*(\d+)")
+
+
+def bulk_sources(base_url, shop_base, page_rows=WIDE_PAGE_ROWS):
+    """(이름, URL) 시도 순서."""
+    return [
+        ("sitemap", f"{base_url}/sitemap.xml"),
+        ("ep_feed", f"{shop_base}/price/naver.php"),
+        ("wide_list", f"{shop_base}/list.php?ca_id=h0&page_rows={page_rows}"),
+    ]
+
+
+def ids_from_sitemap(get_text, url):
+    """사이트맵(인덱스면 하위 .xml까지)에서 상품 ID (등장 순서 유지)."""
+    ids = {}
+    pending, seen = [url], set()
+    while pending and len(seen) < MAX_SITEMAPS:
+        current = pending.pop(0)
+        if current in seen:
+            continue
+        seen.add(current)
+        text = get_text(current)
+        if "<urlset" not in text and "<sitemapindex" not in text:
+            continue  # 사이트맵이 아닌 응답 (없는 경로를 메인으로 돌려주는 경우)
+        for loc in _LOC.findall(text):
+            loc = loc.replace("&amp;", "&")
+            m = _ITEM_URL_ID.search(loc)
+            if m:
+                ids[m.group(1)] = None
+            elif loc.endswith(".xml") or "sitemap" in loc:
+                pending.append(loc)
+    return ids
+
+
+def ids_from_feed(get_text, url):
+    """가격비교 EP 피드: mapid 필드 또는 상품 URL (EP 형식이 아닌 응답은 빈 결과)."""
+    text = get_text(url)
+    if "<<<" not in text:
+        return {}  # 없는 경로를 일반 HTML 페이지로 돌려주는 경우 — 페이지 내 상품 링크를 전체로 오인하지 않음
+    ids = dict.fromkeys(_EP_MAPID.findall(text))
+    ids.update(dict.fromkeys(_ITEM_URL_ID.findall(text)))
+    return ids
+
+
+def ids_from_wide_list(get_text, url, parse_list):
+    """전체 목록을 연속 2페이지 신규 ID가 없을 때까지 순회. parse_list(html) → {id: None}."""
+    ids = {}
+    no_new_streak = 0
+    for page in range(1, WIDE_MAX_PAGES + 1):
+        before = len(ids)
+        ids.update(parse_list(get_text(url if page == 1 else f"{url}&page={page}")))
+        no_new_streak = no_new_streak + 1 if len(ids) == before else 0
+        if no_new_streak >= 2:
+            break
+    return ids
+
+
+def enumerate_ids(get_text, sources, parse_list, min_ids=MIN_IDS, log=print):
+    """첫 번째로 성공한 소스의 {"source", "ids"} (ids는 등장 순서 리스트). 모두 실패하면 None."""
+    for name, url in sources:
+        try:
+            if name == "sitemap":
+                ids = ids_from_sitemap(get_text, url)
+            elif name == "wide_list":
+                ids = ids_from_wide_list(get_text, url, parse_list)
+            else:
+                ids = ids_from_feed(get_text, url)
+        except Exception as e:
+            log(f"  [일괄 열거] {name} 실패: {e}")
+            continue
+        if len(ids) >= min_ids:
+            log(f"  [일괄 열거] {name}: {len(ids)}개 ({url})")
+            return {"source": name, "ids": list(ids)}
+        log(f"  [일괄 열거] {name}: {len(ids)}개 — 다음 소스 시도")
+    return None
+
+
+def diff_ids(previous, result):
+    """
+    직전 열거 상태({"bulk_source", "bulk_ids"})와 비교.
+    → {"added", "removed", "determined"}: determined는 같은 소스 기준으로 새 ID가 없을 때만 True
+    (새 ID가 어느 카테고리에 속하는지는 열거 결과로 알 수 없음).
+    """
+    prev_ids = set(previous.get("bulk_ids") or ())
+    ids = set(result["ids"])
+    comparable = bool(prev_ids) and previous.get("bulk_source") == result["source"]
+    added = ids - prev_ids if comparable else ids
+    return {
+        "added": added,
+        "removed": prev_ids - ids if comparable else set(),
+        "determined": comparable and not added,
+    }
@@ -6,13 +6,15 @@ config.py - 크롤러 설정 파일
 import os
 
 # ─── 기본 설정 ───────────────────────────────────────────────
-BASE_URL = "https://www.youngjaecomputer.com"
+# YJMOD_BASE_URL: 로컬 대역 서버(stand_in_shop.py) 등 다른 호스트를 대상으로 크롤링할 때
+BASE_URL = os.environ.get("YJMOD_BASE_URL", "https://www.youngjaecomputer.com").rstrip("/")
 SHOP_URL = f"{BASE_URL}/shop"
 CAFE_URL = "https://cafe.naver.com/no1yjmod"
 CAFE_CLUB_ID = "31248285"
 
 # 출력 파일 경로 (크롤러를 실행하는 위치 기준)
-DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+# YJMOD_DATA_DIR: 대역 서버 측정 실행이 배포 대상 data/를 덮어쓰지 않도록 출력 위치 변경
+DATA_DIR = os.environ.get("YJMOD_DATA_DIR", os.path.join(os.path.dirname(__file__), "..", "data"))
 OUTPUT_PRODUCTS = os.path.join(DATA_DIR, "pc_data.json")
 OUTPUT_CAFE = os.path.join(DATA_DIR, "cafe_posts.json")
 
@@ -128,9 +130,19 @@ GAME_KEYWORD_MAP = {
     "아이온2": ["아이온2", "아이온 2"],
 }
 
+# 게임 키워드가 없을 때 게이밍 PC로 보고 기본 게임 목록을 붙이는 단서
+GAMING_HINT_KEYWORDS = ["게임", "GAMING", "GAME", "RTX", "RX 7", "RX 9"]
+
+# ─── 상품명 -> 용도 키워드 매핑 ──────────────────────────────
+USAGE_KEYWORD_MAP = {
+    "영상편집": ["영상편집", "편집"],
+    "AI/딥러닝": ["AI", "딥러닝", "머신러닝"],
+    "사무/디자인": ["사무", "디자인", "오피스"],
+}
+
 
 # ─── GPU 모델명 -> 사양 티어 분류 ────────────────────────────
-# GPU 모델을 파싱해 tier를 자동 설정
+# GPU 모델을 파싱해 tier를 자동 설정 (가장 긴 모델명 우선: "RTX 4070 Ti"는 "RTX 4070"보다 먼저 매칭)
 GPU_TIER_MAP = {
     "가성비(FHD)": [
         "RTX 4060", "RTX 4060 Ti", "RTX 5060",
@@ -165,6 +177,5 @@ CASE_BLACK_KEYWORDS = ["블랙", "BLACK", "Black", "BLK", "BK"]
 # ─── 크롤링 제외 조건 ─────────────────────────────────────────
 EXCLUDE_KEYWORDS = ["중고", "리퍼", "렌탈", "전시"]
 
-# ─── 최대 상품 수 제한 ────────────────────────────────────────
-MAX_PRODUCTS_PER_CATEGORY = 200
+# ─── 최대 수집 수 제한 ────────────────────────────────────────
 MAX_CAFE_POSTS = 20
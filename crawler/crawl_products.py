@@ -2,9 +2,11 @@
 crawl_products.py - 영재컴퓨터 조립PC 제품 크롤러 (v2)
 
 전략:
-  1. Selenium + 네트워크 로그로 카테고리 페이지 로딩 시 요청되는
-     admin.youngjaecomputer.com/data/item/{it_id}_m URL에서 제품 ID 추출
-  2. requests + BeautifulSoup으로 각 제품 상세 페이지 파싱
+  1. requests로 list.php?page=N + 목록 AJAX(recommendPC.php 등) 응답을 받아
+     item.php 링크 / go_item() / data/item/{it_id}_ 이미지 URL에서 제품 ID 추출
+     (0건인 카테고리만 Selenium + 네트워크 로그 폴백)
+  2. 각 제품 상세 페이지를 lxml 단일 패스(XPath)로 파싱 — detail_extract.py
+     (목록 페이지마다 발견 ID를 바로 상세 워커로 넘겨 발견·상세 수집을 겹쳐 실행 — pipeline.py)
   3. 스펙 테이블에서 CPU/GPU/RAM/SSD/케이스/파워/쿨러 추출
   4. 0건 수집 시 기존 데이터 보존
 
@@ -14,14 +16,19 @@ crawl_products.py - 영재컴퓨터 조립PC 제품 크롤러 (v2)
 """
 
 import argparse
+import hashlib
 import json
+import multiprocessing
+import os
 import re
 import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
+from urllib.parse import urljoin, urlsplit
 
 import requests
 from bs4 import BeautifulSoup
@@ -36,20 +43,65 @@ except ImportError:
     SELENIUM_AVAILABLE = False
     print("[WARNING] Selenium 없음. requests 대체 모드로 실행.")
 
+from async_fetch import AIOHTTP_AVAILABLE, AsyncPageFetcher, DEFAULT_PER_HOST
+from bulk_ids import bulk_sources, diff_ids, enumerate_ids
+from detail_extract import HeadWatcher, extract_detail
+from driver_pool import DriverPool, wait_for_network_quiet
+from fetch_memo import FetchMemo
+from game_fps import build_game_fps_highlight, extract_games_from_fps_section, scan_game_fps
+from pipeline import DetailPipeline
+from spec_catalog import SPEC_CATALOG
+from rate_limit import HostRateLimiter
+from html_archive import HtmlArchive, entry_page, read_blob
+from http_cache import ResponseCache
+from keyword_index import KeywordAutomaton
+from list_watermark import ListWatermarks
+from liveness import PROBE_WORKERS, probe_item, probe_many
 from config import (
-    BASE_URL, OUTPUT_PRODUCTS,
-    GPU_TIER_MAP, PRICE_RANGES, GAME_KEYWORD_MAP,
+    BASE_URL, DATA_DIR, OUTPUT_PRODUCTS,
+    PRICE_RANGES, GAME_KEYWORD_MAP,
     CASE_WHITE_KEYWORDS, CASE_BLACK_KEYWORDS, EXCLUDE_KEYWORDS,
-    MAX_PRODUCTS_PER_CATEGORY,
+    GAMING_HINT_KEYWORDS, USAGE_KEYWORD_MAP,
 )
 
 # 상세 페이지 파싱 병렬 워커 수 (Session은 워커 스레드당 1개, thread-local)
 MAX_WORKERS = 4
-BATCH_SIZE = 50
+# 발견 → 상세 대기열 크기 (가득 차면 수집기가 잠시 대기)
+DETAIL_QUEUE_SIZE = 200
+
+# 상세 HTML 파싱 프로세스 수 (HTML 파싱은 CPU 작업 → GIL 회피, 0이면 다운로드 스레드에서 파싱)
+PARSE_PROCESSES = max(1, min(8, (os.cpu_count() or 2) - 1))
+
+# --stream: 상세 페이지 스트리밍 청크 크기 (스펙 블록·가격이 잡히면 나머지는 받지 않음)
+STREAM_CHUNK = 16 * 1024
+
+# --engine async: 호스트당 동시 다운로드 수 (aiohttp, 16~32 권장)
+ASYNC_PER_HOST = DEFAULT_PER_HOST
+
+# Selenium 폴백: 드라이버 풀 크기 / 드라이버당 재생성 주기(페이지) / 페이지 대기 조건
+SELENIUM_POOL_SIZE = 3
+SELENIUM_RECYCLE_PAGES = 40
+LIST_QUIET_WINDOW = 0.6   # 상품 이미지 요청이 이 시간(초) 동안 없으면 로딩 완료
+LIST_PAGE_TIMEOUT = 10.0  # 페이지당 최대 대기(초)
+
+# 목록·발견 단계 공유 속도 제한: 호스트당 초당 1건, 버스트 1
+# (기존 Installment/Recommend 수집기는 요청 1건 후 1초 대기 — 수집기를 동시에 돌려도 호스트 부하는 그 이하)
+HOST_RATE_PER_SEC = 1.0
+HOST_RATE_BURST = 1
 
 _detail_progress_lock = threading.Lock()
+_list_meta_lock = threading.Lock()
 _thread_local = threading.local()
 
+# 상세 페이지 공유 디스크 캐시 (main()에서 설정, --no-cache 시 None)
+_response_cache = None
+# 원문 HTML 보관소 (main()에서 설정, --no-archive 시 None) — reparse 명령의 입력
+_archive = None
+# 상세 HTML 파서 프로세스 풀 (main()에서 설정, --parse-workers 0 이면 None)
+_parse_pool = None
+# 목록·발견 단계 실행 범위 URL 메모 (main()에서 설정 — 수집기 간 중복 요청 합치기)
+_fetch_memo = None
+
 # ─── 카테고리 정의 ───────────────────────────────────────────────
 # list.php?ca_id=h0&ca_id_vi=XXX&ca_id_index=YYY (사이트 메뉴 기준, 2026-03 라이브 URL 대조)
 # 동일 (vi,idx)는 main() 병합 시 한 번만 크롤됨. AI 중급자용(403/4)과 워크스테이션 메뉴는 동일 URL.
@@ -130,8 +182,28 @@ RECOMMEND_PAGES = [
 
 SHOP_BASE = f"{BASE_URL}/shop"
 
-# 품절·가격보류 추적 (프로젝트 루트 data/)
-SOLDOUT_LOG_PATH = Path(__file__).resolve().parent.parent / "data" / "soldout_log.json"
+# 메인/Installment 노출 상품은 고정 태그 없이 상세 본문 기준으로만 분류
+MAIN_PAGE_CATEGORY = {"name": "MAIN_PAGE", "games": [], "usage": []}
+INSTALLMENT_CATEGORY = {"name": "INSTALLMENT", "games": [], "usage": []}
+
+# 품절·가격보류 추적 (프로젝트 루트 data/, YJMOD_DATA_DIR로 변경 가능)
+SOLDOUT_LOG_PATH = Path(DATA_DIR) / "soldout_log.json"
+# probe 명령 결과: 품절 로그 중 다시 판매 중인 상품(재입고 후보) / 직전 실행 상품 중 사라진 상품
+REVIVE_CANDIDATES_PATH = Path(DATA_DIR) / "revive_candidates.json"
+# probe 명령 요청 속도 (호스트당 초당 건수)
+PROBE_RATE_PER_SEC = 5.0
+
+# --incremental: 목록 지문(fingerprint) 상태 (배포 대상 data/가 아닌 .cache/, Actions 캐시로 유지)
+CRAWL_STATE_PATH = Path(
+    os.environ.get(
+        "YJMOD_CRAWL_STATE_PATH",
+        Path(__file__).resolve().parent.parent / ".cache" / "crawl_state.json",
+    )
+)
+# 증분 실행 N회마다 1회는 전체 재수집 (6시간 주기 × 8 = 2일)
+INCREMENTAL_FULL_REFRESH_EVERY = 8
+# 목록 워터마크: N회 실행마다 1회는 카테고리 끝 페이지까지 전체 순회 (list_watermark.py)
+LIST_FULL_SWEEP_EVERY = 8
 
 HEADERS = {
     "User-Agent": (
@@ -197,56 +269,32 @@ def _thread_local_session():
     return s
 
 
-def _fetch_product_detail_worker(item_id, category):
-    """스레드에서 상세 파싱. 예외 시 해당 상품만 스킵."""
+def _fetch_product_detail_worker(item_id, category, fetcher=None, previous=None, pending=None):
+    """
+    파이프라인 워커에서 상세 다운로드·파싱. 예외 시 해당 상품만 스킵.
+    previous(직전 실행 상품)가 있으면 앞부분만 스트리밍으로 받고 FPS·게임 정보는 그 상품에서 가져옴.
+    pending: 대기열에 넣을 때 비동기 엔진에 미리 예약한 다운로드 Future (있으면 그 결과만 기다림).
+    """
     try:
-        sess = _thread_local_session()
-        return item_id, parse_product_detail(item_id, category, sess)
+        if pending is not None:
+            page = pending.result()
+        elif previous is not None:
+            page = fetch_product_head(item_id, _thread_local_session())
+        elif fetcher is not None:
+            page = fetcher.submit(product_url(item_id)).result()
+        else:
+            page = fetch_product_page(item_id, _thread_local_session())
+        if page is None:
+            return None
+        if page.get("partial"):
+            # 잘린 본문은 보관하지 않음 (reparse는 보관소의 직전 전체 본문 사용)
+            return _parse_page(item_id, category, page, previous)
+        if _archive is not None:
+            _archive.put_item(item_id, category, page)
+        return _parse_page(item_id, category, page)
     except Exception as e:
         safe_print(f"    [ERROR] 상세 조회 예외 it_id={item_id}: {e}")
-        return item_id, None
-
-
-def run_parallel_detail_fetch(pairs, all_products, label=""):
-    """
-    (item_id, category) 목록을 BATCH_SIZE 단위로 나눠 ThreadPoolExecutor로 처리.
-    이미 all_products에 있는 id는 건너뜀.
-    """
-    to_run = [(iid, cat) for iid, cat in pairs if iid not in all_products]
-    if not to_run:
-        return
-
-    tag = f" [{label}]" if label else ""
-    safe_print(
-        f"[INFO] 상세 병렬 처리{tag}: {len(to_run)}건 "
-        f"(workers={MAX_WORKERS}, batch={BATCH_SIZE})"
-    )
-    total = len(to_run)
-    done = [0]
-
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        for start in range(0, len(to_run), BATCH_SIZE):
-            batch = to_run[start : start + BATCH_SIZE]
-            future_to_id = {
-                executor.submit(_fetch_product_detail_worker, iid, cat): iid
-                for iid, cat in batch
-            }
-            for future in as_completed(future_to_id):
-                iid = future_to_id[future]
-                rid, product = iid, None
-                try:
-                    rid, product = future.result()
-                except Exception as e:
-                    safe_print(f"    [ERROR] future 실패 it_id={iid}: {e}")
-
-                if product:
-                    all_products[rid] = product
-
-                with _detail_progress_lock:
-                    done[0] += 1
-                    d = done[0]
-                    if d % 25 == 0 or d >= total:
-                        safe_print(f"[진행]{tag} {d}/{total}")
+        return None
 
 
 def parse_list_targets_from_html(html):
@@ -268,8 +316,272 @@ def parse_list_targets_from_html(html):
     return targets
 
 
-def discover_dynamic_categories(session):
-    """메뉴/카테고리 페이지에서 동적 카테고리를 폭넓게 자동 추출"""
+# ─── 목록 페이지 메타 (상품명/가격/썸네일) ───────────────────────
+_LIST_ITEM_REF = re.compile(
+    r"item\.php\?it_id=(\d+)|go_item\(['\"](\d+)['\"]\)|/data/item/(\d+)_"
+)
+_LIST_WON_AMOUNT = re.compile(r"([\d,]{5,})\s*원")
+
+
+def _list_ref_id(tag):
+    """a[href] / [onclick] / img[src] 속성에서 상품 ID 추출."""
+    for attr in ("href", "onclick", "src"):
+        value = tag.get(attr)
+        if value:
+            m = _LIST_ITEM_REF.search(value)
+            if m:
+                return next(g for g in m.groups() if g)
+    return None
+
+
+def extract_list_item_meta(html):
+    """
+    목록/Installment/Recommend HTML에서 상품 카드별 {id: {name, price, prices, thumb}} 추출.
+    카드 = 해당 상품 ID만 참조하는 가장 바깥 조상 요소.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    refs = []
+    owners = {}  # id(tag) → 하위에서 참조하는 상품 ID 집합
+    for tag in soup.find_all(["a", "img", "div", "li", "button", "span"]):
+        iid = _list_ref_id(tag)
+        if not iid:
+            continue
+        refs.append((tag, iid))
+        for parent in tag.parents:
+            owners.setdefault(id(parent), set()).add(iid)
+
+    cards = {}
+    for tag, iid in refs:
+        card = tag
+        for parent in tag.parents:
+            if parent.name in ("body", "html", "[document]") or owners[id(parent)] != {iid}:
+                break
+            card = parent
+        cards.setdefault(iid, card)
+
+    meta = {}
+    for iid, card in cards.items():
+        text = card.get_text(" ", strip=True)
+        prices = sorted(
+            {
+                int(a.replace(",", ""))
+                for a in _LIST_WON_AMOUNT.findall(text)
+                if a.replace(",", "").isdigit()
+            }
+        )
+        name = ""
+        for a in card.find_all("a"):
+            t = a.get_text(" ", strip=True)
+            if len(t) >= 3 and not _LIST_WON_AMOUNT.fullmatch(t) and len(t) > len(name):
+                name = t
+        thumb = ""
+        for img in card.find_all("img"):
+            src = img.get("src") or ""
+            if f"/data/item/{iid}_" in src:
+                thumb = src
+                if not name:
+                    name = (img.get("alt") or "").strip()
+                break
+        meta[iid] = {
+            "name": name,
+            "price": prices[-1] if prices else 0,
+            "prices": prices,
+            "thumb": thumb,
+        }
+    return meta
+
+
+def merge_list_meta(target, found):
+    """같은 ID가 여러 목록에 있으면 정보가 더 많은 쪽을 유지 (드라이버 풀 스레드에서도 호출)."""
+    if target is None:
+        return
+    with _list_meta_lock:
+        for iid, info in found.items():
+            cur = target.get(iid)
+            richness = bool(info["name"]) + bool(info["prices"]) + bool(info["thumb"])
+            if cur is None or richness > bool(cur["name"]) + bool(cur["prices"]) + bool(cur["thumb"]):
+                target[iid] = info
+
+
+def merged_category(categories):
+    """같은 상품을 노출한 카테고리들 → games/usage 합집합 카테고리.
+    발견 순서(수집기 동시 실행으로 매번 다름)와 무관하도록 이름순으로 합치고 이름은 첫 카테고리."""
+    categories = sorted(categories, key=lambda cat: cat.get("name", ""))
+    games, usage = set(), set()
+    for cat in categories:
+        games.update(cat.get("games", []))
+        usage.update(cat.get("usage", []))
+    return {"name": categories[0].get("name", ""), "games": sorted(games), "usage": sorted(usage)}
+
+
+def apply_category_tags(product, category):
+    """
+    합친 카테고리로 games/usage/뱃지를 다시 계산 (상세는 한 번만 받음).
+    파싱 때 남긴 카테고리 무관 입력(_tag_inputs)에서 계산하므로 어느 카테고리가 먼저 emit했는지,
+    직전 실행에서 어느 카테고리에 있었는지와 무관. 입력이 없는 상품(저장된 입력 없는 증분 재사용)은 그대로 두고 False.
+    """
+    inputs = product.get("_tag_inputs")
+    if inputs is None:
+        return False
+    tags = product["categories"]
+    tags["games"], tags["usage"] = category_tags(inputs, category)
+    product["badge"], product["badge_color"] = product_badge(
+        product["installment_months"], tags["usage"], tags["tier"], product["price"], product["case_color"]
+    )
+    return True
+
+
+def list_prefilter_reason(info, category):
+    """
+    상세 요청 전 목록 카드 메타(이름·가격)만으로 parse_product_page가 버릴 것이 확실한 상품 판별.
+    제외 사유 문자열 또는 None(판단 불가 → 상세 수집).
+      - 이름에 EXCLUDE_KEYWORDS(중고/리퍼/렌탈/전시 등)
+      - 카드 최고 금액이 MIN_PC_PRICE 미만: 모니터·주변기기(PC 키워드 없음) 또는 가격 미달
+        단, 할부(월 납부금액 표시) 상품과 GPU 기준가가 있는 상품(상세에서 가격 보류로 남김)은 제외 안 함
+    """
+    name = (info or {}).get("name") or ""
+    if not name:
+        return None
+    if is_excluded_name(name):
+        return "제외 키워드"
+    price = info.get("price") or 0
+    if not 0 < price < MIN_PC_PRICE:
+        return None
+    if category is INSTALLMENT_CATEGORY or "개월" in name or "할부" in name:
+        return None
+    if gpu_minimum_credible_price(name, "", ""):
+        return None
+    name_upper = name.upper()
+    if not any(kw_upper in name_upper for _, kw_upper in _PC_INDICATOR_PAIRS):
+        return "PC 아님"
+    return "가격 미달"
+
+
+def list_fingerprint(info):
+    """목록 메타 → 변경 감지용 지문. 이름·가격 모두 없으면 None(항상 상세 재수집)."""
+    if not info or not (info.get("name") or info.get("prices")):
+        return None
+    raw = "|".join(
+        [info.get("name", ""), ",".join(map(str, info.get("prices", []))), info.get("thumb", "")]
+    )
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+# ─── 증분 크롤 (--incremental) ─────────────────────────────────
+def load_crawl_state():
+    try:
+        with open(CRAWL_STATE_PATH, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {"runs_since_full": 0, "fingerprints": {}}
+    if not isinstance(state.get("fingerprints"), dict):
+        state["fingerprints"] = {}
+    return state
+
+
+def save_crawl_state(state):
+    CRAWL_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(CRAWL_STATE_PATH, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False)
+
+
+def load_previous_products():
+    """직전 pc_data.json → {id: product}."""
+    try:
+        with open(OUTPUT_PRODUCTS, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {str(p["id"]): p for p in payload.get("products", []) if p.get("id")}
+
+
+def reusable_product(item_id, incremental):
+    """증분 모드: 목록 지문이 직전 실행과 같으면 이전 상품 dict, 아니면 None(상세 재수집).
+    목록을 읽지 않고 워터마크로 이어받은 상품(carried)은 지문이 없으므로 여기서는 None —
+    워커에서 carried_reuse()로 생존 확인 후 재사용."""
+    if not incremental:
+        return None
+    prev = incremental["previous"].get(item_id)
+    if prev is None:
+        return None
+    meta = incremental["list_meta"].get(item_id)
+    if meta is None and item_id in incremental["carried"]:
+        return None
+    fp = list_fingerprint(meta)
+    if fp and fp == incremental["fingerprints"].get(item_id):
+        return prev
+    return None
+
+
+def needs_liveness_probe(item_id, incremental):
+    """워터마크로 이어받아 이번 실행에 목록 카드(가격·품절 신호)가 없는 직전 실행 상품인지."""
+    return (
+        bool(incremental)
+        and item_id in incremental["carried"]
+        and item_id not in incremental["list_meta"]
+        and item_id in incremental["previous"]
+    )
+
+
+def carried_reuse(item_id, incremental, session):
+    """
+    이어받은 상품: 생존 확인(liveness.py — 리다이렉트 비활성 + 앞부분만)이 alive일 때만 이전 dict 재사용.
+    품절 리다이렉트·품절 표시·오류면 None → 일반 상세 수집 (전체 순회 주기까지 품절 상품이 남지 않도록).
+    """
+    if not needs_liveness_probe(item_id, incremental):
+        return None
+    status = probe_item(session, product_url(item_id), item_id)["status"]
+    with _detail_progress_lock:
+        incremental["probed"][status] = incremental["probed"].get(status, 0) + 1
+    return incremental["previous"][item_id] if status == "alive" else None
+
+
+def _archive_list(key, html):
+    """목록 응답을 원문 보관소에 저장 (보관소 미사용 시 무시)."""
+    if _archive is not None:
+        _archive.put_list(key, html)
+
+
+def _throttle(limiter, url):
+    """공유 속도 제한기가 있으면 해당 호스트 토큰을 받을 때까지 대기."""
+    if limiter is not None:
+        limiter.acquire(url)
+
+
+def _memo_fetch(key, load):
+    """실행 범위 URL 메모가 있으면 경유 (같은 요청은 한 번만 — fetch_memo.py)."""
+    if _fetch_memo is None:
+        return load()
+    return _fetch_memo.fetch(key, load)
+
+
+def _get_text(session, url, limiter=None):
+    """목록·발견 단계 GET → 본문 문자열 (속도 제한은 실제 요청할 때만)."""
+    def load():
+        _throttle(limiter, url)
+        resp = session.get(url, timeout=15)
+        resp.encoding = "utf-8"
+        return resp.text
+
+    return _memo_fetch(("GET", url), load)
+
+
+def _post_text(session, url, data, limiter=None):
+    """목록·발견 단계 POST → 본문 문자열 (같은 URL·본문이면 메모 공유)."""
+    def load():
+        _throttle(limiter, url)
+        resp = session.post(url, data=data, timeout=15)
+        resp.encoding = "utf-8"
+        return resp.text
+
+    return _memo_fetch(("POST", url, tuple(sorted(data.items()))), load)
+
+
+def discover_dynamic_categories(session, limiter=None, known=None):
+    """
+    메뉴/카테고리 페이지에서 동적 카테고리를 폭넓게 자동 추출.
+    known(직전 실행의 동적 카테고리)이 있으면 2차 확장 대신 known을 합침 (일괄 열거로 변화 없음이 확인된 실행).
+    """
     seeds = [
         f"{BASE_URL}/",
         f"{SHOP_BASE}/",
@@ -282,13 +594,16 @@ def discover_dynamic_categories(session):
 
     for seed in seeds:
         try:
-            resp = session.get(seed, timeout=15)
-            resp.encoding = "utf-8"
-            html = resp.text
+            html = _get_text(session, seed, limiter)
         except Exception:
             continue
         all_targets.update(parse_list_targets_from_html(html))
 
+    if known is not None:
+        for cat in known:
+            all_targets.setdefault(category_key(cat), cat)
+        return list(all_targets.values())
+
     # 2차 확장: 1차에서 찾은 카테고리 페이지를 다시 읽어 링크 확장
     first_pass = list(all_targets.values())
     for cat in first_pass:
@@ -297,17 +612,15 @@ def discover_dynamic_categories(session):
         else:
             url = f"{SHOP_BASE}/list.php?ca_id=h0&ca_id_vi={cat['vi']}&ca_id_index={cat['idx']}"
         try:
-            resp = session.get(url, timeout=15)
-            resp.encoding = "utf-8"
-            all_targets.update(parse_list_targets_from_html(resp.text))
+            all_targets.update(parse_list_targets_from_html(_get_text(session, url, limiter)))
         except Exception:
             continue
 
     return list(all_targets.values())
 
 
-def collect_main_page_item_ids(session):
-    """메인/샵 메인에 노출된 상품 ID 수집"""
+def collect_main_page_item_ids(session, list_meta=None, limiter=None, emit=None):
+    """메인/샵 메인에 노출된 상품 ID 수집 (list_meta가 있으면 카드 메타도 기록)"""
     item_ids = set()
     pages = [
         f"{BASE_URL}/",
@@ -316,42 +629,51 @@ def collect_main_page_item_ids(session):
     ]
     for url in pages:
         try:
-            resp = session.get(url, timeout=15)
-            resp.encoding = "utf-8"
-            html = resp.text
+            html = _get_text(session, url, limiter)
         except Exception:
             continue
-        item_ids.update(re.findall(r"item\.php\?it_id=(\d+)", html))
-        item_ids.update(re.findall(r"/data/item/(\d+)_", html))
-        item_ids.update(re.findall(r"go_item\(['\"](\d+)['\"]\)", html))
+        _archive_list(f"GET {url}", html)
+        ids = find_item_ids(html)
+        item_ids.update(ids)
+        if list_meta is not None:
+            merge_list_meta(list_meta, extract_list_item_meta(html))
+        if emit is not None:
+            emit(ids, MAIN_PAGE_CATEGORY)
     return list(item_ids)
 
 
-def collect_installment_item_ids(session):
-    """Installment 페이지(GET)에서 상품 ID 수집 (할부 상품)"""
+def collect_installment_item_ids(session, list_meta=None, limiter=None, emit=None):
+    """Installment 페이지(GET)에서 상품 ID 수집 (할부 상품). limiter 없으면 요청마다 1초 대기"""
     item_ids = set()
     safe_print(f"\n[Installment] {len(INSTALLMENT_CODES)}개 페이지 수집 시작")
     for code in INSTALLMENT_CODES:
         url = f"{SHOP_BASE}/Installment.php?ImCode={code}"
         try:
-            resp = session.get(url, timeout=15)
-            resp.encoding = "utf-8"
-            html = resp.text
-            ids = set(re.findall(r"go_item\(['\"](\d+)['\"]\)", html))
-            ids.update(re.findall(r"item\.php\?it_id=(\d+)", html))
-            ids.update(re.findall(r"/data/item/(\d+)_", html))
+            html = _get_text(session, url, limiter)
+            _archive_list(f"GET {url}", html)
+            ids = find_item_ids(html)
             item_ids.update(ids)
+            if list_meta is not None:
+                merge_list_meta(list_meta, extract_list_item_meta(html))
+            if emit is not None:
+                emit(ids, INSTALLMENT_CATEGORY)
             if ids:
                 safe_print(f"  {code}: {len(ids)}개")
         except Exception as e:
             safe_print(f"  [ERROR] {code}: {e}")
-        time.sleep(1.0)
+        if limiter is None:
+            time.sleep(1.0)
     safe_print(f"[Installment] 총 {len(item_ids)}개 고유 ID 수집")
     return item_ids
 
 
-def collect_recommend_item_ids(session):
-    """Recommend 페이지(POST, stock=0)에서 상품 ID + 카테고리 수집"""
+def collect_recommend_item_ids(session, list_meta=None, limiter=None, emit=None, marks=None,
+                               alive=None):
+    """
+    Recommend 페이지(POST, stock=0)에서 상품 ID + 카테고리 수집. limiter 없으면 요청마다 1초 대기.
+    marks가 있으면 페이지별 ID를 워터마크로 저장하고, alive(일괄 열거로 변화 없음이 확인된 ID)가
+    있으면 워터마크가 있는 페이지는 POST 없이 워터마크 ∩ alive를 사용.
+    """
     results = {}
     safe_print(f"\n[Recommend] {len(RECOMMEND_PAGES)}개 페이지 수집 시작")
     for page in RECOMMEND_PAGES:
@@ -359,33 +681,135 @@ def collect_recommend_item_ids(session):
             f"{SHOP_BASE}/recommendPC.php"
             f"?ca_id=h0&ca_id_vi={page['vi']}&ca_id_index={page['idx']}"
         )
+        key = recommend_key(page)
+        category = {
+            "name": page["name"],
+            "games": page.get("games", []),
+            "usage": page.get("usage", []),
+        }
         try:
-            resp = session.post(
-                url,
-                data={"ca_id": "h0", "stock": "0", "s_order": "best"},
-                timeout=15,
-            )
-            resp.encoding = "utf-8"
-            html = resp.text
-            ids = set(re.findall(r"go_item\(['\"](\d+)['\"]\)", html))
-            ids.update(re.findall(r"item\.php\?it_id=(\d+)", html))
-            ids.update(re.findall(r"/data/item/(\d+)_", html))
+            ids = _assumed_ids(marks, key, alive)
+            if ids is None:
+                html = _post_text(
+                    session, url, {"ca_id": "h0", "stock": "0", "s_order": "best"}, limiter
+                )
+                _archive_list(f"POST {url}", html)
+                ids = list(find_item_ids(html))
+                if list_meta is not None:
+                    merge_list_meta(list_meta, extract_list_item_meta(html))
+                safe_print(f"  {page['name']}: {len(ids)}개")
+            else:
+                safe_print(f"  {page['name']}: {len(ids)}개 (일괄 열거 — 목록 생략)")
             for item_id in ids:
                 if item_id not in results:
-                    results[item_id] = {
-                        "name": page["name"],
-                        "games": page.get("games", []),
-                        "usage": page.get("usage", []),
-                    }
-            safe_print(f"  {page['name']}: {len(ids)}개")
+                    results[item_id] = category
+            if marks is not None:
+                marks.update(key, ids)
+            if emit is not None:
+                emit(ids, category)
         except Exception as e:
             safe_print(f"  [ERROR] {page['name']}: {e}")
-        time.sleep(1.0)
+        if limiter is None:
+            time.sleep(1.0)
     safe_print(f"[Recommend] 총 {len(results)}개 고유 ID 수집")
     return results
 
 
+def run_discovery(list_meta, limiter, emit=None, marks=None, bulk=None, known_dynamic=None):
+    """
+    동적 카테고리 / 메인 / Installment / Recommend 수집기를 동시에 실행.
+    요청 간격은 수집기별 sleep 대신 공유 limiter(호스트별 토큰 버킷)가 보장.
+    emit이 있으면 수집기가 페이지마다 찾은 ID를 바로 상세 파이프라인으로 보냄.
+    bulk(일괄 열거 결과)가 변화 없음(determined)이면 known_dynamic으로 동적 카테고리 2차 확장을,
+    워터마크로 Recommend POST를 생략한다. 메인·Installment 카드는 목록 사전 필터
+    (가격 미달 판단·할부 예외)에 필요하므로 계속 읽는다 (메인 페이지는 동적 1차 탐색과 메모 공유).
+    """
+    alive = bulk["alive"] if bulk is not None and bulk["determined"] else None
+    collectors = {
+        "dynamic": lambda sess: discover_dynamic_categories(sess, limiter, known_dynamic),
+        "main": lambda sess: collect_main_page_item_ids(sess, list_meta, limiter, emit),
+        "installment": lambda sess: collect_installment_item_ids(sess, list_meta, limiter, emit),
+        "recommend": lambda sess: collect_recommend_item_ids(
+            sess, list_meta, limiter, emit, marks=marks, alive=alive
+        ),
+    }
+    elapsed = {}
+
+    def run(name):
+        started = time.monotonic()
+        try:
+            return collectors[name](_thread_local_session())
+        finally:
+            elapsed[name] = time.monotonic() - started
+
+    started = time.monotonic()
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(collectors), thread_name_prefix="discover") as ex:
+        futures = {ex.submit(run, name): name for name in collectors}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                safe_print(f"  [ERROR] 발견 단계 {name} 실패: {e}")
+                results[name] = {} if name == "recommend" else []
+    wall = time.monotonic() - started
+
+    # 이전(직렬) 추정: 수집기 소요 합 + 제거된 고정 대기(Installment/Recommend 요청당 1초)
+    removed_sleep = float(len(INSTALLMENT_CODES) + len(RECOMMEND_PAGES))
+    serial_estimate = sum(elapsed.values()) + removed_sleep
+    detail = ", ".join(f"{k} {v:.1f}s" for k, v in elapsed.items())
+    safe_print(
+        f"[INFO] 발견 단계 {wall:.1f}초 (동시 실행) ← 직렬 추정 {serial_estimate:.1f}초 "
+        f"[{detail}, 고정 대기 {removed_sleep:.0f}s 제거, 속도제한 대기 {limiter.waited:.1f}s]"
+    )
+    return results
+
+
+def run_bulk_enumeration(session, list_meta, limiter, previous_state):
+    """
+    --discovery bulk: 사이트맵 / EP 피드 / 넓은 목록으로 전체 상품 ID를 열거하고 직전 실행과 비교 (bulk_ids.py).
+    → {"source", "ids", "alive", "added", "removed", "determined"}, 모든 소스 실패 시 None.
+    """
+    def parse_list(html):
+        if list_meta is not None:
+            merge_list_meta(list_meta, extract_list_item_meta(html))
+        return find_item_ids(html)
+
+    result = enumerate_ids(
+        lambda url: _get_text(session, url, limiter),
+        bulk_sources(BASE_URL, SHOP_BASE),
+        parse_list,
+        log=safe_print,
+    )
+    if result is None:
+        safe_print("[INFO] 일괄 열거 실패 → 카테고리별 목록 수집")
+        return None
+    result.update(diff_ids(previous_state, result))
+    result["alive"] = set(result["ids"])
+    if result["determined"]:
+        verdict = "새 상품 없음 → 워터마크 있는 카테고리는 목록 생략"
+    else:
+        verdict = "새 상품 있음/비교 기준 없음 → 카테고리별 목록 수집"
+    safe_print(
+        f"[INFO] 일괄 열거({result['source']}): {len(result['ids'])}개, 직전 대비 "
+        f"+{len(result['added'])} / -{len(result['removed'])} — {verdict}"
+    )
+    return result
+
+
 # ─── Selenium 드라이버 ──────────────────────────────────────────
+# 목록 크롤 전용 경량 프로필: 이미지·폰트·미디어·스타일시트는 CDP로 차단.
+# 차단된 요청도 Network.requestWillBeSent는 발생하므로 상품 이미지 URL(ID)은 그대로 잡힘.
+SELENIUM_BLOCKED_URLS = [
+    "*/data/item/*",
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3", "*.m3u8",
+    "*.css",
+]
+
+
 def create_driver():
     options = Options()
     options.add_argument("--headless=new")
@@ -393,65 +817,228 @@ def create_driver():
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--window-size=1920,1080")
     options.add_argument(f"--user-agent={HEADERS['User-Agent']}")
+    # DOMContentLoaded 시점 반환 — 이후 목록 AJAX는 wait_for_network_quiet가 기다림
+    options.page_load_strategy = "eager"
     options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
-    return webdriver.Chrome(
+    # performance 로그는 Network 도메인만 (Page/Tracing 이벤트 제외)
+    options.add_experimental_option(
+        "perfLoggingPrefs", {"enableNetwork": True, "enablePage": False}
+    )
+    driver = webdriver.Chrome(
         service=Service(ChromeDriverManager().install()), options=options
     )
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": SELENIUM_BLOCKED_URLS})
+    return driver
 
 
 # ─── 카테고리 페이지에서 제품 ID 추출 ──────────────────────────
-def get_item_ids_from_category(driver, category):
-    """카테고리 목록 페이지를 순회하며 제품 ID를 최대치까지 수집"""
+def category_key(category):
+    """카테고리 식별 키 (중복 제거·목록 워터마크 공용)."""
+    if category.get("ca_id"):
+        return f"ca:{category['ca_id']}"
+    return f"vi:{category['vi']}:{category['idx']}"
+
+
+def recommend_key(page):
+    """Recommend 페이지 워터마크 키 (같은 vi/idx의 list.php 카테고리와 구분)."""
+    return f"rec:{category_key(page)}"
+
+
+def _assumed_ids(marks, key, alive):
+    """일괄 열거로 변화 없음이 확인된 실행(alive)에서 워터마크로 목록을 대신한 ID. 읽어야 하면 None."""
+    if marks is None or alive is None or marks.known(key) is None:
+        return None
+    return marks.assume(key, alive)
+
+
+def category_list_url(category):
+    if category.get("ca_id"):
+        return f"{SHOP_BASE}/list.php?ca_id={category['ca_id']}"
+    return (
+        f"{SHOP_BASE}/list.php"
+        f"?ca_id=h0&ca_id_vi={category['vi']}&ca_id_index={category['idx']}"
+    )
+
+
+def find_item_ids(html):
+    """HTML에서 item.php 링크 / go_item() / 상품 이미지 URL 기반 상품 ID (등장 순서 유지, 중복 제거)."""
+    return dict.fromkeys(next(g for g in m.groups() if g) for m in _LIST_ITEM_REF.finditer(html))
+
+
+# list.php는 상품 목록을 AJAX로 채움 — 인라인 스크립트의 $.ajax({url:...}) / $.post() / fetch() 대상
+_LIST_AJAX_URL_PATTERN = re.compile(
+    r"""(?:url\s*:\s*|\$\.(?:post|get|ajax)\(\s*|fetch\(\s*|\.load\(\s*)['"]([^'"]+?\.php)(?:\?[^'"]*)?['"]"""
+)
+# Recommend 수집과 같은 백엔드 (목록 페이지와 동일한 ca_id_vi/ca_id_index 사용)
+LIST_AJAX_ENDPOINTS = [f"{SHOP_BASE}/recommendPC.php"]
+LIST_PAGE_DELAY = 0.5   # HTTP 목록 페이지 간 (Selenium 2.2초 대비)
+LIST_MAX_PAGES = 300    # 페이지 번호를 무시하는 응답 대비 안전 상한 (정상 종료는 신규 ID 없음·워터마크)
+
+
+def find_list_ajax_endpoints(html, page_url):
+    """목록 HTML 스크립트에서 같은 호스트의 AJAX .php 엔드포인트 추출 (item/list 제외)."""
+    host = urlsplit(page_url).netloc
+    endpoints = []
+    for path in _LIST_AJAX_URL_PATTERN.findall(html):
+        url = urljoin(page_url, path)
+        name = urlsplit(url).path.rsplit("/", 1)[-1]
+        if urlsplit(url).netloc != host or name in ("item.php", "list.php"):
+            continue
+        if url not in endpoints:
+            endpoints.append(url)
+    return endpoints
+
+
+def _list_ajax_request(session, endpoint, category, page, limiter=None):
+    """목록 AJAX 호출 재현: 카테고리 파라미터는 쿼리, 정렬/재고/페이지는 POST 본문."""
     if category.get("ca_id"):
-        base = f"{SHOP_BASE}/list.php?ca_id={category['ca_id']}"
+        query = f"ca_id={category['ca_id']}"
+        data = {"ca_id": category["ca_id"], "stock": "0", "s_order": "best", "page": str(page)}
     else:
-        base = (
-            f"{SHOP_BASE}/list.php"
-            f"?ca_id=h0&ca_id_vi={category['vi']}&ca_id_index={category['idx']}"
-        )
+        query = f"ca_id=h0&ca_id_vi={category['vi']}&ca_id_index={category['idx']}"
+        data = {"ca_id": "h0", "stock": "0", "s_order": "best", "page": str(page)}
+    url = f"{endpoint}?{query}&page={page}"
+    html = _post_text(session, url, data, limiter)
+    _archive_list(f"POST {url}", html)
+    return html
+
+
+def get_item_ids_from_category_http(session, category, list_meta=None, limiter=None, emit=None,
+                                    marks=None):
+    """
+    requests만으로 카테고리 목록 수집 (Selenium 불필요).
+    list.php?page=N HTML + 목록 AJAX 응답에서 ID/이미지 URL을 뽑는다.
+    페이지의 ID가 모두 워터마크(marks — 직전 실행 ID)에 있으면 종료하고 뒤 페이지 상품은 이어받음,
+    전체 순회에서는 연속 2페이지 신규 ID가 없으면 종료. 0건이면 호출 측이 Selenium으로 폴백.
+    """
+    base = category_list_url(category)
+    print(f"  카테고리 로딩(HTTP): {base}")
+
+    key = category_key(category)
+    known = marks.known(key) if marks is not None else None
+    item_ids = {}  # 발견 순서 유지 (dict 키)
+    endpoints = list(LIST_AJAX_ENDPOINTS)
+    no_new_streak = 0
+
+    for page in range(1, LIST_MAX_PAGES + 1):
+        before = len(item_ids)
+        # 1페이지는 page 파라미터 없는 기본 URL (동적 카테고리 2차 확장이 읽은 응답을 메모에서 재사용)
+        page_url = base if page == 1 else f"{base}&page={page}"
+        htmls = []
+        try:
+            html = _get_text(session, page_url, limiter)
+            htmls.append(html)
+            _archive_list(f"GET {page_url}", html)
+            if page == 1:
+                for ep in find_list_ajax_endpoints(html, page_url):
+                    if ep not in endpoints:
+                        endpoints.append(ep)
+        except Exception as e:
+            safe_print(f"    [ERROR] 목록 로드 실패 page={page}: {e}")
+
+        for ep in endpoints:
+            try:
+                htmls.append(_list_ajax_request(session, ep, category, page, limiter))
+            except Exception:
+                continue
+
+        page_ids = {}
+        for html in htmls:
+            page_ids.update(find_item_ids(html))
+            if list_meta is not None:
+                merge_list_meta(list_meta, extract_list_item_meta(html))
+        item_ids.update(page_ids)
+        _emit_new_ids(emit, item_ids, before, category)
+
+        added = len(item_ids) - before
+        print(f"    - page={page}: +{added} (누적 {len(item_ids)})")
+
+        if _stop_at_watermark(marks, key, known, page_ids, item_ids, emit, category):
+            break
+        if added == 0:
+            no_new_streak += 1
+        else:
+            no_new_streak = 0
+        if no_new_streak >= 2:
+            break
+        if limiter is None:
+            time.sleep(LIST_PAGE_DELAY)
+    else:
+        safe_print(f"    [WARN] [{category['name']}] 목록 안전 상한 {LIST_MAX_PAGES}페이지 도달")
+
+    return list(item_ids)
+
+
+def _emit_new_ids(emit, item_ids, before, category):
+    """이번 페이지 신규 ID를 파이프라인에 전달.
+    item_ids는 발견 순서를 유지하는 dict — 앞 before개는 이전 페이지에서 이미 전달됨."""
+    if emit is None or len(item_ids) <= before:
+        return
+    emit(list(item_ids)[before:], category)
+
+
+def _stop_at_watermark(marks, key, known, page_ids, item_ids, emit, category):
+    """페이지 ID가 모두 워터마크에 있으면 True — 뒤 페이지 상품을 워터마크에서 이어받아 전달."""
+    if marks is not None:
+        marks.count_page()
+    if known is None or not page_ids or not known.issuperset(page_ids):
+        return False
+    rest = marks.carry(key, item_ids)  # carried 등록 후 emit (증분 재사용 판단이 emit 안에서 일어남)
+    if emit is not None and rest:
+        emit(rest, category)
+    print(f"    - 워터마크 도달: 이후 페이지 생략, 이전 상품 {len(rest)}개 이어받음")
+    return True
+
+
+_ITEM_IMAGE_URL = re.compile(r"admin\.youngjaecomputer\.com/data/item/(\d+)_")
+
+
+def get_item_ids_from_category(slot, category, list_meta=None, emit=None, marks=None):
+    """
+    카테고리 목록 페이지를 순회하며 제품 ID 수집 (Selenium 폴백 경로, 종료 조건은 HTTP 경로와 같음).
+    slot: driver_pool.PooledDriver — 페이지 이동·드라이버 재생성은 slot.open()이 담당.
+    """
+    base = category_list_url(category)
     print(f"  카테고리 로딩: {base}")
 
-    item_ids = set()
-    max_pages = 20
+    key = category_key(category)
+    known = marks.known(key) if marks is not None else None
+    item_ids = {}  # 발견 순서 유지 (dict 키)
     no_new_streak = 0
 
-    for page in range(1, max_pages + 1):
+    for page in range(1, LIST_MAX_PAGES + 1):
         page_url = f"{base}&page={page}"
-        driver.get(page_url)
-        time.sleep(2.2)
+        driver = slot.open(page_url)
 
         before = len(item_ids)
+        page_ids = {}
 
-        # 1) 네트워크 로그에서 item ID 추출
-        try:
-            logs = driver.get_log("performance")
-            for log in logs:
-                try:
-                    msg = json.loads(log["message"])["message"]
-                    if msg.get("method") == "Network.requestWillBeSent":
-                        req_url = msg["params"]["request"]["url"]
-                        m = re.search(r"admin\.youngjaecomputer\.com/data/item/(\d+)_", req_url)
-                        if m:
-                            item_ids.add(m.group(1))
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        # 1) 네트워크 로그에서 item ID 추출 (상품 이미지 요청이 잠잠해질 때까지 대기)
+        for req_url in wait_for_network_quiet(
+            driver, _ITEM_IMAGE_URL, quiet=LIST_QUIET_WINDOW, timeout=LIST_PAGE_TIMEOUT,
+            marker="/data/item/",
+        ):
+            page_ids[_ITEM_IMAGE_URL.search(req_url).group(1)] = None
 
         # 2) DOM에서 item.php?it_id= 패턴 추출(신뢰도 높음)
         try:
             src = driver.page_source
+            _archive_list(f"GET {page_url}", src)
             dom_ids = re.findall(r"item\.php\?it_id=(\d+)", src)
-            item_ids.update(dom_ids)
+            page_ids.update(dict.fromkeys(dom_ids))
+            if list_meta is not None:
+                merge_list_meta(list_meta, extract_list_item_meta(src))
         except Exception:
             pass
+        item_ids.update(page_ids)
+        _emit_new_ids(emit, item_ids, before, category)
 
         added = len(item_ids) - before
-        print(f"    - page={page}: +{added} (누적 {len(item_ids)})")
+        print(f"    - [{category['name']}] page={page}: +{added} (누적 {len(item_ids)})")
 
-        if len(item_ids) >= MAX_PRODUCTS_PER_CATEGORY:
+        if _stop_at_watermark(marks, key, known, page_ids, item_ids, emit, category):
             break
-
         if added == 0:
             no_new_streak += 1
         else:
@@ -461,7 +1048,7 @@ def get_item_ids_from_category(driver, category):
         if no_new_streak >= 2:
             break
 
-    return list(item_ids)[:MAX_PRODUCTS_PER_CATEGORY]
+    return list(item_ids)
 
 
 # ─── 가격 파싱 ─────────────────────────────────────────────────
@@ -483,14 +1070,32 @@ def format_price_display(won):
     return f"{man}만 원"
 
 
+# ─── 분류 키워드 자동자 ─────────────────────────────────────────
+# 색상/제외/게임/용도 키워드를 한 번 컴파일 → 텍스트당 한 번 스캔으로 모든 분류에 사용
+# (GPU 티어는 spec_catalog의 GPU 레코드에 포함)
+CLASSIFY_KEYWORDS = KeywordAutomaton(
+    {
+        ("color", "화이트"): CASE_WHITE_KEYWORDS,
+        ("color", "블랙"): CASE_BLACK_KEYWORDS,
+        ("exclude", "exclude"): EXCLUDE_KEYWORDS,
+        **{("game", game): kws for game, kws in GAME_KEYWORD_MAP.items()},
+        **{("usage", usage): kws for usage, kws in USAGE_KEYWORD_MAP.items()},
+        ("gaming_hint", "gaming"): GAMING_HINT_KEYWORDS,
+    }
+)
+
+
 # ─── GPU 티어 분류 ─────────────────────────────────────────────
 def classify_tier(gpu_text):
-    gpu_upper = gpu_text.upper()
-    for tier, keywords in GPU_TIER_MAP.items():
-        for kw in keywords:
-            if kw.upper() in gpu_upper:
-                return tier
-    return "가성비(FHD)"
+    """가장 긴 GPU 모델명 적중의 티어 (RTX 4070 Ti → 하이엔드, RTX 4070 → 퍼포먼스). 카탈로그 메모 사용."""
+    return SPEC_CATALOG.gpu(gpu_text)["tier"]
+
+
+def is_excluded_name(name, hits=None):
+    """상품명에 EXCLUDE_KEYWORDS(중고/리퍼 등)가 있는지."""
+    if hits is None:
+        hits = CLASSIFY_KEYWORDS.scan(name)
+    return hits.has("exclude")
 
 
 # ─── 가격대 분류 ───────────────────────────────────────────────
@@ -502,249 +1107,71 @@ def classify_price_range(price):
 
 
 # ─── 케이스 색상 ───────────────────────────────────────────────
-def detect_case_color(text):
-    t = text.upper()
-    for kw in CASE_WHITE_KEYWORDS:
-        if kw.upper() in t:
-            return "화이트"
-    for kw in CASE_BLACK_KEYWORDS:
-        if kw.upper() in t:
-            return "블랙"
+def detect_case_color(text, hits=None):
+    if hits is None:
+        hits = CLASSIFY_KEYWORDS.scan(text)
+    if hits.has("color", "화이트"):
+        return "화이트"
     return "블랙"
 
 
-# ─── 상세페이지에서 FPS/프레임 문맥으로 게임 추가 (필터 중복 노출용) ─
-# "게임명 + 숫자 + FPS" 또는 "숫자 FPS + 게임명" 이 있으면 해당 게임으로도 필터에 노출
-_FPS_NUMBER_PATTERN = re.compile(r"\d{2,4}\s*(?:FPS|프레임|fps)", re.I)
-_WINDOW = 80  # 게임 키워드 전후 몇 글자 안에 FPS 숫자가 있으면 동일 문맥으로 봄
-_FPS_RESOLUTION_PATTERN = re.compile(r"(FHD|QHD|4K)", re.I)
-_GAME_FPS_ALIAS_MAP = {
-    "리그오브레전드": ["리그오브레전드", "LOL", "롤"],
-    "배틀그라운드": ["배틀그라운드", "배그", "PUBG"],
-    "로스트아크": ["로스트아크", "로아"],
-    "발로란트": ["발로란트", "발로"],
-    "오버워치2": ["오버워치2", "오버워치"],
-    "아이온2": ["아이온2", "아이온 2"],
-    "디아블로4": ["디아블로4", "디아4"],
-    "디아블로2": ["디아블로2", "디아2"],
-    "붉은사막": ["붉은사막"],
-    "몬스터헌터 와일드": ["몬스터헌터 와일드", "몬스터헌터", "몬헌", "와일즈"],
-    "플심": ["플심", "플라이트 시뮬레이터", "MSFS"],
-    "아크레이더스": ["아크레이더스"],
-    "연운": ["연운"],
-}
-_GAME_ALIAS_LOOKUP = {
-    alias.lower(): game
-    for game, aliases in _GAME_FPS_ALIAS_MAP.items()
-    for alias in aliases
-}
-_GAME_ALIAS_PATTERN = "|".join(
-    re.escape(alias)
-    for alias in sorted(_GAME_ALIAS_LOOKUP.keys(), key=len, reverse=True)
-)
-_GAME_FPS_FORWARD_PATTERN = re.compile(
-    rf"(?:(FHD|QHD|4K)\s*)?({_GAME_ALIAS_PATTERN})[^0-9]{{0,18}}(\d{{2,4}})\s*(?:FPS|프레임)",
-    re.I,
-)
-def extract_games_from_fps_section(page_text):
-    """상세 페이지 본문에서 '게임 키워드 + FPS/프레임' 문맥이 있는 게임명을 수집."""
-    if not page_text or len(page_text) < 20:
-        return set()
-    found = set()
-    text_lower = page_text.lower()
-    for game, keywords in GAME_KEYWORD_MAP.items():
-        for kw in keywords:
-            start = 0
-            while True:
-                pos = text_lower.find(kw.lower(), start)
-                if pos < 0:
-                    break
-                # 키워드 전후 WINDOW 글자 안에 FPS 숫자 패턴이 있는지
-                window_start = max(0, pos - _WINDOW)
-                window_end = min(len(page_text), pos + len(kw) + _WINDOW)
-                window = page_text[window_start:window_end]
-                if _FPS_NUMBER_PATTERN.search(window):
-                    found.add(game)
-                    break
-                start = pos + 1
-    return found
-
-
-def normalize_text_compact(text):
-    return re.sub(r"\s+", " ", str(text or "")).strip()
-
-
-def build_game_fps_highlight(game, fps, resolution=None):
-    fps_label = f"{int(fps)} FPS"
-    if resolution:
-        return f"{resolution} {game} {fps_label}"
-    return f"{game} {fps_label}"
-
-
-def should_replace_game_fps(existing, candidate):
-    if not existing:
-        return True
-    if not existing.get("resolution") and candidate.get("resolution"):
-        return True
-    if existing.get("source") != "detail" and candidate.get("source") == "detail":
-        return True
-    return False
-
-
-def extract_game_fps_map(name, page_text):
-    """상품명/상세 본문에서 실제 제공 게임 FPS를 추출."""
-    extracted = {}
-
-    for source_name, raw_text in (("name", name), ("detail", page_text)):
-        text = normalize_text_compact(raw_text)
-        if len(text) < 5:
-            continue
+# ─── 게임 태그 / 용도 분류 ─────────────────────────────────────
+DEFAULT_GAMING_GAMES = ("리그오브레전드", "배틀그라운드", "로스트아크", "발로란트", "오버워치2")
 
-        for match in _GAME_FPS_FORWARD_PATTERN.finditer(text):
-            resolution_raw, alias_raw, fps_raw = match.groups()
 
-            try:
-                fps = int(fps_raw)
-            except (TypeError, ValueError):
-                continue
-
-            if fps < 20 or fps > 1000:
-                continue
-
-            alias_key = str(alias_raw or "").lower().strip()
-            game = _GAME_ALIAS_LOOKUP.get(alias_key)
-            if not game:
-                continue
-
-            resolution = resolution_raw.upper() if resolution_raw else None
-            if not resolution:
-                window = text[max(0, match.start() - 16): min(len(text), match.end() + 16)]
-                nearby_resolution = _FPS_RESOLUTION_PATTERN.search(window)
-                resolution = nearby_resolution.group(1).upper() if nearby_resolution else None
-
-            candidate = {
-                "fps": fps,
-                "resolution": resolution,
-                "label": game,
-                "highlight": build_game_fps_highlight(game, fps, resolution),
-                "source": source_name,
-            }
-
-            if should_replace_game_fps(extracted.get(game), candidate):
-                extracted[game] = candidate
-
-    return extracted
+def tag_inputs(name, detail_text, tier, fps_games=None, name_hits=None):
+    """
+    카테고리와 무관한 분류 입력 (상품명·상세 본문에서 한 번 계산).
+    category_tags()가 카테고리와 합쳐 games/usage를 만든다 — 여러 카테고리에서 발견되면 합친 카테고리로 다시 계산.
+    fps_games: scan_game_fps()가 game_fps와 함께 구한 결과 (없으면 detail_text에서 계산)
+    결과는 crawl_state.json에 상품별로 저장되어, 다음 실행의 스트리밍 재수집(FPS 본문 없음)과
+    증분 재사용 상품도 그 실행의 카테고리로 다시 분류한다.
+    """
+    hits = CLASSIFY_KEYWORDS.scan(name + " " + detail_text)
+    if fps_games is None:
+        fps_games = extract_games_from_fps_section(detail_text)
+    if name_hits is None:
+        name_hits = CLASSIFY_KEYWORDS.scan(name)
+    return {
+        # 상세페이지 전체에서 FPS/프레임 문맥이 있는 게임 포함 (필터에서 중복 노출)
+        "games": sorted(hits.labels("game") | set(fps_games)),
+        # 상세 FPS 문맥 게임만 따로 (스트리밍 재수집은 FPS 본문을 받지 않으므로 이것을 재사용)
+        "fps_games": sorted(fps_games),
+        "gaming_hint": hits.has("gaming_hint"),
+        "usage": sorted(name_hits.labels("usage")),
+        "tier": tier,
+    }
 
 
-# ─── 게임 태그 추출 ────────────────────────────────────────────
-def extract_game_tags(name, detail_text, category_games, full_page_text=None):
-    tags = set(category_games)
-    combined = (name + " " + detail_text).upper()
-    for game, keywords in GAME_KEYWORD_MAP.items():
-        for kw in keywords:
-            if kw.upper() in combined:
-                tags.add(game)
-    # 상세페이지 전체에서 FPS/프레임 문맥이 있는 게임 추가 (필터에서 중복 노출)
-    fps_text = full_page_text if full_page_text is not None else detail_text
-    tags |= extract_games_from_fps_section(fps_text)
+def category_tags(inputs, category):
+    """(tag_inputs, 카테고리) → (games, usage)."""
+    games = set(category["games"]) | set(inputs["games"])
     # 게이밍 PC면 기본 게임 목록 부여
-    if not tags and any(
-        kw in combined
-        for kw in ["게임", "GAMING", "GAME", "RTX", "RX 7", "RX 9"]
-    ):
-        tags = {"리그오브레전드", "배틀그라운드", "로스트아크", "발로란트", "오버워치2"}
-    return sorted(tags)
-
-
-# ─── 용도 분류 ─────────────────────────────────────────────────
-def classify_usage(name, category_usage, tier):
-    usage = set(category_usage)
-    name_up = name.upper()
-    if "영상편집" in name or "편집" in name:
-        usage.add("영상편집")
-    if "AI" in name_up or "딥러닝" in name or "머신러닝" in name:
-        usage.add("AI/딥러닝")
-    if "사무" in name or "디자인" in name or "오피스" in name:
-        usage.add("사무/디자인")
-    if not usage or tier in ("퍼포먼스(QHD)", "하이엔드(4K)"):
+    if not games and inputs["gaming_hint"]:
+        games = set(DEFAULT_GAMING_GAMES)
+    usage = set(category["usage"]) | set(inputs["usage"])
+    if not usage or inputs["tier"] in ("퍼포먼스(QHD)", "하이엔드(4K)"):
         usage.add("게이밍")
-    return sorted(usage)
+    return sorted(games), sorted(usage)
 
 
-# ─── 상품명에서 짧은 CPU/GPU 이름 추출 ────────────────────────
-def short_cpu(cpu_full):
-    """AMD/인텔 CPU 전체 이름 → 짧은 모델명
-    예) AMD 라이젠5-6세대 9600X (그래나이트) → R5 9600X
-        코어 아이i5-14세대 14400F (이스트록) → i5-14400F
-    """
-    cpu = cpu_full.upper()
-
-    # AMD 라이젠
-    if "라이젠" in cpu_full or "RYZEN" in cpu:
-        # "라이젠7-6세대 9800X3D" → 세대 숫자를 건너뛰고 모델 번호 추출
-        m = re.search(r"라이젠\s*(\d+).*?(\d{4,5}(?:X3D|X|G|GE|GT)?)", cpu_full, re.I)
-        if m:
-            return f"R{m.group(1)} {m.group(2)}"
-
-    # 인텔 코어 (한국어 표기: "코어 아이i5-14세대 14400F")
-    if "코어" in cpu_full or "CORE" in cpu or "INTEL" in cpu:
-        # 한국어: "코어 아이i5-14세대 14400F" 형식
-        m = re.search(r"i(\d)-\d+세대\s*(\d{4,5}[A-Za-z]{0,3})", cpu_full, re.I)
-        if m:
-            return f"i{m.group(1)}-{m.group(2)}"
-        # 영문: "Core i7-14700KF" 형식
-        m = re.search(r"(i\d-\d{4,5}[A-Za-z]{0,3})", cpu_full, re.I)
-        if m:
-            return m.group(1)
-        # 숫자 모델만 있는 경우 (14400, 13400F 등)
-        m = re.search(r"\b(\d{4,5}[A-Za-z]{0,3})\b", cpu_full)
-        if m and len(m.group(1)) >= 4:
-            return f"i-{m.group(1)}"
-
-    # 제온 (서버/워크스테이션)
-    if "제온" in cpu_full or "XEON" in cpu:
-        m = re.search(r"[Ww]\d[-\s]\d{4,5}[A-Za-z]*", cpu_full)
-        if m:
-            return f"Xeon {m.group(0)}"
-
-    # AMD 스레드리퍼
-    if "스레드리퍼" in cpu_full or "THREADRIPPER" in cpu:
-        m = re.search(r"(\d{4,5}[A-Za-z]*)", cpu_full)
-        if m:
-            return f"TR {m.group(1)}"
-
-    return cpu_full[:12].strip()
-
-
-def short_gpu(gpu_full):
-    """GPU 전체 이름 → 짧은 모델명
-    예) INNO3D 지포스 RTX 5070 OC D7 → RTX 5070
-        SAPPHIRE 라데온 RX 7600 PULSE → RX 7600
-    """
-    # NVIDIA GeForce (RTX/GTX)
-    m = re.search(r"(RTX\s*\d{4}(?:\s*(?:Ti\s*Super|Ti|Super|SUPER))?)", gpu_full, re.I)
-    if m:
-        return re.sub(r"\s+", " ", m.group(1)).strip().upper()
-    m = re.search(r"(GTX\s*\d{4}(?:\s*(?:Ti|Super|SUPER))?)", gpu_full, re.I)
-    if m:
-        return re.sub(r"\s+", " ", m.group(1)).strip().upper()
-    # AMD Radeon (RX)
-    m = re.search(r"(RX\s*\d{4}(?:\s*(?:XT|XTX))?)", gpu_full, re.I)
-    if m:
-        return re.sub(r"\s+", " ", m.group(1)).strip().upper()
-    # NVIDIA 전문가용 (RTX A-series, RTX 6000)
-    m = re.search(r"(RTX\s*(?:A\d{3,4}|6000)[^,\s]*)", gpu_full, re.I)
-    if m:
-        return re.sub(r"\s+", " ", m.group(1)).strip()
-    # 내장 그래픽 (iGPU)
-    if "내장" in gpu_full or "iGPU" in gpu_full.upper():
-        return "내장 그래픽"
-    return gpu_full[:15]
-
-
-def gpu_key(gpu_short):
-    """RTX 5060 Ti → RTX 5060 Ti (정규화)"""
-    return re.sub(r"\s+", " ", gpu_short).strip()
+def product_badge(installment_months, usage, tier, price, case_color):
+    """카드 뱃지 (문구, 색)."""
+    if installment_months == 24:
+        return "24개월 무이자", "purple"
+    if installment_months == 36:
+        return "36개월 무이자", "purple"
+    if "AI/딥러닝" in usage:
+        return "AI 전문가용", "cyan"
+    if tier == "하이엔드(4K)" and price >= 3_000_000:
+        return "하이엔드", "gold"
+    if tier == "가성비(FHD)" and price <= 1_000_000:
+        return "가성비 베스트", "green"
+    if tier == "퍼포먼스(QHD)":
+        return "퍼포먼스 추천", "blue"
+    if case_color == "화이트":
+        return "화이트 감성", "white"
+    return "", "gray"
 
 
 # ─── 가격 검증·라벨 파싱 (GPU 스펙 대비 비현실적 금액 차단) ─────
@@ -755,30 +1182,64 @@ def is_event_style_product(name):
     return any(k in name for k in EVENT_NAME_KEYWORDS)
 
 
-def extract_labeled_price(page_text, label):
-    """단일 라벨 인근 원화 금액 (5자리 이상)."""
-    pattern = re.escape(label) + r"\s*[:：\r\n\t ]*([0-9,]{5,})\s*원"
-    m = re.search(pattern, page_text)
-    if m:
-        return int(m.group(1).replace(",", ""))
-    return 0
-
+# 상세 본문의 가격 라벨 (라벨 뒤 5자리 이상 "N원"을 그 라벨 금액으로 봄)
+PRICE_LABELS = ("정상가", "판매가", "혜택가", "총 결제금액", "총결제금액")
+_PRICE_TOKEN = re.compile(
+    # 첫 글자 집합을 앞에 두어 후보 위치만 시도
+    r"(?=[정판혜총월\d,])(?:"
+    r"(?P<label>" + "|".join(re.escape(label) for label in sorted(PRICE_LABELS, key=len, reverse=True)) + r")"
+    r"|(?P<monthly>월\s*납부금액\s*\(\d+개월\))"
+    r"|(?P<won>[\d,]{6,})\s*원"
+    r")"
+)
+_LABEL_AMOUNT = re.compile(r"\s*[:：\r\n\t ]*([0-9,]{5,})\s*원")
+_MONTHLY_AMOUNT = re.compile(r"[^0-9]*([\d,]+)")
 
-def extract_price_by_label_order(page_text, labels):
-    for label in labels:
-        v = extract_labeled_price(page_text, label)
-        if v >= 300_000:
-            return v
-    return 0
 
+class PriceScan:
+    """
+    상세 본문을 한 번 훑어 가격 표를 만든다. 가격 규칙은 모두 이 표에서 판단.
+      labeled: 라벨 → 그 라벨 뒤 금액 (금액이 붙은 첫 등장)
+      amounts: 본문의 모든 "N원" (6자리 이상, 쉼표 포함)
+      monthly: "월 납부금액 (N개월)" 뒤 첫 숫자 (없으면 0)
+    """
 
-def extract_largest_won_amount(page_text, minimum=300_000):
-    best = 0
-    for m in re.finditer(r"([\d,]{6,})\s*원", page_text):
-        v = int(m.group(1).replace(",", ""))
-        if v >= minimum:
-            best = max(best, v)
-    return best
+    def __init__(self, page_text):
+        self.labeled = {}
+        self.amounts = []
+        self.monthly = 0
+        monthly_seen = False
+        for m in _PRICE_TOKEN.finditer(page_text):
+            kind = m.lastgroup
+            if kind == "won":
+                self.amounts.append(int(m.group("won").replace(",", "")))
+            elif kind == "label":
+                label = m.group("label")
+                if label not in self.labeled:
+                    amount = _LABEL_AMOUNT.match(page_text, m.end())
+                    if amount:
+                        self.labeled[label] = int(amount.group(1).replace(",", ""))
+            elif not monthly_seen:
+                monthly_seen = True
+                amount = _MONTHLY_AMOUNT.match(page_text, m.end())
+                if amount:
+                    self.monthly = int(amount.group(1).replace(",", "") or 0)
+
+    def labeled_price(self, label):
+        """라벨 인근 원화 금액 (5자리 이상), 없으면 0."""
+        return self.labeled.get(label, 0)
+
+    def by_label_order(self, labels, minimum=300_000):
+        """라벨 순서대로 minimum 이상인 첫 금액."""
+        for label in labels:
+            v = self.labeled.get(label, 0)
+            if v >= minimum:
+                return v
+        return 0
+
+    def largest(self, minimum=300_000):
+        """본문 "N원" 중 minimum 이상 최대 금액."""
+        return max((v for v in self.amounts if v >= minimum), default=0)
 
 
 def gpu_minimum_credible_price(name, cpu_full, gpu_full):
@@ -804,23 +1265,193 @@ def validate_price_against_gpu(name, cpu_full, gpu_full, price):
 
 
 # ─── 상품 상세 파싱 ────────────────────────────────────────────
-def parse_product_detail(item_id, category, session):
-    url = f"{SHOP_BASE}/item.php?it_id={item_id}"
-    soup = None
-    final_url = url
+def product_url(item_id):
+    return f"{SHOP_BASE}/item.php?it_id={item_id}"
+
+
+def fetch_product_page(item_id, session):
+    """상세 페이지 GET (최대 2회 시도). 실패 시 None, 성공 시 page dict."""
+    url = product_url(item_id)
+    last_error = None
     for _ in range(2):
         try:
+            if _response_cache is not None:
+                return _response_cache.get(session, url, timeout=15)
             resp = session.get(url, timeout=15)
             resp.encoding = "utf-8"
-            final_url = resp.url
-            soup = BeautifulSoup(resp.text, "lxml")
-            break
+            return {
+                "url": url,
+                "final_url": resp.url,
+                "status": resp.status_code,
+                "text": resp.text,
+            }
         except Exception as e:
             last_error = e
             time.sleep(0.6)
-    if soup is None:
-        print(f"    [ERROR] 페이지 로드 실패: {last_error}")
+    print(f"    [ERROR] 페이지 로드 실패: {last_error}")
+    return None
+
+
+def head_price_ready(watcher):
+    """
+    스트리밍 중단 조건(가격): 이 상품의 가격 규칙이 쓰는 1순위 금액이 이미 받은 부분에 있는지.
+    일반 상품은 판매가(또는 판매가 필드), 이벤트 상품은 정상가+혜택가,
+    할부 상품은 여기에 총 결제금액+월 납부금액까지. 없으면 계속 받음 (최악의 경우 전체 다운로드).
+    """
+    name = product_name_from_title(watcher.title())
+    text = watcher.text()
+    prices = PriceScan(text)
+    installment = any(m in name or m in text[:500] for m in ("24개월", "36개월"))
+    if is_event_style_product(name):
+        if prices.labeled_price("정상가") < 300_000 or not prices.labeled_price("혜택가"):
+            return False
+    elif not installment and (watcher.structured_price or 0) >= 300_000:
+        return True
+    elif prices.labeled_price("판매가") < 300_000:
+        return False
+    if installment:
+        total = prices.labeled_price("총 결제금액") or prices.labeled_price("총결제금액")
+        return total >= 300_000 and prices.monthly > 0
+    return True
+
+
+def fetch_product_head(item_id, session):
+    """
+    상세 페이지 스트리밍 GET: 청크를 증분 파서에 넣다가 스펙 블록·가격이 잡히고 재고 근거(재고 필드 또는
+    구매 문구)를 감싼 상품 폼이 닫히면 연결을 닫음 — 품절 표시·재고확인 배너가 같은 폼 안에 있으므로
+    그 전에 끊으면 품절 판단이 잘린 본문 기준이 됨. 폼 밖 근거뿐이면 끝까지 받음.
+    끝까지 받았으면 일반 page dict(응답 캐시에 저장), 중간에 끊었으면 page["partial"] = True.
+    응답 캐시에 신선한 전체 본문이 있으면 요청 없이 그것을 사용, 오래된 본문이 있으면 조건부 GET (304면 캐시 본문).
+    실패 시 일반 다운로드로 재시도.
+    """
+    url = product_url(item_id)
+    entry = None
+    headers = None
+    if _response_cache is not None:
+        page, entry = _response_cache.lookup(url)
+        if page is not None:
+            return page
+        headers = _response_cache.conditional_headers(entry)
+    try:
+        with session.get(url, timeout=15, stream=True, headers=headers) as resp:
+            if resp.status_code == 304 and _response_cache is not None:
+                return _response_cache.resolve(url, entry, resp.url, 304, resp.headers, b"")
+            watcher = HeadWatcher()
+            chunks = []
+            for chunk in resp.iter_content(STREAM_CHUNK):
+                chunks.append(chunk)
+                if watcher.feed(chunk) and watcher.stock_seen and head_price_ready(watcher):
+                    return {
+                        "url": url,
+                        "final_url": resp.url,
+                        "status": resp.status_code,
+                        "text": b"".join(chunks).decode("utf-8", errors="replace"),
+                        "partial": True,
+                    }
+            body = b"".join(chunks)
+            if _response_cache is not None:
+                # 끝까지 받은 본문은 캐시에 저장 → 다음 실행은 조건부 GET(304) 가능
+                return _response_cache.resolve(url, entry, resp.url, resp.status_code, resp.headers, body)
+            return {
+                "url": url,
+                "final_url": resp.url,
+                "status": resp.status_code,
+                "text": body.decode("utf-8", errors="replace"),
+            }
+    except Exception as e:
+        safe_print(f"    [WARNING] 스트리밍 실패 → 전체 다운로드: {item_id} ({e})")
+        return fetch_product_page(item_id, session)
+
+
+def previous_game_fps(previous):
+    """
+    직전 실행 상품 → (FPS 문맥 게임 집합, game_fps 맵) — 스트리밍으로 FPS 본문을 받지 않은 경우.
+    categories.games는 카테고리에서 합쳐진 게임까지 들어 있으므로 쓰지 않는다 (목록에서 빠져도 태그가 남음).
+    저장된 분류 입력(_tag_inputs)이 없는 상품은 game_fps의 게임으로 대신.
+    """
+    inputs = previous.get("_tag_inputs") or {}
+    if "fps_games" in inputs:
+        games = set(inputs["fps_games"])
+    else:
+        games = set(previous.get("game_fps") or ())
+    game_fps = {}
+    for game, info in (previous.get("game_fps") or {}).items():
+        game_fps[game] = {
+            "fps": info["fps"],
+            "resolution": info.get("resolution"),
+            "label": info.get("label", game),
+            "highlight": build_game_fps_highlight(
+                info.get("label", game), info["fps"], info.get("resolution")
+            ),
+        }
+    return games, game_fps
+
+
+def parse_product_detail(item_id, category, session):
+    page = fetch_product_page(item_id, session)
+    if page is None:
         return None
+    return parse_product_page(item_id, category, page)
+
+
+# 이 금액 미만(할부 제외)은 조립PC가 아닌 부품·주변기기로 보고 제외
+MIN_PC_PRICE = 500_000
+
+# 상세 페이지 판별 키워드 (호출마다 리스트/정규식을 다시 만들지 않도록 모듈 상수)
+PC_INDICATOR_KEYWORDS = [
+    "PC", "조립", "게이밍", "워크스테이션", "딥러닝",
+    "RTX", "RX ", "GTX", "5060", "5070", "5080", "5090",
+    "9800X", "9950X", "9600X", "7800X", "7500F", "14400",
+    "무이자", "할부", "브랜드", "견적", "사양",
+]
+_PC_INDICATOR_PAIRS = [(kw, kw.upper()) for kw in PC_INDICATOR_KEYWORDS]
+# 소문자 비교용
+SOLDOUT_TEXT_KEYWORDS = ["품절", "일시품절", "재고없음", "재고 없음", "sold out", "out of stock"]
+_STOCK_CHECK_BANNER = re.compile(r"재고확인\s*[\d~\-만원]")
+
+
+def _parse_page(item_id, category, page, previous=None):
+    """다운로드 스레드/코루틴 → 파서 프로세스로 원문 HTML을 넘겨 상품 dict를 받음."""
+    global _parse_pool
+    pool = _parse_pool
+    if pool is not None:
+        try:
+            product, catalog_new = pool.submit(
+                _parse_in_process, item_id, category, page, previous
+            ).result()
+            SPEC_CATALOG.merge(catalog_new)
+            return product
+        except BrokenProcessPool:
+            safe_print("[WARNING] 파서 프로세스 풀 중단 → 다운로드 스레드에서 파싱")
+            _parse_pool = None
+    return parse_product_page(item_id, category, page, previous)
+
+
+def _parse_in_process(item_id, category, page, previous=None):
+    """파서 프로세스 작업: 상품 dict + 이번에 새로 계산한 스펙 카탈로그 레코드 (부모가 저장)."""
+    return parse_product_page(item_id, category, page, previous), SPEC_CATALOG.drain_new()
+
+
+def product_name_from_title(title):
+    """<title> → 상품명 ("상품명 | 영재컴퓨터" / "상품명 : 영재컴퓨터" 형식 처리)."""
+    if not title:
+        return ""
+    name = title.split("|")[0].strip()
+    # ": 영재컴퓨터" 제거
+    for suffix in [" : 영재컴퓨터", " - 영재컴퓨터", " | 영재컴퓨터"]:
+        if name.endswith(suffix):
+            name = name[: -len(suffix)].strip()
+    return name
+
+
+def parse_product_page(item_id, category, page, previous=None):
+    """
+    다운로드된 상세 페이지(page dict: url/final_url/text)를 상품 dict로 변환.
+    page["partial"](스트리밍으로 앞부분만 받은 본문)이면 FPS 문맥 게임·game_fps는 previous 상품 값을 사용.
+    잘린 본문은 재고 근거(재고 필드·구매 문구)까지 받은 뒤에만 생기므로 재고 판단은 전체 본문과 같다.
+    """
+    url = product_url(item_id)
+    final_url = page.get("final_url") or url
 
     # 리다이렉트로 다른 상품 페이지로 이동된 경우 → 품절로 간주
     if final_url != url and f"it_id={item_id}" not in final_url:
@@ -828,127 +1459,80 @@ def parse_product_detail(item_id, category, session):
         return None
 
     # 페이지에 요청한 item_id가 포함되어 있는지 검증 (다른 상품으로 대체되었는지)
-    page_html = resp.text if resp else ""
+    page_html = page.get("text") or ""
     if item_id not in page_html:
         print(f"    [품절] 상품ID 불일치: {item_id}")
         return None
 
+    doc = extract_detail(page_html)
+
     # ── 제목: <title> 태그 우선, h2 보조 ──
-    name = ""
-    if soup.title:
-        raw_title = soup.title.get_text(strip=True)
-        # "상품명 | 영재컴퓨터" 또는 "상품명 : 영재컴퓨터" 형식 처리
-        name = raw_title.split("|")[0].strip()
-        # ": 영재컴퓨터" 제거
-        for suffix in [" : 영재컴퓨터", " - 영재컴퓨터", " | 영재컴퓨터"]:
-            if name.endswith(suffix):
-                name = name[: -len(suffix)].strip()
-
-    if not name and soup.find("h2"):
-        name = soup.find("h2").get_text(strip=True)
+    name = product_name_from_title(doc.title)
+
+    if not name and doc.h2:
+        name = doc.h2
 
     if not name or len(name) < 3:
         print(f"    [SKIP] 제목 없음: {url}")
         return None
 
+    # 상품명은 한 번만 스캔해 제외 키워드 / 용도 / (케이스 정보 없을 때) 색상 분류에 같이 사용
+    name_hits = CLASSIFY_KEYWORDS.scan(name)
+
     # 제외 키워드
-    for kw in EXCLUDE_KEYWORDS:
-        if kw in name:
-            return None
+    if is_excluded_name(name, name_hits):
+        return None
 
     # 품절 상품이 모니터/주변기기 페이지로 대체되는 경우 감지
     # PC 상품에는 CPU/GPU/조립/게이밍 등 키워드가 있어야 함
-    PC_INDICATOR_KEYWORDS = [
-        "PC", "조립", "게이밍", "워크스테이션", "딥러닝",
-        "RTX", "RX ", "GTX", "5060", "5070", "5080", "5090",
-        "9800X", "9950X", "9600X", "7800X", "7500F", "14400",
-        "무이자", "할부", "브랜드", "견적", "사양",
-    ]
-    page_text_for_check = soup.get_text()
+    page_text = doc.text
     name_upper = name.upper()
-    has_pc_indicator = any(kw.upper() in name_upper or kw in page_text_for_check[:3000] for kw in PC_INDICATOR_KEYWORDS)
+    head_text = page_text[:3000]
+    has_pc_indicator = any(
+        kw_upper in name_upper or kw in head_text
+        for kw, kw_upper in _PC_INDICATOR_PAIRS
+    )
     if not has_pc_indicator:
         # 스펙 테이블에 CPU/VGA가 있는지 최종 확인
-        has_spec_table = bool(soup.find(string=re.compile(r"CPU|VGA|RAM|SSD", re.I)))
-        if not has_spec_table:
+        if not doc.has_spec_word():
             print(f"    [SKIP] PC 아님 (모니터/주변기기): {name[:40]}")
             return None
 
     # ── 재고 판단 ──
-    page_text = soup.get_text()
-
     # 1) h2가 정확히 "품절"이면 품절
-    h2 = soup.find("h2")
-    if h2 and h2.get_text(strip=True) == "품절":
+    if doc.h2 == "품절":
         print(f"    [품절] {name[:40]}")
         return None
 
     # 2) 특정 품절 클래스 존재 시
-    if soup.find(class_=re.compile(r"sold.?out|it_soldout", re.I)):
+    if doc.soldout_class:
         print(f"    [품절] {name[:40]}")
         return None
 
-    # 3) "재고확인" 배너만 품절 처리 (공통 문구 "재고 확인 완료"는 제외)
-    # "재고확인" 뒤에 가격/숫자가 오는 경우(예: 재고확인 28-29만원)만 재고 미확정으로 간주
-    if "재고확인" in page_text and re.search(r"재고확인\s*[\d~\-만원]", page_text):
-        print(f"    [품절] 재고확인: {name[:40]}")
+    # 3) 페이지에 심긴 재고 필드(숨은 입력/옵션 재고/메타/JSON-LD)가 있으면 그것으로 판단
+    if doc.structured_in_stock is False:
+        print(f"    [품절] 재고 필드: {name[:40]}")
         return None
 
-    # 4) 품절/재고없음 키워드가 본문에 있고, 구매 버튼이 없을 때만 품절 처리
-    # ("품절 알림", "재고 확인 완료" 등 다른 맥락은 구매 버튼으로 재고 상품 구분)
-    soldout_keywords = ["품절", "일시품절", "재고없음", "재고 없음", "sold out", "out of stock"]
-    page_text_low = page_text.lower()
-    if any(kw in page_text_low for kw in [k.lower() for k in soldout_keywords]):
-        buy_btn = soup.find(string=re.compile(r"구매|바로구매|장바구니", re.I))
-        if not buy_btn:
-            print(f"    [품절] {name[:40]}")
+    if doc.structured_in_stock is None:
+        # 4) "재고확인" 배너만 품절 처리 (공통 문구 "재고 확인 완료"는 제외)
+        # "재고확인" 뒤에 가격/숫자가 오는 경우(예: 재고확인 28-29만원)만 재고 미확정으로 간주
+        if "재고확인" in page_text and _STOCK_CHECK_BANNER.search(page_text):
+            print(f"    [품절] 재고확인: {name[:40]}")
             return None
 
-    # 5) 가격 없음은 아래 파싱 단계에서 SKIP 처리
+        # 5) 품절/재고없음 키워드가 본문에 있고, 구매 버튼이 없을 때만 품절 처리
+        # ("품절 알림", "재고 확인 완료" 등 다른 맥락은 구매 버튼으로 재고 상품 구분)
+        page_text_low = page_text.lower()
+        if any(kw in page_text_low for kw in SOLDOUT_TEXT_KEYWORDS):
+            if not doc.has_buy_text:
+                print(f"    [품절] {name[:40]}")
+                return None
 
-    # ── 스펙 파싱 (div 기반 → table 기반 순서로 시도) ──
-    specs_raw = {}
-    SPEC_KEYS = {"CPU", "RAM", "VGA", "SSD", "HDD", "케이스", "파워", "쿨러", "쿨러/튜닝", "메인보드", "S/W", "조립/AS", "조립"}
+    # 6) 가격 없음은 아래 파싱 단계에서 SKIP 처리
 
-    # 1차: div 구조 파싱 (영재컴퓨터 실제 HTML 구조)
-    # 네비게이션 메뉴의 div와 스펙 섹션의 div를 구분하기 위해
-    # 값이 "[브랜드]모델명" 형식이거나 15자 이상인 경우만 유효한 스펙으로 처리
-    for div in soup.find_all("div"):
-        label = div.get_text(strip=True)
-        if label in SPEC_KEYS:
-            key = "쿨러" if "쿨러" in label else ("조립" if "조립" in label else label)
-            if key in specs_raw:
-                continue
-            # 다음 형제 div에서 값 추출
-            nxt = div.find_next_sibling()
-            if nxt:
-                raw_val = nxt.get_text(strip=True)
-                # "[브랜드명]모델명..." 에서 브랜드 대괄호 제거
-                clean = re.sub(r'^\[[^\]]*\]', '', raw_val).strip()
-                # 스펙 값은 15자 이상이어야 유효 (네비게이션 단어 제외)
-                # 또는 "[" 브랜드 형식으로 시작하는 경우
-                if clean and (len(clean) >= 15 or raw_val.startswith("[")):
-                    specs_raw[key] = clean
-
-    # 2차: table > tr > td 구조 파싱 (백업)
-    if not specs_raw.get("CPU") or not specs_raw.get("VGA"):
-        for table in soup.find_all("table"):
-            for row in table.find_all("tr"):
-                cells = row.find_all(["td", "th"])
-                if len(cells) >= 2:
-                    label = cells[0].get_text(strip=True)
-                    value = cells[1].get_text(strip=True)
-                    for key in ["CPU", "RAM", "VGA", "SSD", "HDD", "케이스", "파워", "쿨러", "메인보드"]:
-                        if key == label.strip() and key not in specs_raw:
-                            # 중복 텍스트 제거 (텍스트가 2번 반복되는 경우)
-                            if len(value) > 10:
-                                half = len(value) // 2
-                                if value[:half] == value[half:]:
-                                    value = value[:half]
-                            specs_raw[key] = value[:60]
-                            break
-            if specs_raw.get("CPU") and specs_raw.get("VGA"):
-                break
+    # ── 스펙 파싱 (div 기반 → table 기반, detail_extract.py) ──
+    specs_raw = doc.specs_raw
 
     cpu_full = specs_raw.get("CPU", "")
     gpu_full = specs_raw.get("VGA", "")
@@ -963,9 +1547,12 @@ def parse_product_detail(item_id, category, session):
         print(f"    [SKIP] CPU/GPU 정보 없음: {name[:40]}")
         return None
 
-    cpu_s = short_cpu(cpu_full)
-    gpu_s = short_gpu(gpu_full)
-    gpu_k = gpu_key(gpu_s)
+    # 원문 → 정규화 레코드 (spec_catalog: 같은 원문은 실행 간에도 한 번만 계산)
+    cpu_info = SPEC_CATALOG.cpu(cpu_full)
+    gpu_info = SPEC_CATALOG.gpu(gpu_full)
+    cpu_s = cpu_info["short"]
+    gpu_s = gpu_info["short"]
+    gpu_k = gpu_info["key"]
 
     # ── 가격 ──
     price_crawl_error = False
@@ -978,23 +1565,27 @@ def parse_product_detail(item_id, category, session):
         installment_months = 36
 
     event_style = is_event_style_product(name)
-
-    if event_style:
-        price = extract_price_by_label_order(
-            page_text,
-            ["정상가", "판매가", "혜택가", "총 결제금액", "총결제금액"],
-        )
+    # 일반 상품은 페이지에 심긴 판매가 필드(숨은 입력/메타/JSON-LD)로 충분 — 본문 스캔 생략
+    # 이벤트(정상가·혜택가 구분)/할부(총 결제금액·월 납부금액) 상품과 필드가 없는 페이지만 본문 스캔
+    structured_price = doc.structured_price or 0
+    use_structured_price = structured_price >= 300_000 and not event_style and installment_months == 0
+    # 라벨 금액 / 모든 "N원" / 월 납부금액을 본문 한 번 스캔으로 수집
+    prices = None if use_structured_price else PriceScan(page_text)
+
+    if use_structured_price:
+        price = structured_price
+    elif event_style:
+        price = prices.by_label_order(["정상가", "판매가", "혜택가", "총 결제금액", "총결제금액"])
     else:
-        price = extract_price_by_label_order(page_text, ["판매가", "혜택가"])
+        price = prices.by_label_order(["판매가", "혜택가"])
 
     if price < 300_000:
-        price = extract_largest_won_amount(page_text, minimum=300_000)
+        price = prices.largest(minimum=300_000)
+        if price < 300_000 and structured_price >= 300_000:
+            price = structured_price
 
     if installment_months > 0:
-        alt_total = extract_price_by_label_order(
-            page_text,
-            ["총 결제금액", "총결제금액", "정상가", "판매가"],
-        )
+        alt_total = prices.by_label_order(["총 결제금액", "총결제금액", "정상가", "판매가"])
         if alt_total >= 300_000:
             price = max(price, alt_total)
 
@@ -1002,22 +1593,16 @@ def parse_product_detail(item_id, category, session):
         print(f"    [SKIP] 가격 파싱 실패: {name[:40]}")
         return None
 
-    MIN_PC_PRICE = 500_000
-
     price_monthly = 0
     if installment_months > 0:
-        m_monthly = re.search(
-            r"월\s*납부금액\s*\(\d+개월\)[^0-9]*([\d,]+)", page_text
-        )
-        if m_monthly:
-            price_monthly = int(m_monthly.group(1).replace(",", ""))
+        price_monthly = prices.monthly
         if price_monthly < 10_000:
             price_monthly = price // installment_months if price >= installment_months else 0
         if price_monthly < 10_000 and price >= installment_months * 10_000:
             price_monthly = (price // installment_months // 10_000) * 10_000
 
     if event_style:
-        hy = extract_labeled_price(page_text, "혜택가")
+        hy = prices.labeled_price("혜택가")
         if hy >= 100_000 and hy != price:
             price_event = hy
 
@@ -1037,33 +1622,21 @@ def parse_product_detail(item_id, category, session):
         price_monthly = (price_monthly // 10_000) * 10_000
 
     # ── 분류 ──
-    tier = classify_tier(gpu_full)
+    tier = gpu_info["tier"]
     price_range = classify_price_range(price) if price > 0 else "300만 원 이상"
-    games = extract_game_tags(name, page_text[:2000], category["games"], page_text)
-    game_fps = extract_game_fps_map(name, page_text)
-    usage = classify_usage(name, category["usage"], tier)
-    case_color = detect_case_color(case_full or name)
+    if page.get("partial") and previous is not None:
+        fps_games, game_fps = previous_game_fps(previous)
+    else:
+        fps_games, game_fps = scan_game_fps(name, page_text)
+    inputs = tag_inputs(name, page_text[:2000], tier, fps_games, name_hits)
+    games, usage = category_tags(inputs, category)
+    case_color = detect_case_color(case_full) if case_full else detect_case_color(name, name_hits)
 
     # ── 썸네일 ──
     thumbnail = f"https://admin.youngjaecomputer.com/data/item/{item_id}_m"
 
     # ── 뱃지 ──
-    badge = ""
-    badge_color = "gray"
-    if installment_months == 24:
-        badge, badge_color = "24개월 무이자", "purple"
-    elif installment_months == 36:
-        badge, badge_color = "36개월 무이자", "purple"
-    elif "AI/딥러닝" in usage:
-        badge, badge_color = "AI 전문가용", "cyan"
-    elif tier == "하이엔드(4K)" and price >= 3_000_000:
-        badge, badge_color = "하이엔드", "gold"
-    elif tier == "가성비(FHD)" and price <= 1_000_000:
-        badge, badge_color = "가성비 베스트", "green"
-    elif tier == "퍼포먼스(QHD)":
-        badge, badge_color = "퍼포먼스 추천", "blue"
-    elif case_color == "화이트":
-        badge, badge_color = "화이트 감성", "white"
+    badge, badge_color = product_badge(installment_months, usage, tier, price, case_color)
 
     if price_crawl_error:
         price_display_str = "가격 확인 필요"
@@ -1116,6 +1689,8 @@ def parse_product_detail(item_id, category, session):
         "case_color": case_color,
         "badge": badge,
         "badge_color": badge_color,
+        # 여러 카테고리에서 발견 시 합친 카테고리로 다시 분류 (apply_category_tags) — 저장 시 제외
+        "_tag_inputs": inputs,
     }
     if price_crawl_error:
         product["price_crawl_error"] = True
@@ -1130,74 +1705,288 @@ def parse_product_detail(item_id, category, session):
 
 
 # ─── 메인 ──────────────────────────────────────────────────────
-def main():
+def main(engine="thread", use_cache=True, incremental=False, parse_workers=PARSE_PROCESSES,
+         archive=True, stream=False, discovery="category"):
+    global _response_cache, _parse_pool, _archive, _fetch_memo
+
     print("=" * 60)
     print("영재컴퓨터 제품 크롤러 v2 시작")
     print(f"시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60)
 
     all_products = {}
-    driver = None
+    fetcher = None
     session = requests.Session()
     session.headers.update(HEADERS)
 
-    try:
-        if SELENIUM_AVAILABLE:
-            print("[INFO] Selenium 드라이버 초기화...")
-            driver = create_driver()
-
-        dynamic_categories = discover_dynamic_categories(session)
-        merged_categories = []
-        seen_keys = set()
-        for cat in (CATEGORIES + dynamic_categories):
-            key = f"ca:{cat['ca_id']}" if cat.get("ca_id") else f"vi:{cat['vi']}:{cat['idx']}"
-            if key in seen_keys:
-                continue
-            seen_keys.add(key)
-            merged_categories.append(cat)
+    _response_cache = ResponseCache() if use_cache else None
+    if _response_cache is not None:
+        print(f"[INFO] 응답 캐시: {_response_cache.root} (TTL {_response_cache.ttl}초)")
 
-        print(f"[INFO] 고정 카테고리 {len(CATEGORIES)}개 + 동적 카테고리 {len(dynamic_categories)}개")
+    if engine == "async":
+        if AIOHTTP_AVAILABLE:
+            fetcher = AsyncPageFetcher(
+                HEADERS, per_host=ASYNC_PER_HOST, cache=_response_cache
+            ).start()
+            print(f"[INFO] 상세 다운로드 엔진: async (per_host={ASYNC_PER_HOST})")
+        else:
+            print("[WARNING] aiohttp 없음. thread 엔진으로 실행.")
 
-        # 1단계: 메인페이지 상품
-        main_item_ids = collect_main_page_item_ids(session)
-        cat_main = {"name": "MAIN_PAGE", "games": [], "usage": []}
-        run_parallel_detail_fetch(
-            [(iid, cat_main) for iid in main_item_ids], all_products, "메인페이지"
-        )
+    _archive = HtmlArchive() if archive else None
+    if _archive is not None:
+        print(f"[INFO] 원문 보관소: {_archive.root}")
 
-        # 2단계: Installment 페이지
-        installment_ids = collect_installment_item_ids(session)
-        cat_inst = {"name": "INSTALLMENT", "games": [], "usage": []}
-        run_parallel_detail_fetch(
-            [(iid, cat_inst) for iid in installment_ids], all_products, "Installment"
+    if parse_workers > 0:
+        # spawn: 다운로드 스레드·이벤트 루프가 이미 도는 프로세스를 fork하지 않도록
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=parse_workers, mp_context=multiprocessing.get_context("spawn")
         )
+        print(f"[INFO] 상세 파싱: 프로세스 {parse_workers}개")
+
+    # 목록 카드 메타 (증분 지문 계산용) — 매 실행 수집해 다음 실행의 기준으로 저장
+    list_meta = {}
+    crawl_state = load_crawl_state()
+    marks = ListWatermarks(crawl_state, LIST_FULL_SWEEP_EVERY)
+    print(f"[INFO] 목록 워터마크: {'전체 순회' if marks.full_sweep else '직전 실행 ID 기준 조기 종료'}")
+    inc = None
+    if incremental:
+        previous = load_previous_products()
+        runs = crawl_state.get("runs_since_full", 0)
+        if not previous or not crawl_state["fingerprints"]:
+            print("[INFO] 증분 모드: 이전 결과/지문 없음 → 전체 수집")
+        elif runs + 1 >= INCREMENTAL_FULL_REFRESH_EVERY:
+            print(f"[INFO] 증분 모드: {INCREMENTAL_FULL_REFRESH_EVERY}회 주기 전체 재수집")
+        else:
+            # 직전 실행의 분류 입력 → 재사용·스트리밍 재수집 상품도 이번 카테고리로 재분류
+            for pid, inputs in (crawl_state.get("tag_inputs") or {}).items():
+                if pid in previous:
+                    previous[pid]["_tag_inputs"] = inputs
+            inc = {
+                "previous": previous,
+                "fingerprints": crawl_state["fingerprints"],
+                "list_meta": list_meta,
+                "carried": marks.carried,
+                "probed": {},  # 이어받은 상품 생존 확인 결과별 건수
+            }
+            print(f"[INFO] 증분 모드: 이전 {len(previous)}개 기준, 변경분만 상세 수집")
+    if stream:
+        if inc is not None:
+            print("[INFO] 스트리밍 상세: 이전 상품은 스펙·가격까지만 받고 FPS·게임 정보 재사용")
+        else:
+            # FPS 본문이 필요한 실행(전체 수집)에서는 끝까지 받아야 하므로 효과 없음
+            print("[INFO] 스트리밍 상세: 증분 모드 재수집에서만 사용 → 이번 실행은 전체 다운로드")
+            stream = False
+
+    limiter = HostRateLimiter(HOST_RATE_PER_SEC, burst=HOST_RATE_BURST)
+    _fetch_memo = FetchMemo()
+
+    def store(item_id, category, product, reused):
+        # 기록 스레드 전용 — all_products 쓰기는 여기서만
+        if product:
+            all_products[item_id] = product
+        if _archive is not None:
+            _archive.mark_item(item_id)
+        done = sum(pipeline.stats[k] for k in ("reused", "fetched", "failed"))
+        if done % 25 == 0:
+            safe_print(
+                f"  [상세] {done}건 처리 (수집 {len(all_products)}개, 대기 {pipeline.backlog}건)"
+            )
 
-        # 3단계: Recommend 페이지
-        recommend_data = collect_recommend_item_ids(session)
-        run_parallel_detail_fetch(
-            list(recommend_data.items()), all_products, "Recommend"
-        )
+    def prefilter(iid, cat):
+        # 수집기는 카드 메타를 list_meta에 기록한 뒤 emit → 여기서 바로 조회 가능
+        reason = list_prefilter_reason(list_meta.get(iid), cat)
+        if reason:
+            safe_print(f"    [목록 제외] {reason}: {iid} {list_meta[iid]['name'][:40]}")
+        return reason
+
+    def fetch_detail(iid, cat, pending=None):
+        if pending is None and inc is not None:
+            product = carried_reuse(iid, inc, _thread_local_session())
+            if product is not None:
+                return product
+        previous = inc["previous"].get(iid) if stream else None
+        return _fetch_product_detail_worker(iid, cat, fetcher, previous, pending)
+
+    def prefetch(iid, cat):
+        # 비동기 엔진: 대기열에 넣는 즉시 이벤트 루프에 다운로드 예약
+        # (스트리밍 재수집·이어받은 상품 생존 확인은 워커에서 처리)
+        if (stream and iid in inc["previous"]) or needs_liveness_probe(iid, inc):
+            return None
+        return fetcher.submit(product_url(iid))
+
+    pipeline = DetailPipeline(
+        fetch_detail,
+        # 비동기 엔진의 워커는 파싱(프로세스 풀 대기)과 스트리밍 재수집만 담당 — 다운로드 동시성은
+        # AsyncPageFetcher.per_host가 정함
+        workers=max(MAX_WORKERS, parse_workers) if fetcher else MAX_WORKERS,
+        on_result=store,
+        shortcut=(lambda iid, cat: reusable_product(iid, inc)) if inc is not None else None,
+        queue_size=DETAIL_QUEUE_SIZE,
+        skip=prefilter,
+        prefetch=prefetch if fetcher else None,
+    )
+
+    try:
+        # 발견과 상세 수집을 겹쳐 실행: 수집기가 페이지마다 ID를 emit → 워커가 즉시 상세 처리
+        with pipeline:
+            # --discovery bulk: 전체 ID 일괄 열거를 먼저 → 구성원 변화가 없으면 목록·발견 요청을 줄임
+            bulk = None
+            known_dynamic = None
+            if discovery == "bulk":
+                bulk = run_bulk_enumeration(session, list_meta, limiter, crawl_state)
+                if bulk is not None and bulk["determined"] and not marks.full_sweep:
+                    known_dynamic = crawl_state.get("dynamic_categories")
+            alive = bulk["alive"] if bulk is not None and bulk["determined"] else None
+
+            # 1~3단계: 동적 카테고리 / 메인 / Installment / Recommend
+            discovered = run_discovery(
+                list_meta, limiter, emit=pipeline.emit, marks=marks, bulk=bulk,
+                known_dynamic=known_dynamic,
+            )
+            dynamic_categories = discovered["dynamic"]
+            merged_categories = []
+            seen_keys = set()
+            for cat in (CATEGORIES + dynamic_categories):
+                key = category_key(cat)
+                if key in seen_keys:
+                    continue
+                seen_keys.add(key)
+                merged_categories.append(cat)
+
+            print(
+                f"[INFO] 고정 카테고리 {len(CATEGORIES)}개 + 동적 카테고리 {len(dynamic_categories)}개"
+                + (" (직전 실행 목록 재사용, 2차 확장 생략)" if known_dynamic is not None else "")
+            )
 
-        # 4단계: 카테고리 Selenium 수집
-        if driver:
+            # 4단계: 카테고리 수집 (HTTP 우선, 일괄 열거로 변화 없음이 확인되면 워터마크로 대신)
+            selenium_fallback = []
             for cat in merged_categories:
-                ids = get_item_ids_from_category(driver, cat)
+                key = category_key(cat)
+                ids = _assumed_ids(marks, key, alive)
+                if ids is not None:
+                    pipeline.emit(ids, cat)
+                    safe_print(f"  [{cat['name']}] {len(ids)}개 (일괄 열거 — 목록 생략)")
+                    marks.update(key, ids)
+                    continue
+                ids = get_item_ids_from_category_http(
+                    session, cat, list_meta, limiter, emit=pipeline.emit, marks=marks
+                )
                 safe_print(f"  [{cat['name']}] {len(ids)}개 발견")
-                run_parallel_detail_fetch(
-                    [(iid, cat) for iid in ids], all_products, cat["name"]
+                marks.update(key, ids)
+                if not ids:
+                    selenium_fallback.append(cat)
+
+            # 5단계: HTTP 0건 카테고리만 Selenium 드라이버 풀로 병렬 수집
+            if selenium_fallback and SELENIUM_AVAILABLE:
+                safe_print(
+                    f"[INFO] Selenium 폴백 {len(selenium_fallback)}개 카테고리 "
+                    f"(drivers={SELENIUM_POOL_SIZE}, recycle={SELENIUM_RECYCLE_PAGES}p)"
                 )
+                with DriverPool(
+                    create_driver, size=SELENIUM_POOL_SIZE, recycle_after=SELENIUM_RECYCLE_PAGES
+                ) as pool:
+                    for cat, ids in pool.map(
+                        lambda slot, c: get_item_ids_from_category(
+                            slot, c, list_meta, emit=pipeline.emit, marks=marks
+                        ),
+                        selenium_fallback,
+                    ):
+                        if isinstance(ids, Exception):
+                            safe_print(f"  [ERROR] [{cat['name']}] Selenium 수집 실패: {ids}")
+                            continue
+                        safe_print(f"  [{cat['name']}] {len(ids)}개 발견 (Selenium)")
+                        marks.update(category_key(cat), ids)
+                    safe_print(f"[INFO] 드라이버 재생성 {pool.recycled}회")
+
+            safe_print(f"[INFO] 목록 수집 완료, 남은 상세 {pipeline.backlog}건 처리 대기")
 
     finally:
-        if driver:
-            driver.quit()
+        if fetcher:
+            fetcher.close()
+        if _parse_pool is not None:
+            _parse_pool.shutdown()
+            _parse_pool = None
+
+    st = pipeline.stats
+    safe_print(
+        f"[INFO] 상세 파이프라인: 요청 {st['queued']} / 수집 {st['fetched']} / "
+        f"제외·실패 {st['failed']} / 재사용 {st['reused']} / 목록 단계 제외 {st['skipped']}"
+    )
+    safe_print(f"[INFO] URL 메모: {_fetch_memo.summary()}")
+    safe_print(f"[INFO] 목록 워터마크 {marks.summary()}")
+    _fetch_memo = None  # 목록 응답 본문 해제
+    # 이번 실행에서 발견된 카테고리(게임별/브랜드별/Recommend/메인)를 합쳐 games/usage/뱃지 재계산
+    # (상세 파싱은 처음 emit한 카테고리로 실행되고, 증분 재사용 상품은 직전 실행 분류를 갖고 있음 —
+    #  파싱 결과에 합치지 않고 카테고리 무관 입력에서 다시 분류)
+    multi = reclassified = kept = 0
+    for iid, product in all_products.items():
+        categories = pipeline.categories.get(iid, {})
+        if not categories:
+            continue
+        multi += len(categories) > 1
+        category = merged_category(categories.values())
+        if apply_category_tags(product, category):
+            reclassified += 1
+        else:
+            kept += 1
+        if _archive is not None and len(categories) > 1:
+            _archive.set_item_category(iid, category)
+    safe_print(
+        f"[INFO] 카테고리 재분류 {reclassified}개 (여러 카테고리에서 발견 {multi}개, "
+        f"분류 입력 없는 증분 재사용 {kept}개는 직전 분류 유지)"
+    )
 
     products_list = list(all_products.values())
     safe_print(f"\n총 {len(products_list)}개 제품 수집 완료")
+    if _response_cache is not None:
+        safe_print(f"[INFO] 응답 캐시: {_response_cache.summary()}")
+    if _archive is not None:
+        _archive.save()
+        removed = _archive.prune()
+        safe_print(f"[INFO] 원문 보관소: {_archive.summary()}, 이전 본문 정리 {removed}개")
+    SPEC_CATALOG.save()
+    safe_print(f"[INFO] 스펙 카탈로그: {SPEC_CATALOG.summary()}")
+    if inc is not None:
+        probed = inc["probed"]
+        reused = st["reused"] + probed.get("alive", 0)
+        safe_print(
+            f"[INFO] 증분 모드: 재사용 {reused}개 / 상세 재수집 {len(products_list) - reused}개"
+        )
+        if probed:
+            detail = ", ".join(f"{k} {v}" for k, v in sorted(probed.items()))
+            safe_print(
+                f"[INFO] 이어받은 상품 생존 확인 {sum(probed.values())}건 ({detail}) "
+                f"→ alive만 재사용, 나머지는 상세 수집"
+            )
 
     if len(products_list) == 0:
         print("[WARNING] 수집된 상품이 없습니다. 기존 데이터를 유지합니다.")
         return
 
+    fingerprints = {}
+    for pid in all_products:
+        # 워터마크로 이어받아 이번에 카드를 못 본 상품은 직전 지문 유지
+        fp = list_fingerprint(list_meta.get(pid)) or crawl_state["fingerprints"].get(pid)
+        if fp:
+            fingerprints[pid] = fp
+    save_crawl_state(
+        {
+            "runs_since_full": crawl_state.get("runs_since_full", 0) + 1 if inc is not None else 0,
+            "updated_at": datetime.now(timezone(timedelta(hours=9))).isoformat(),
+            "fingerprints": fingerprints,
+            "tag_inputs": {
+                pid: p["_tag_inputs"] for pid, p in all_products.items() if p.get("_tag_inputs")
+            },
+            **marks.state(),
+            "dynamic_categories": dynamic_categories,
+            # 일괄 열거를 하지 않은 실행은 직전 열거 결과를 비교 기준으로 유지
+            **(
+                {"bulk_source": bulk["source"], "bulk_ids": bulk["ids"]} if bulk is not None
+                else {k: crawl_state[k] for k in ("bulk_source", "bulk_ids") if k in crawl_state}
+            ),
+        }
+    )
+
     soldout_slice = []
     for p in products_list:
         if p.get("in_stock") is False:
@@ -1214,27 +2003,246 @@ def main():
         update_soldout_log(soldout_slice)
         safe_print(f"[INFO] 품절/보류 로그 {len(soldout_slice)}건 기록 → {SOLDOUT_LOG_PATH}")
 
+    write_products_json(products_list)
+
+
+def write_products_json(products_list, out_path=None):
     output = {
         "last_updated": datetime.now(timezone(timedelta(hours=9))).isoformat(),
         "_note": "crawl_products.py v2에 의해 자동 생성됩니다.",
-        "products": products_list,
+        "products": [{k: v for k, v in p.items() if k != "_tag_inputs"} for p in products_list],
     }
-    out_path = Path(OUTPUT_PRODUCTS)
+    out_path = Path(out_path or OUTPUT_PRODUCTS)
     out_path.parent.mkdir(parents=True, exist_ok=True)
     with open(out_path, "w", encoding="utf-8") as f:
         json.dump(output, f, ensure_ascii=False, indent=2)
     print(f"[저장 완료] {out_path} ({len(products_list)}개)")
 
 
+def _reparse_item(job):
+    """reparse 워커: 보관소에서 본문을 직접 읽어 파싱 (큰 HTML을 프로세스 간에 넘기지 않음)."""
+    root, item_id, entry = job
+    try:
+        page = entry_page(entry, read_blob(root, entry["sha256"]))
+    except (OSError, EOFError):
+        safe_print(f"    [reparse] 본문 없음: {item_id}")
+        return None, None
+    return _parse_in_process(item_id, entry["category"], page)
+
+
+def reparse(parse_workers=PARSE_PROCESSES, latest_run=True, out_path=None):
+    """
+    원문 보관소만으로 pc_data.json 재생성 (네트워크 요청 없음).
+    파싱 규칙 변경 후 현재 parse_product_page()를 보관된 상세 HTML에 다시 적용한다.
+    latest_run=False면 마지막 실행 대상이 아닌 보관 상품까지 전부 재파싱.
+    """
+    archive = HtmlArchive()
+    item_ids = archive.item_ids(latest_run=latest_run)
+    print(f"[reparse] 보관소 {archive.root} → 상품 {len(item_ids)}개 재파싱")
+    if not item_ids:
+        print("[WARNING] 보관된 상세 페이지가 없습니다. 크롤러를 먼저 실행하세요.")
+        return
+
+    jobs = [(str(archive.root), iid, archive.index["items"][iid]) for iid in item_ids]
+    started = time.perf_counter()
+    products = {}
+    if parse_workers > 0 and len(jobs) > 1:
+        with ProcessPoolExecutor(
+            max_workers=parse_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            results = pool.map(_reparse_item, jobs, chunksize=16)
+            for (_, iid, _), (product, catalog_new) in zip(jobs, results):
+                SPEC_CATALOG.merge(catalog_new)
+                if product:
+                    products[iid] = product
+    else:
+        for job in jobs:
+            product, _ = _reparse_item(job)
+            if product:
+                products[job[1]] = product
+    SPEC_CATALOG.save()
+
+    elapsed = time.perf_counter() - started
+    safe_print(f"[reparse] {len(products)}개 생성 / {len(jobs)}개 중 / {elapsed:.1f}초")
+    if not products:
+        print("[WARNING] 재파싱 결과가 없습니다. 기존 데이터를 유지합니다.")
+        return
+    write_products_json(list(products.values()), out_path)
+
+
+def _load_json(path, default):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def probe(out_path=None):
+    """
+    품절 로그(soldout_log.json)의 미복원 상품 + 직전 실행 상품(pc_data.json)의 생존 확인 (liveness.py).
+      - 품절 로그 상품이 alive → 재입고 후보 (관리자 페이지 표시, api/revive-product.js가 복원 시 제거)
+      - 직전 실행 상품이 soldout/gone → 이탈 후보 (다음 크롤링 전에 품절 확인용)
+    error(판단 보류)인 상품은 이전 판정 유지. 결과가 바뀔 때만 파일을 다시 씀 (주기 실행 시 불필요한 커밋 방지).
+    """
+    out_path = Path(out_path or REVIVE_CANDIDATES_PATH)
+    log = _load_json(SOLDOUT_LOG_PATH, {})
+    soldout = {
+        str(p["id"]): p
+        for p in log.get("soldout") or []
+        if p.get("id") is not None and not p.get("revived")
+    }
+    previous = load_previous_products()
+    urls = {iid: product_url(iid) for iid in [*soldout, *previous]}
+    print(f"[probe] 품절 로그 {len(soldout)}개 + 직전 실행 {len(previous)}개 확인")
+    if not urls:
+        return
+
+    started = time.perf_counter()
+    limiter = HostRateLimiter(PROBE_RATE_PER_SEC, burst=PROBE_WORKERS)
+    results = probe_many(_thread_local_session, urls, limiter=limiter)
+    counts = {}
+    for r in results.values():
+        counts[r["status"]] = counts.get(r["status"], 0) + 1
+
+    prev_state = _load_json(out_path, {})
+    prev_candidates = {str(c["id"]): c for c in prev_state.get("candidates") or []}
+    prev_gone = {str(c["id"]): c for c in prev_state.get("gone") or []}
+    now = datetime.now(timezone(timedelta(hours=9))).isoformat()
+
+    candidates = []
+    for iid, entry in soldout.items():
+        status = results[iid]["status"]
+        if status == "alive" or (status == "error" and iid in prev_candidates):
+            kept = prev_candidates.get(iid, {})
+            candidates.append(
+                {
+                    "id": iid,
+                    "name": entry.get("name", ""),
+                    "price": entry.get("price", 0),
+                    "tier": entry.get("tier", ""),
+                    "soldout_at": entry.get("soldout_at", ""),
+                    "detected_at": kept.get("detected_at", now),
+                }
+            )
+    gone = []
+    for iid, product in previous.items():
+        if iid in soldout:
+            continue
+        r = results[iid]
+        if r["status"] in ("soldout", "gone") or (r["status"] == "error" and iid in prev_gone):
+            kept = prev_gone.get(iid, {})
+            gone.append(
+                {
+                    "id": iid,
+                    "name": product.get("name", ""),
+                    "status": r["status"] if r["status"] != "error" else kept.get("status", ""),
+                    "location": r["location"] or kept.get("location", ""),
+                    "detected_at": kept.get("detected_at", now),
+                }
+            )
+
+    elapsed = time.perf_counter() - started
+    summary = " / ".join(f"{k} {v}" for k, v in sorted(counts.items()))
+    safe_print(
+        f"[probe] {len(results)}건 {elapsed:.1f}초 ({summary}) → 재입고 후보 {len(candidates)}개, "
+        f"이탈 {len(gone)}개"
+    )
+    state = {"candidates": candidates, "gone": gone}
+    if state == {"candidates": prev_state.get("candidates"), "gone": prev_state.get("gone")}:
+        print(f"[probe] 변경 없음 → {out_path} 유지")
+        return
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    print(f"[probe] 저장 → {out_path}")
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="영재컴퓨터 제품 크롤러 v2")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["crawl", "reparse", "probe"],
+        default="crawl",
+        help=(
+            "crawl: 쇼핑몰 크롤링(기본), reparse: 원문 보관소만으로 pc_data.json 재생성, "
+            "probe: 품절 로그·직전 실행 상품 생존 확인 → data/revive_candidates.json"
+        ),
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="크롤링 없이 인자/임포트만 확인하고 종료",
     )
+    parser.add_argument(
+        "--engine",
+        choices=["thread", "async"],
+        default="thread",
+        help="상세 페이지 다운로드 엔진 (thread: requests 4워커, async: aiohttp 호스트당 동시 요청)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="상세 페이지 디스크 캐시(.cache/http) 미사용 — 항상 전체 다운로드",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "직전 pc_data.json 재사용: 목록(이름·가격·썸네일) 지문이 바뀐 상품만 상세 수집 "
+            f"({INCREMENTAL_FULL_REFRESH_EVERY}회마다 전체 재수집)"
+        ),
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=PARSE_PROCESSES,
+        help=f"상세 HTML 파싱 프로세스 수 (기본 {PARSE_PROCESSES}, 0이면 다운로드 스레드에서 파싱)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "--incremental 재수집 상품은 상세를 스트리밍으로 받아 스펙·가격이 잡히면 연결 종료 "
+            "(FPS·게임 정보는 직전 결과 재사용)"
+        ),
+    )
+    parser.add_argument(
+        "--discovery",
+        choices=["category", "bulk"],
+        default="category",
+        help=(
+            "목록 발견 방식 (category: 카테고리별 목록 순회, bulk: 사이트맵/EP 피드/전체 목록으로 ID 일괄 열거 후 "
+            "직전 실행 대비 새 상품이 없으면 카테고리 목록 생략)"
+        ),
+    )
+    parser.add_argument(
+        "--no-archive",
+        action="store_true",
+        help="받은 상세/목록 HTML을 원문 보관소(.cache/archive)에 저장하지 않음",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="reparse: 마지막 크롤링 대상뿐 아니라 보관된 상품 전체 재파싱",
+    )
     cli_args = parser.parse_args()
     if cli_args.dry_run:
         print("[dry-run] OK (네트워크·Selenium 미실행)")
         sys.exit(0)
-    main()
+    if cli_args.command == "probe":
+        probe()
+        sys.exit(0)
+    if cli_args.command == "reparse":
+        reparse(parse_workers=cli_args.parse_workers, latest_run=not cli_args.all)
+        sys.exit(0)
+    main(
+        engine=cli_args.engine,
+        use_cache=not cli_args.no_cache,
+        incremental=cli_args.incremental,
+        parse_workers=cli_args.parse_workers,
+        archive=not cli_args.no_archive,
+        stream=cli_args.stream,
+        discovery=cli_args.discovery,
+    )
@@ -0,0 +1,378 @@
+"""
+detail_extract.py - 상품 상세 페이지 단일 패스 추출기 (lxml/XPath)
+
+parse_product_page()가 BeautifulSoup으로 하던 문서 탐색을 미리 컴파일한 XPath로 대체한다.
+  - 본문 텍스트: 문서 전체 get_text()를 한 번만 만든다 (script/style/template 제외 — bs4와 동일)
+  - 제목(<title>) / 첫 <h2> / 품절 클래스 / 구매 버튼 문구
+  - 스펙 블록: 라벨 길이 이하의 짧은 div만 XPath로 골라 라벨 비교 (모든 div 순회 없음)
+    → CPU/VGA가 없을 때만 table > tr 백업 파싱
+  - 구조화 가격·재고: 페이지에 심긴 기계용 필드를 속성 조회로 읽음 (본문 정규식 없음)
+      숨은 입력(it_price / it_stock_qty), 선택 옵션 값("옵션,추가금액,재고"),
+      메타 태그(product:price:amount / availability, itemprop), JSON-LD offers
+    → 없으면 None — crawl_products.py가 본문 문구 휴리스틱으로 판단
+  - HeadWatcher: 스트리밍 다운로드용 증분 파서 — 청크를 넣다가 스펙 블록(CPU·VGA 값)이
+    닫히면 알려 주고, 그때까지 만들어진 부분 문서의 본문 텍스트를 돌려준다
+    (stock_seen: 재고 필드·구매 문구를 감싼 상품 폼(<form>)이 닫혔는지 — 품절 표시·재고확인 배너도
+     그 폼 안에 있으므로 잘린 본문의 재고 판단이 전체 본문과 같아지는 시점. 폼 밖 근거뿐이면 끝까지 받음)
+
+결과는 DetailPage 하나로 묶어 반환하고, 가격·분류 등 나머지 로직은 crawl_products.py가 그대로 처리.
+
+사용:
+    doc = extract_detail(page_html)
+    doc.title, doc.h2, doc.text, doc.soldout_class, doc.has_buy_text, doc.specs_raw
+    doc.structured_price, doc.structured_in_stock
+
+    watcher = HeadWatcher()
+    for chunk in resp.iter_content(16384):
+        if watcher.feed(chunk) and watcher.stock_seen and price_found(watcher.text()):
+            break   # 나머지(상세 이미지·스크립트·FPS 표)는 받지 않음
+"""
+
+import json
+import re
+
+from lxml import etree
+
+# 상세 스펙 라벨 (div 구조) — "쿨러/튜닝" → 쿨러, "조립/AS" → 조립 으로 합침
+SPEC_KEYS = frozenset(
+    {"CPU", "RAM", "VGA", "SSD", "HDD", "케이스", "파워", "쿨러", "쿨러/튜닝", "메인보드", "S/W", "조립/AS", "조립"}
+)
+# 백업 table 파싱에서 찾는 라벨 (순서 유지)
+TABLE_SPEC_KEYS = ("CPU", "RAM", "VGA", "SSD", "HDD", "케이스", "파워", "쿨러", "메인보드")
+
+_WHITESPACE = " \t\r\n "
+_MAX_LABEL = max(len(k) for k in SPEC_KEYS)
+_NS = {"re": "http://exslt.org/regular-expressions"}
+
+# bs4 get_text()와 같은 범위: script/style/template 안의 문자열은 제외
+_VISIBLE_TEXT = etree.XPath(
+    ".//text()[not(ancestor::script) and not(ancestor::style) and not(ancestor::template)]"
+)
+_TITLE = etree.XPath("(//title)[1]")
+_FIRST_H2 = etree.XPath("(//h2)[1]")
+# class 속성에 sold?out / it_soldout (bs4처럼 토큰·속성 전체 문자열 모두 검사)
+_SOLDOUT_CLASS = etree.XPath(
+    r"boolean(//*[re:test(@class, 'sold.?out|it_soldout', 'i')])", namespaces=_NS
+)
+# bs4 find(string=...)는 주석 문자열까지 검사 — 같은 범위로 맞춤
+_BUY_TEXT = etree.XPath(
+    "boolean((//text() | //comment())[re:test(., '구매|장바구니', 'i')])", namespaces=_NS
+)
+_SPEC_WORD = etree.XPath(
+    "boolean((//text() | //comment())[re:test(., 'CPU|VGA|RAM|SSD', 'i')])", namespaces=_NS
+)
+# 공백을 모두 지워도 라벨 최대 길이 이하인 div만 후보 (라벨 div는 짧은 텍스트 하나뿐)
+_SPEC_LABEL_DIVS = etree.XPath(
+    f"//div[string-length(translate(string(.), '{_WHITESPACE}', '')) <= {_MAX_LABEL}]"
+)
+# 구조화 가격·재고 필드 (영카트 상품 폼 숨은 입력 / 옵션 select / 메타 / JSON-LD)
+_HIDDEN_PRICE = etree.XPath(
+    "//input[@id='it_price' or @name='it_price' or @name='it_price[]']/@value"
+)
+_HIDDEN_STOCK = etree.XPath(
+    "//input[@id='it_stock_qty' or @name='it_stock_qty' or @name='it_stock_qty[]']/@value"
+)
+# 옵션 값 "옵션명,추가금액,재고수량" (첫 빈 값 option은 "선택" 안내)
+_OPTION_VALUES = etree.XPath(
+    "//select[starts-with(@id, 'it_option_') or contains(@class, 'it_option')]/option[@value != '']/@value"
+)
+_META_PRICE = etree.XPath(
+    "//meta[@property='product:price:amount' or @property='og:price:amount' or @itemprop='price']/@content"
+)
+_META_AVAILABILITY = etree.XPath(
+    "//meta[@property='product:availability' or @property='og:availability' or @itemprop='availability']/@content"
+    " | //link[@itemprop='availability']/@href"
+)
+_JSON_LD = etree.XPath("//script[@type='application/ld+json']/text()")
+_BUY_WORD = re.compile("구매|장바구니", re.I)
+_STOCK_INPUT_NAMES = ("it_stock_qty", "it_stock_qty[]")
+_AVAILABILITY_PROPS = ("product:availability", "og:availability")
+_DIGITS = re.compile(r"[^\d]")
+_IN_STOCK_WORDS = ("instock", "in stock", "limitedavailability", "preorder", "onlineonly")
+_OUT_OF_STOCK_WORDS = ("outofstock", "out of stock", "oos", "soldout", "sold out", "discontinued")
+_TABLES = etree.XPath("//table")
+_ROWS = etree.XPath(".//tr")
+_CELLS = etree.XPath(".//td | .//th")
+_BRAND_PREFIX = re.compile(r"^\[[^\]]*\]")
+
+_PARSER = etree.HTMLParser(encoding="utf-8")
+
+
+def get_text(el, strip=False):
+    """bs4 Tag.get_text() / get_text(strip=True) 와 같은 결과."""
+    parts = _VISIBLE_TEXT(el)
+    if strip:
+        return "".join(s.strip() for s in parts)
+    return "".join(parts)
+
+
+def _to_int(value):
+    """"1,290,000원" / 1290000.0 → 1290000 (숫자가 없으면 None)."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    digits = _DIGITS.sub("", str(value or "").split(".")[0])
+    return int(digits) if digits else None
+
+
+def _availability(value):
+    """schema.org / og availability 값 → True(재고) / False(품절) / None(판단 불가)."""
+    word = str(value or "").rsplit("/", 1)[-1].strip().lower()
+    if word in _OUT_OF_STOCK_WORDS:
+        return False
+    if word in _IN_STOCK_WORDS:
+        return True
+    return None
+
+
+def _json_ld_offers(texts):
+    """JSON-LD 블록들에서 offers 항목 (Product 한 건 또는 @graph 안)."""
+    for text in texts:
+        try:
+            data = json.loads(text)
+        except ValueError:
+            continue
+        stack = data if isinstance(data, list) else [data]
+        while stack:
+            node = stack.pop(0)
+            if not isinstance(node, dict):
+                continue
+            stack.extend(node.get("@graph") or [])
+            offers = node.get("offers")
+            for offer in offers if isinstance(offers, list) else [offers]:
+                if isinstance(offer, dict):
+                    yield offer
+
+
+def _next_element(el):
+    """bs4 find_next_sibling(): 다음 형제 태그 (주석/처리명령 건너뜀)."""
+    for sib in el.itersiblings():
+        if isinstance(sib.tag, str):
+            return sib
+    return None
+
+
+class DetailPage:
+    """상세 페이지 1건의 추출 결과. 모든 필드는 생성 시 한 번만 계산."""
+
+    def __init__(self, root):
+        self._root = root
+        if root is None:
+            self.title = ""
+            self.h2 = None
+            self.text = ""
+            self.soldout_class = False
+            self.has_buy_text = False
+            self.specs_raw = {}
+            self.structured_price = None
+            self.structured_in_stock = None
+            return
+        title = _TITLE(root)
+        self.title = get_text(title[0], strip=True) if title else ""
+        h2 = _FIRST_H2(root)
+        self.h2 = get_text(h2[0], strip=True) if h2 else None
+        self.text = get_text(root)
+        self.soldout_class = _SOLDOUT_CLASS(root)
+        self.has_buy_text = _BUY_TEXT(root)
+        self.specs_raw = self._specs()
+        self.structured_price, self.structured_in_stock = self._structured()
+
+    def has_spec_word(self):
+        """본문 어딘가에 CPU/VGA/RAM/SSD 문자열이 있는지 (PC 판별 최종 확인용)."""
+        return self._root is not None and _SPEC_WORD(self._root)
+
+    def _structured(self):
+        """페이지에 심긴 가격·재고 필드 → (가격 또는 None, 재고 True/False 또는 None). 먼저 찾은 출처 우선."""
+        root = self._root
+        price = None
+        in_stock = None
+
+        # 1) 상품 폼 숨은 입력
+        for value in _HIDDEN_PRICE(root):
+            price = _to_int(value)
+            if price:
+                break
+        stock_values = [_to_int(v) for v in _HIDDEN_STOCK(root)]
+        stock_values = [v for v in stock_values if v is not None]
+        if stock_values:
+            in_stock = max(stock_values) > 0
+
+        # 2) 선택 옵션: 재고 칸이 있는 옵션이 하나라도 있으면 그 합계로 판단
+        if in_stock is None:
+            option_stock = [
+                _to_int(parts[2])
+                for parts in (value.split(",") for value in _OPTION_VALUES(root))
+                if len(parts) >= 3
+            ]
+            option_stock = [v for v in option_stock if v is not None]
+            if option_stock:
+                in_stock = sum(option_stock) > 0
+
+        # 3) 메타 태그
+        if not price:
+            for value in _META_PRICE(root):
+                price = _to_int(value)
+                if price:
+                    break
+        if in_stock is None:
+            for value in _META_AVAILABILITY(root):
+                in_stock = _availability(value)
+                if in_stock is not None:
+                    break
+
+        # 4) JSON-LD offers (스크립트 블록이 있을 때만 JSON 파싱)
+        if not price or in_stock is None:
+            texts = _JSON_LD(root)
+            for offer in _json_ld_offers(texts) if texts else ():
+                if not price:
+                    price = _to_int(offer.get("price") or offer.get("lowPrice"))
+                if in_stock is None:
+                    in_stock = _availability(offer.get("availability"))
+                if price and in_stock is not None:
+                    break
+
+        return price or None, in_stock
+
+    def _specs(self):
+        specs = {}
+        # 1차: div 구조 (라벨 div + 다음 형제 div 값)
+        # 네비게이션 메뉴와 구분: 값이 "[브랜드]모델명" 형식이거나 15자 이상만 유효
+        for div in _SPEC_LABEL_DIVS(self._root):
+            label = get_text(div, strip=True)
+            if label not in SPEC_KEYS:
+                continue
+            key = "쿨러" if "쿨러" in label else ("조립" if "조립" in label else label)
+            if key in specs:
+                continue
+            nxt = _next_element(div)
+            if nxt is None:
+                continue
+            raw_val = get_text(nxt, strip=True)
+            clean = _BRAND_PREFIX.sub("", raw_val).strip()
+            if clean and (len(clean) >= 15 or raw_val.startswith("[")):
+                specs[key] = clean
+
+        # 2차: table > tr > td 구조 (백업)
+        if specs.get("CPU") and specs.get("VGA"):
+            return specs
+        for table in _TABLES(self._root):
+            for row in _ROWS(table):
+                cells = _CELLS(row)
+                if len(cells) < 2:
+                    continue
+                label = get_text(cells[0], strip=True)
+                if label not in TABLE_SPEC_KEYS or label in specs:
+                    continue
+                value = get_text(cells[1], strip=True)
+                # 중복 텍스트 제거 (텍스트가 2번 반복되는 경우)
+                if len(value) > 10:
+                    half = len(value) // 2
+                    if value[:half] == value[half:]:
+                        value = value[:half]
+                specs[label] = value[:60]
+            if specs.get("CPU") and specs.get("VGA"):
+                break
+        return specs
+
+
+class HeadWatcher:
+    """
+    상세 HTML 청크를 lxml 증분 파서(HTMLPullParser)에 넣으며 스펙 블록 완료를 감시.
+    라벨(CPU/VGA) 요소 바로 뒤 형제 요소가 닫히면 그 라벨의 값이 잡힌 것으로 본다
+    (div 구조: _specs()와 같은 값 조건 / table 구조: 같은 행의 다음 칸).
+    """
+
+    _REQUIRED = frozenset({"CPU", "VGA"})
+
+    def __init__(self):
+        self._parser = etree.HTMLPullParser(events=("start", "end"), encoding="utf-8")
+        self._root = None
+        self.labels = set()
+        self.structured_price = None
+        self.stock_seen = False
+        self._stock_form = None  # 재고 근거를 감싼 상품 폼 (닫히면 stock_seen)
+        self.bytes = 0
+
+    def feed(self, chunk):
+        """청크 추가 → CPU·VGA 값이 모두 잡혔으면 True."""
+        self.bytes += len(chunk)
+        self._parser.feed(chunk)
+        for event, el in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = el
+                continue
+            tag = el.tag
+            if not self.stock_seen:
+                if self._stock_form is not None:
+                    if el is self._stock_form:
+                        self.stock_seen = True
+                elif self._stock_block(el):
+                    # 폼이 없으면 None 유지 → 다음 근거에서 다시 찾고, 끝내 없으면 끝까지 받음
+                    self._stock_form = next(el.iterancestors("form"), None)
+            if tag == "input":
+                if not self.structured_price and (
+                    el.get("id") == "it_price" or el.get("name") in ("it_price", "it_price[]")
+                ):
+                    self.structured_price = _to_int(el.get("value"))
+                continue
+            if tag not in ("div", "td", "th"):
+                continue
+            prev = el.getprevious()
+            if prev is None or len(prev) > 2:
+                continue
+            label = get_text(prev, strip=True)
+            if label not in self._REQUIRED or label in self.labels:
+                continue
+            raw_val = get_text(el, strip=True)
+            if tag == "div":
+                clean = _BRAND_PREFIX.sub("", raw_val).strip()
+                if clean and (len(clean) >= 15 or raw_val.startswith("[")):
+                    self.labels.add(label)
+            elif raw_val:
+                self.labels.add(label)
+        return self.spec_complete
+
+    @staticmethod
+    def _stock_block(el):
+        """
+        재고 판단 근거인지: 구조화 재고 필드(숨은 입력·재고 칸 있는 옵션·availability 메타)
+        또는 구매 문구. 구매 문구가 한 번 나오면 전체 본문에서도 has_buy_text가 참이므로
+        품절 키워드 휴리스틱 결과가 전체 다운로드와 같아진다.
+        """
+        tag = el.tag
+        if tag == "input":
+            return el.get("id") == "it_stock_qty" or el.get("name") in _STOCK_INPUT_NAMES
+        if tag == "option":
+            parent = el.getparent()
+            return (
+                parent is not None
+                and (parent.get("id", "").startswith("it_option_") or "it_option" in parent.get("class", ""))
+                and len((el.get("value") or "").split(",")) >= 3
+            )
+        if tag == "meta":
+            return el.get("property") in _AVAILABILITY_PROPS or el.get("itemprop") == "availability"
+        if tag == "link":
+            return el.get("itemprop") == "availability"
+        if tag in ("script", "style", "template"):
+            return False
+        return bool(el.text and _BUY_WORD.search(el.text))
+
+    @property
+    def spec_complete(self):
+        return self._REQUIRED <= self.labels
+
+    def text(self):
+        """지금까지 받은 부분 문서의 본문 텍스트 (DetailPage.text와 같은 규칙)."""
+        return get_text(self._root) if self._root is not None else ""
+
+    def title(self):
+        title = _TITLE(self._root) if self._root is not None else []
+        return get_text(title[0], strip=True) if title else ""
+
+
+def extract_detail(page_html):
+    """상세 페이지 HTML(str 또는 bytes) → DetailPage."""
+    if isinstance(page_html, str):
+        page_html = page_html.encode("utf-8")
+    root = etree.fromstring(page_html, _PARSER) if page_html.strip() else None
+    return DetailPage(root)
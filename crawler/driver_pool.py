@@ -0,0 +1,166 @@
+"""
+driver_pool.py - 헤드리스 Chrome 드라이버 풀 (카테고리 병렬 수집용)
+
+  - N개의 드라이버가 카테고리를 동시에 처리 (스레드당 드라이버 1개)
+  - 페이지 대기: 고정 sleep 대신 DOM ready + 네트워크 정숙 구간(quiet window)
+    · 진행 중인 XHR/Fetch가 없고
+    · 상품 이미지 요청(Network.requestWillBeSent)이 quiet초 동안 새로 없으면 완료
+  - 드라이버당 K페이지마다 재생성해 메모리 누적 방지
+  - marker 지정 시 performance 로그를 문자열 단계에서 걸러 필요한 이벤트만 json 파싱
+
+사용:
+    with DriverPool(create_driver, size=3, recycle_after=40) as pool:
+        for category, result in pool.map(work, categories):
+            ...
+    # work(slot, category): slot.open(url) 로 페이지 이동 (재생성은 풀이 처리)
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+class PooledDriver:
+    """스레드 하나가 독점하는 드라이버 핸들. recycle_after 페이지마다 새 드라이버로 교체."""
+
+    def __init__(self, factory, recycle_after):
+        self._factory = factory
+        self.recycle_after = recycle_after
+        self.driver = None
+        self.pages = 0
+        self.recycled = 0
+
+    def open(self, url):
+        if self.driver is None or self.pages >= self.recycle_after:
+            self._recycle()
+        self.driver.get(url)
+        self.pages += 1
+        return self.driver
+
+    def _recycle(self):
+        if self.driver is not None:
+            self.quit()
+            self.recycled += 1
+        self.driver = self._factory()
+        self.pages = 0
+
+    def quit(self):
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self.driver = None
+
+
+class DriverPool:
+    def __init__(self, factory, size=3, recycle_after=40):
+        self._factory = factory
+        self.size = size
+        self.recycle_after = recycle_after
+        self._local = threading.local()
+        self._slots = []
+        self._slots_lock = threading.Lock()
+
+    def _slot(self):
+        slot = getattr(self._local, "slot", None)
+        if slot is None:
+            slot = PooledDriver(self._factory, self.recycle_after)
+            self._local.slot = slot
+            with self._slots_lock:
+                self._slots.append(slot)
+        return slot
+
+    def _run(self, func, item):
+        return func(self._slot(), item)
+
+    def map(self, func, items):
+        """func(slot, item)를 풀에서 병렬 실행. 완료 순으로 (item, 결과 또는 예외) 반환."""
+        with ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="selenium") as ex:
+            future_to_item = {ex.submit(self._run, func, item): item for item in items}
+            for future in as_completed(future_to_item):
+                item = future_to_item[future]
+                try:
+                    yield item, future.result()
+                except Exception as e:
+                    yield item, e
+
+    @property
+    def recycled(self):
+        return sum(slot.recycled for slot in self._slots)
+
+    def close(self):
+        for slot in self._slots:
+            slot.quit()
+        self._slots = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def wait_for_network_quiet(driver, url_pattern, quiet=0.6, timeout=10.0, poll=0.1, marker=None):
+    """
+    DOM ready 이후 performance 로그를 폴링하며 url_pattern에 맞는 요청 URL을 모음.
+    진행 중인 XHR/Fetch가 없고 quiet초 동안 새 매칭 요청이 없으면 반환 (최대 timeout초).
+
+    marker: 요청 URL에 반드시 들어가는 부분 문자열 (예: "/data/item/").
+    지정하면 원문 로그 문자열로 먼저 걸러, 대상 이미지 요청과 XHR/Fetch 이벤트만 json 파싱.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            state = driver.execute_script("return document.readyState")
+        except Exception:
+            state = "complete"
+        if state in ("interactive", "complete"):
+            break
+        time.sleep(poll)
+
+    matched = set()
+    pending = set()
+    last_activity = time.monotonic()
+    while time.monotonic() < deadline:
+        try:
+            entries = driver.get_log("performance")
+        except Exception:
+            entries = []
+        for entry in entries:
+            raw = entry.get("message", "")
+            if marker is not None and not _worth_parsing(raw, marker, pending):
+                continue
+            try:
+                msg = json.loads(raw)["message"]
+            except Exception:
+                continue
+            method = msg.get("method")
+            params = msg.get("params", {})
+            if method == "Network.requestWillBeSent":
+                if params.get("type") in ("XHR", "Fetch"):
+                    pending.add(params.get("requestId"))
+                    last_activity = time.monotonic()
+                req_url = params.get("request", {}).get("url", "")
+                if url_pattern.search(req_url) and req_url not in matched:
+                    matched.add(req_url)
+                    last_activity = time.monotonic()
+            elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                if params.get("requestId") in pending:
+                    pending.discard(params.get("requestId"))
+                    last_activity = time.monotonic()
+        if not pending and time.monotonic() - last_activity >= quiet:
+            break
+        time.sleep(poll)
+    return matched
+
+
+def _worth_parsing(raw, marker, pending):
+    """json.loads 전 문자열 검사: 대상 요청 / XHR·Fetch 시작 / 대기 중 요청의 종료만 통과."""
+    if "Network.requestWillBeSent" in raw:
+        return marker in raw or '"XHR"' in raw or '"Fetch"' in raw
+    if "Network.loadingFinished" in raw or "Network.loadingFailed" in raw:
+        return any(rid in raw for rid in pending)
+    return False
@@ -0,0 +1,88 @@
+"""
+fetch_memo.py - 실행 범위 URL 메모 (같은 요청은 한 번만)
+
+한 번의 크롤링 동안 여러 수집기가 같은 페이지를 요청한다
+(메인/샵 메인/list.php?ca_id=h0 은 동적 카테고리 탐색과 메인 수집이 모두 읽고,
+ 동적 카테고리 2차 확장이 읽은 목록 1페이지는 카테고리 수집이 다시 읽음).
+요청 키(메서드, URL, 본문)별로
+  - 처음 호출한 스레드만 실제로 요청하고, 그 사이 들어온 같은 요청은 결과를 기다려 공유 (coalesced)
+  - 이후 같은 요청은 메모리의 응답을 바로 반환 (hits)
+실패한 요청은 기다리던 호출에 같은 예외를 전달하고 메모에서 빼서, 이후 호출이 다시 시도하게 한다.
+저장한 본문 합계가 max_bytes를 넘으면 새 응답은 보관하지 않는다 (동시 요청 합치기는 계속).
+
+사용:
+    memo = FetchMemo()
+    html = memo.fetch(("GET", url), lambda: session.get(url, timeout=15).text)
+    memo.summary()
+"""
+
+import threading
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class _Slot:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class FetchMemo:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._slots = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+        # requests: 실제 요청 수, hits: 메모리 응답 재사용, coalesced: 진행 중 요청에 합류
+        self.stats = {"requests": 0, "hits": 0, "coalesced": 0}
+
+    def fetch(self, key, load):
+        """key의 응답 문자열. 처음이면 load()로 받고, 진행 중이면 그 결과를 기다림."""
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._slots[key] = _Slot()
+                self.stats["requests"] += 1
+                owner = True
+            else:
+                self.stats["hits" if slot.done.is_set() else "coalesced"] += 1
+                owner = False
+
+        if not owner:
+            slot.done.wait()
+            if slot.error is not None:
+                raise slot.error
+            return slot.value
+
+        try:
+            slot.value = load()
+        except Exception as e:
+            slot.error = e
+            with self._lock:
+                self._slots.pop(key, None)
+            raise
+        finally:
+            slot.done.set()
+
+        with self._lock:
+            size = len(slot.value or "")
+            if self._bytes + size > self.max_bytes:
+                # 기다리던 호출은 이미 slot을 잡고 있음 — 이후 호출만 다시 요청
+                self._slots.pop(key, None)
+            else:
+                self._bytes += size
+        return slot.value
+
+    @property
+    def saved(self):
+        return self.stats["hits"] + self.stats["coalesced"]
+
+    def summary(self):
+        st = self.stats
+        return (
+            f"요청 {st['requests']}건 / 메모 재사용 {st['hits']}건 / 동시 요청 합침 {st['coalesced']}건 "
+            f"(절약 {self.saved}건, 보관 {self._bytes / 1024 / 1024:.1f}MB)"
+        )
@@ -0,0 +1,223 @@
+"""
+game_fps.py - 게임/FPS 문맥 단일 패스 추출기 (크롤러 · scripts/enrich_game_fps.py · scripts/verify_live_fps.py 공용)
+
+상세 본문을 공백 압축 + 대문자로 한 번 바꾼 뒤 정규식 하나로 훑어 세 종류의 토큰을 순서대로 얻는다.
+  - 게임: GAME_KEYWORD_MAP 키워드 + GAME_FPS_ALIAS_MAP 별칭 (가장 긴 표기 우선)
+  - FPS: "144 FPS" / "60프레임"
+  - 해상도: FHD / QHD / 4K
+이 토큰 목록 하나로 두 결과를 함께 만든다.
+  - FPS 문맥 게임: 게임 키워드 전후 FPS_CONTEXT_WINDOW 글자 안에 FPS 숫자가 있으면 그 게임
+                   (필터 중복 노출용 — tag_inputs에서 사용)
+  - game_fps: "[해상도] 게임 … 숫자 FPS" (게임 뒤 숫자 없는 GAME_FPS_GAP 글자 이내)
+              해상도가 앞에 없으면 일치 구간 전후 RESOLUTION_WINDOW 글자 안에서 찾음
+
+모든 거리는 공백을 한 칸으로 압축한 텍스트 기준이다.
+
+사용:
+    fps_games, game_fps = scan_game_fps(name, page_text)
+"""
+
+import re
+from bisect import bisect_left
+
+from config import GAME_KEYWORD_MAP
+from keyword_index import keyword_pattern
+
+FPS_CONTEXT_WINDOW = 80  # 게임 키워드 전후 몇 글자 안에 FPS 숫자가 있으면 동일 문맥으로 봄
+GAME_FPS_GAP = 18        # 게임명과 FPS 숫자 사이 허용 글자 수 (숫자 없이)
+RESOLUTION_WINDOW = 16   # 해상도 표기가 게임명 앞에 없을 때 찾는 범위
+FPS_RANGE = (20, 1000)
+
+GAME_FPS_ALIAS_MAP = {
+    "리그오브레전드": ["리그오브레전드", "LOL", "롤"],
+    "배틀그라운드": ["배틀그라운드", "배그", "PUBG"],
+    "로스트아크": ["로스트아크", "로아"],
+    "발로란트": ["발로란트", "발로"],
+    "오버워치2": ["오버워치2", "오버워치"],
+    "아이온2": ["아이온2", "아이온 2"],
+    "디아블로4": ["디아블로4", "디아4"],
+    "디아블로2": ["디아블로2", "디아2"],
+    "붉은사막": ["붉은사막"],
+    "몬스터헌터 와일드": ["몬스터헌터 와일드", "몬스터헌터", "몬헌", "와일즈"],
+    "플심": ["플심", "플라이트 시뮬레이터", "MSFS"],
+    "아크레이더스": ["아크레이더스"],
+    "연운": ["연운"],
+}
+
+
+def _key(text):
+    return re.sub(r"\s+", "", text).upper()
+
+
+_ALIASES = [alias for aliases in GAME_FPS_ALIAS_MAP.values() for alias in aliases]
+_ALIAS_GAME = {_key(alias): game for game, aliases in GAME_FPS_ALIAS_MAP.items() for alias in aliases}
+_CONTEXT_KEYWORDS = {_key(kw): (kw.upper(), game) for game, kws in GAME_KEYWORD_MAP.items() for kw in kws}
+# 게임 토큰 키 → (game_fps 게임 또는 None, 토큰 안의 GAME_KEYWORD_MAP 키워드 [(표기, 게임)])
+# 긴 토큰이 가린 짧은 키워드도 포함 ("몬스터헌터 와일드" → "몬스터헌터")
+_GAME_TOKENS = {
+    key: (
+        _ALIAS_GAME.get(key),
+        tuple(spelled for kw, spelled in _CONTEXT_KEYWORDS.items() if kw in key),
+    )
+    for key in {**_ALIAS_GAME, **_CONTEXT_KEYWORDS}
+}
+_GAME_SPELLINGS = [*_ALIASES, *(kw for kws in GAME_KEYWORD_MAP.values() for kw in kws)]
+# 토큰 첫 글자 집합을 앞에 두면 re가 후보 위치만 시도 (없으면 위치마다 세 갈래를 모두 시도해 3~4배 느림)
+_FIRST_CHARS = re.escape("".join(sorted({kw.upper()[0] for kw in _GAME_SPELLINGS} | set("FQ4"))))
+_TOKEN_PATTERN = re.compile(
+    rf"(?=[\d{_FIRST_CHARS}])(?:"
+    r"(?P<fps>(?P<num>\d{2,4})\s*(?:FPS|프레임))"
+    r"|(?P<res>FHD|QHD|4K)"
+    rf"|(?P<game>{keyword_pattern(_GAME_SPELLINGS)}))"
+)
+_FPS_AT = re.compile(r"(\d{2,4})\s*(?:FPS|프레임)")
+# 공백 압축 기준 글자 수 세기: 공백 묶음은 한 글자
+_GAP_UNITS = re.compile(rf"(?:\s+|[^\d\s]){{0,{GAME_FPS_GAP}}}")
+_WINDOW_UNITS = re.compile(rf"(?:\s+|\S){{0,{RESOLUTION_WINDOW}}}")
+_MIN_UNITS = re.compile(r"\s*(?:\S\s*){5}")
+
+
+def normalize_text_compact(text):
+    return re.sub(r"\s+", " ", str(text or "")).strip()
+
+
+def build_game_fps_highlight(game, fps, resolution=None):
+    fps_label = f"{int(fps)} FPS"
+    if resolution:
+        return f"{resolution} {game} {fps_label}"
+    return f"{game} {fps_label}"
+
+
+def should_replace_game_fps(existing, candidate):
+    if not existing:
+        return True
+    if not existing.get("resolution") and candidate.get("resolution"):
+        return True
+    if existing.get("source") != "detail" and candidate.get("source") == "detail":
+        return True
+    return False
+
+
+class _Tokens:
+    """텍스트 1건(대문자)의 토큰 목록 — 종류별 위치 순."""
+
+    def __init__(self, raw_text):
+        self.text = text = str(raw_text or "").upper()
+        self.games = []  # (start, end, alias_game, [(kw_start, kw_end, context_game)])
+        self.fps = []    # (start, num_end, end) — FPS 문맥 판정용
+        self.res = []    # (start, end, resolution)
+        for m in _TOKEN_PATTERN.finditer(text):
+            kind = m.lastgroup
+            if kind == "fps":
+                self.fps.append((m.start(), m.end("num"), m.end()))
+            elif kind == "res":
+                self.res.append((m.start(), m.end(), m.group()))
+            else:
+                raw = m.group()
+                tags = _GAME_TOKENS.get(_key(raw))
+                if tags is None:
+                    continue
+                game, keywords = tags
+                start = m.start()
+                # 키워드별 위치 (FPS 문맥 창은 키워드 자체의 앞뒤 기준)
+                context = []
+                for spelled, context_game in keywords:
+                    pos = raw.find(spelled)
+                    if pos < 0:
+                        context.append((start, m.end(), context_game))
+                    else:
+                        context.append((start + pos, start + pos + len(spelled), context_game))
+                self.games.append((start, m.end(), game, context))
+        # FPS 숫자가 창 안에 온전히 들어오는지 판정용: 숫자 끝 두 자리의 시작 위치
+        self._fps_tail = [num_end - 2 for _, num_end, _ in self.fps]
+        self._res_start = [start for start, _, _ in self.res]
+
+    def has_min_length(self):
+        """공백 압축 후 5글자 이상인지."""
+        return _MIN_UNITS.match(self.text) is not None
+
+    def context_games(self):
+        """게임 키워드 전후 FPS_CONTEXT_WINDOW 글자(원문 기준) 안에 FPS 숫자가 있는 게임."""
+        found = set()
+        for _, _, _, context in self.games:
+            for start, end, game in context:
+                if game in found:
+                    continue
+                i = bisect_left(self._fps_tail, start - FPS_CONTEXT_WINDOW)
+                if i < len(self.fps) and self.fps[i][2] <= end + FPS_CONTEXT_WINDOW:
+                    found.add(game)
+        return found
+
+    def _resolution_near(self, match_start, match_end):
+        """일치 구간 전후 RESOLUTION_WINDOW 글자(공백 압축 기준) 안의 첫 해상도 표기."""
+        window_end = _WINDOW_UNITS.match(self.text, match_end).end()
+        k = bisect_left(self._res_start, match_start)
+        # 앞쪽 후보는 가까운 것부터 — 창 밖이 나오면 그보다 앞은 모두 창 밖
+        while k > 0 and _WINDOW_UNITS.match(self.text, self.res[k - 1][0]).end() >= match_start:
+            k -= 1
+        if k < len(self.res) and self.res[k][1] <= window_end:
+            return self.res[k][2]
+        return None
+
+    def game_fps(self):
+        """"[해상도] 게임 … 숫자 FPS" 일치 목록 → (게임, fps, 해상도). 일치 구간은 겹치지 않음."""
+        text = self.text
+        consumed = 0
+        for start, end, game, _ in self.games:
+            if game is None or start < consumed:
+                continue
+            # 게임명 뒤 숫자 없는 GAME_FPS_GAP 글자 이내에서 시작하는 "2~4자리 + FPS/프레임"
+            fps_match = _FPS_AT.match(text, _GAP_UNITS.match(text, end).end())
+            if fps_match is None:
+                continue
+            fps, fps_end = int(fps_match.group(1)), fps_match.end()
+
+            # 게임명 바로 앞(공백만 사이)의 해상도 표기
+            match_start, resolution = start, None
+            j = bisect_left(self._res_start, start) - 1
+            if j >= 0:
+                res_start, res_end, res = self.res[j]
+                if res_start >= consumed and not text[res_end:start].strip():
+                    match_start, resolution = res_start, res
+            consumed = fps_end
+
+            if not FPS_RANGE[0] <= fps <= FPS_RANGE[1]:
+                continue
+            if resolution is None:
+                resolution = self._resolution_near(match_start, fps_end)
+            yield game, fps, resolution
+
+
+def scan_game_fps(name, page_text):
+    """상품명/상세 본문 → (FPS 문맥 게임 집합, game_fps 맵). 본문은 한 번만 토큰화."""
+    extracted = {}
+    fps_games = set()
+    for source_name, raw_text in (("name", name), ("detail", page_text)):
+        tokens = _Tokens(raw_text)
+        if source_name == "detail" and len(page_text or "") >= 20:
+            fps_games = tokens.context_games()
+        if not tokens.has_min_length():
+            continue
+        for game, fps, resolution in tokens.game_fps():
+            candidate = {
+                "fps": fps,
+                "resolution": resolution,
+                "label": game,
+                "highlight": build_game_fps_highlight(game, fps, resolution),
+                "source": source_name,
+            }
+            if should_replace_game_fps(extracted.get(game), candidate):
+                extracted[game] = candidate
+    return fps_games, extracted
+
+
+def extract_games_from_fps_section(page_text):
+    """상세 페이지 본문에서 '게임 키워드 + FPS/프레임' 문맥이 있는 게임명을 수집."""
+    if not page_text or len(page_text) < 20:
+        return set()
+    return _Tokens(page_text).context_games()
+
+
+def extract_game_fps_map(name, page_text):
+    """상품명/상세 본문에서 실제 제공 게임 FPS를 추출."""
+    return scan_game_fps(name, page_text)[1]
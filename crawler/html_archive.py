@@ -0,0 +1,196 @@
+"""
+html_archive.py - 수집한 원문 HTML 보관소 (내용 주소 방식) + 오프라인 재파싱용 인덱스
+
+크롤러가 받은 상품 상세(item.php) / 목록(list.php, Installment, recommendPC 등) HTML을
+본문 sha256을 이름으로 gzip 저장한다. 같은 본문은 한 번만 저장된다.
+
+  - 본문: .cache/archive/blobs/{sha[:2]}/{sha}.html.gz
+  - 인덱스: .cache/archive/index.json
+      items: it_id → 최신 blob (sha256, url, final_url, status, category, fetched_at)
+      lists: 목록 요청 키("GET url" / "POST url") → 최신 blob
+      latest_run: 마지막 크롤링에서 상세를 처리한 it_id 목록 (reparse 기본 대상)
+
+파싱 규칙(short_cpu, extract_game_fps_map, 가격 라벨 등)을 바꾼 뒤에는
+    python crawl_products.py reparse
+로 쇼핑몰 요청 없이 보관된 HTML만으로 pc_data.json을 다시 만든다.
+
+환경변수:
+    YJMOD_HTML_ARCHIVE_DIR - 보관소 위치, 기본 프로젝트 루트 .cache/archive
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+ARCHIVE_DIR = Path(
+    os.environ.get(
+        "YJMOD_HTML_ARCHIVE_DIR",
+        Path(__file__).resolve().parent.parent / ".cache" / "archive",
+    )
+)
+
+
+def _now():
+    return datetime.now(timezone(timedelta(hours=9))).isoformat()
+
+
+def _write_atomic(path, data):
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def read_blob(root, sha):
+    """보관소 root의 본문 sha → HTML 문자열 (인덱스 없이 읽기 — 재파싱 워커 프로세스용)."""
+    path = Path(root) / "blobs" / sha[:2] / f"{sha}.html.gz"
+    return gzip.decompress(path.read_bytes()).decode("utf-8", errors="replace")
+
+
+def entry_page(entry, text):
+    """인덱스 항목 + 본문 → 크롤러 fetch 결과와 같은 page dict."""
+    return {
+        "url": entry["url"],
+        "final_url": entry["final_url"],
+        "status": entry["status"],
+        "text": text,
+    }
+
+
+class HtmlArchive:
+    """본문 sha256 기준 HTML 보관소. put_*는 스레드 간 공유 가능, 인덱스는 save()에서 기록."""
+
+    def __init__(self, root=ARCHIVE_DIR):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self.index = self._load_index()
+        self._run_items = {}  # 이번 실행에서 저장한 it_id (순서 유지)
+        # stored: 새 본문 저장, dedup: 이미 있는 본문
+        self.stats = {"stored": 0, "dedup": 0}
+
+    @property
+    def index_path(self):
+        return self.root / "index.json"
+
+    def _load_index(self):
+        try:
+            index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            index = {}
+        index.setdefault("items", {})
+        index.setdefault("lists", {})
+        index.setdefault("latest_run", [])
+        return index
+
+    def _blob_path(self, sha):
+        return self.root / "blobs" / sha[:2] / f"{sha}.html.gz"
+
+    # ── 저장 ──
+    def put_blob(self, text):
+        """본문 저장 후 sha256 반환 (이미 있으면 쓰지 않음)."""
+        body = (text or "").encode("utf-8")
+        sha = hashlib.sha256(body).hexdigest()
+        path = self._blob_path(sha)
+        if path.exists():
+            key = "dedup"
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomic(path, gzip.compress(body, compresslevel=6))
+            key = "stored"
+        with self._lock:
+            self.stats[key] += 1
+        return sha
+
+    def put_item(self, item_id, category, page):
+        """상세 페이지(page dict) 저장. 리다이렉트/오류 응답도 그대로 남겨 재파싱 결과를 맞춤."""
+        sha = self.put_blob(page.get("text"))
+        entry = {
+            "sha256": sha,
+            "url": page.get("url"),
+            "final_url": page.get("final_url"),
+            "status": page.get("status"),
+            "category": {
+                "name": category.get("name", ""),
+                "games": list(category.get("games", [])),
+                "usage": list(category.get("usage", [])),
+            },
+            "fetched_at": _now(),
+        }
+        with self._lock:
+            self.index["items"][item_id] = entry
+
+    def set_item_category(self, item_id, category):
+        """여러 카테고리에서 발견된 상품: 재파싱이 같은 태그를 쓰도록 합친 카테고리로 교체."""
+        with self._lock:
+            entry = self.index["items"].get(item_id)
+            if entry is not None:
+                entry["category"] = {
+                    "name": category.get("name", ""),
+                    "games": list(category.get("games", [])),
+                    "usage": list(category.get("usage", [])),
+                }
+
+    def mark_item(self, item_id):
+        """이번 실행 대상으로 기록 (결과 기록 순서 = pc_data.json 순서). 증분 재사용 상품은 보관된 최신 본문 사용."""
+        with self._lock:
+            if item_id in self.index["items"]:
+                self._run_items[item_id] = None
+
+    def put_list(self, key, html):
+        """목록 응답 저장. key: "GET url" / "POST url" 형식."""
+        sha = self.put_blob(html)
+        with self._lock:
+            self.index["lists"][key] = {"sha256": sha, "fetched_at": _now()}
+
+    def save(self):
+        """인덱스 기록. 이번 실행에서 상세를 저장했다면 latest_run을 갱신."""
+        with self._lock:
+            if self._run_items:
+                self.index["latest_run"] = list(self._run_items)
+            self.index["updated_at"] = _now()
+            data = json.dumps(self.index, ensure_ascii=False).encode("utf-8")
+        self.root.mkdir(parents=True, exist_ok=True)
+        _write_atomic(self.index_path, data)
+
+    def prune(self):
+        """인덱스가 더 이상 가리키지 않는 본문 삭제 (키마다 최신 본문만 유지). 삭제 수 반환."""
+        with self._lock:
+            live = {e["sha256"] for e in self.index["items"].values()}
+            live.update(e["sha256"] for e in self.index["lists"].values())
+        removed = 0
+        for path in (self.root / "blobs").glob("*/*.html.gz"):
+            if path.name[: -len(".html.gz")] not in live:
+                path.unlink()
+                removed += 1
+        return removed
+
+    # ── 조회 ──
+    def get_blob(self, sha):
+        return read_blob(self.root, sha)
+
+    def item_page(self, item_id):
+        """it_id의 최신 상세 페이지 → (page dict, category) 또는 (None, None)."""
+        entry = self.index["items"].get(item_id)
+        if entry is None:
+            return None, None
+        try:
+            text = self.get_blob(entry["sha256"])
+        except (OSError, EOFError):
+            return None, None
+        return entry_page(entry, text), entry["category"]
+
+    def item_ids(self, latest_run=True):
+        """재파싱 대상: 기본은 마지막 크롤링 대상, latest_run=False면 보관된 전체."""
+        if latest_run and self.index["latest_run"]:
+            return [iid for iid in self.index["latest_run"] if iid in self.index["items"]]
+        return list(self.index["items"])
+
+    def summary(self):
+        s = self.stats
+        return (
+            f"새 본문 {s['stored']} / 중복 {s['dedup']} "
+            f"(상품 {len(self.index['items'])}개, 목록 {len(self.index['lists'])}개)"
+        )
@@ -0,0 +1,184 @@
+"""
+http_cache.py - 상품 상세 페이지 공유 디스크 캐시 (조건부 재검증)
+
+crawl_products.py / scripts/enrich_game_fps.py / scripts/verify_live_fps.py 가
+같은 item.php 페이지를 각자 다시 받지 않도록 URL 단위로 응답을 저장한다.
+
+  - 저장: .cache/http/{sha1(url)[:2]}/{sha1(url)}.json (메타) + .html.gz (본문)
+  - 메타: ETag / Last-Modified / 본문 sha256 / 마지막 확인 시각
+  - TTL 이내(기본 1시간, 한 번의 갱신 실행 동안): 네트워크 없이 캐시 반환
+  - TTL 경과: If-None-Match / If-Modified-Since 조건부 GET → 304면 캐시 본문 재사용
+  - 다른 페이지로 리다이렉트된 응답(품절)은 저장하지 않고 기존 항목도 삭제
+
+환경변수:
+    YJMOD_HTTP_CACHE_TTL  - TTL(초), 기본 3600
+    YJMOD_HTTP_CACHE_DIR  - 캐시 위치, 기본 프로젝트 루트 .cache/http
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+CACHE_DIR = Path(
+    os.environ.get(
+        "YJMOD_HTTP_CACHE_DIR",
+        Path(__file__).resolve().parent.parent / ".cache" / "http",
+    )
+)
+DEFAULT_TTL = int(os.environ.get("YJMOD_HTTP_CACHE_TTL", "3600"))
+
+
+def _url_key(url):
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+def _write_atomic(path, data):
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+class ResponseCache:
+    """URL → (메타, 본문) 디스크 캐시. 스레드 간 공유 가능."""
+
+    def __init__(self, root=CACHE_DIR, ttl=DEFAULT_TTL):
+        self.root = Path(root)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # fresh: TTL 이내 무요청, not_modified: 304, unchanged: 200이지만 본문 동일,
+        # changed: 200 + 본문 변경, miss: 캐시 없음
+        self.stats = {"fresh": 0, "not_modified": 0, "unchanged": 0, "changed": 0, "miss": 0}
+
+    # ── 저장소 ──
+    def _paths(self, url):
+        key = _url_key(url)
+        folder = self.root / key[:2]
+        return folder / f"{key}.json", folder / f"{key}.html.gz"
+
+    def load(self, url):
+        """캐시 항목(meta dict + "body" bytes) 또는 None."""
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = gzip.decompress(body_path.read_bytes())
+        except (OSError, ValueError, EOFError):
+            return None
+        if hashlib.sha256(body).hexdigest() != meta.get("sha256"):
+            return None
+        meta["body"] = body
+        return meta
+
+    def is_fresh(self, entry):
+        return entry is not None and time.time() - entry.get("checked_at", 0) < self.ttl
+
+    def conditional_headers(self, entry):
+        headers = {}
+        if entry is None:
+            return headers
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url, final_url, status, headers, body, previous=None):
+        """200 응답 저장. 리다이렉트/오류 응답은 저장하지 않고 기존 항목 삭제."""
+        if status != 200 or final_url != url:
+            self.drop(url)
+            return None
+        sha = hashlib.sha256(body).hexdigest()
+        meta = {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "sha256": sha,
+            "checked_at": time.time(),
+        }
+        meta_path, body_path = self._paths(url)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        if previous is None or previous.get("sha256") != sha:
+            _write_atomic(body_path, gzip.compress(body, compresslevel=6))
+        _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        meta["body"] = body
+        return meta
+
+    def touch(self, entry):
+        """304 재검증 성공 → 확인 시각만 갱신."""
+        entry["checked_at"] = time.time()
+        meta = {k: v for k, v in entry.items() if k != "body"}
+        meta_path, _ = self._paths(entry["url"])
+        _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        return entry
+
+    def drop(self, url):
+        for path in self._paths(url):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    # ── 조회 (requests / aiohttp 공통 흐름) ──
+    def lookup(self, url):
+        """(TTL 이내 page 또는 None, 캐시 항목). page가 있으면 요청 생략."""
+        entry = self.load(url)
+        if self.is_fresh(entry):
+            self._count("fresh")
+            return _entry_page(entry, changed=False), entry
+        return None, entry
+
+    def resolve(self, url, entry, final_url, status, headers, body):
+        """조건부 GET 응답을 캐시에 반영하고 page dict 반환 (304면 캐시 본문)."""
+        if status == 304 and entry is not None:
+            self._count("not_modified")
+            return _entry_page(self.touch(entry), changed=False)
+
+        stored = self.store(url, final_url, status, headers, body, entry)
+        if entry is None:
+            changed = True
+            self._count("miss")
+        else:
+            changed = stored is None or stored["sha256"] != entry.get("sha256")
+            self._count("changed" if changed else "unchanged")
+        return {
+            "url": url,
+            "final_url": final_url,
+            "status": status,
+            "text": body.decode("utf-8", errors="replace"),
+            "changed": changed,
+        }
+
+    def get(self, session, url, timeout=15):
+        """requests.Session 기반 조회. TTL 이내면 캐시, 아니면 조건부 GET."""
+        page, entry = self.lookup(url)
+        if page is not None:
+            return page
+        resp = session.get(url, timeout=timeout, headers=self.conditional_headers(entry))
+        return self.resolve(url, entry, resp.url, resp.status_code, resp.headers, resp.content)
+
+    def summary(self):
+        s = self.stats
+        saved = s["fresh"] + s["not_modified"]
+        return (
+            f"캐시 무요청 {s['fresh']} / 304 {s['not_modified']} / "
+            f"200 동일 {s['unchanged']} / 변경 {s['changed']} / 신규 {s['miss']} "
+            f"(전송 생략 {saved}건)"
+        )
+
+
+def _entry_page(entry, changed):
+    """캐시 항목 → fetch 결과와 같은 page dict."""
+    return {
+        "url": entry["url"],
+        "final_url": entry["url"],
+        "status": 200,
+        "text": entry["body"].decode("utf-8", errors="replace"),
+        "changed": changed,
+    }
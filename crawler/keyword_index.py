@@ -0,0 +1,123 @@
+"""
+keyword_index.py - 분류 키워드 자동자 (한 번 컴파일, 한 번 스캔으로 모든 적중 수집)
+
+티어/케이스 색상/제외/게임/용도 키워드를 (종류, 라벨)로 묶어 트라이 형태의 정규식 하나로 컴파일한다.
+  - 대소문자 무시(텍스트를 한 번 upper()), 키워드 안의 공백은 공백 유무 모두 허용
+    ("RTX 4070 Ti" ↔ "RTX4070TI")
+  - 같은 위치에서는 가장 긴 키워드가 우선 → "RTX 4070"이 "RTX 4070 Ti"를 가리지 않음
+  - 긴 키워드 적중은 그 안에 포함된 짧은 키워드 적중도 함께 기록 ("RTX 5070" → "RTX" 단서)
+    (두 적중의 경계에 걸쳐 겹치는 키워드는 생략 — 현재 키워드 목록에는 해당 없음)
+
+사용:
+    index = KeywordAutomaton({("tier", "하이엔드(4K)"): ["RTX 4070 Ti", ...], ...})
+    hits = index.scan(gpu_text)
+    hits.best("tier")      # 가장 긴 적중의 라벨
+    hits.labels("game")    # 적중한 라벨 집합
+"""
+
+import re
+
+
+def _normalize(keyword):
+    """비교용 키: 대문자 + 공백 제거."""
+    return re.sub(r"\s+", "", keyword).upper()
+
+
+def _trie_pattern(node):
+    """문자 트라이 → 정규식 (자식 먼저, 끝 표시는 선택 그룹으로 — 탐욕적으로 긴 쪽 우선)."""
+    terminal = "" in node
+    branches = []
+    for ch in sorted(k for k in node if k != ""):
+        token = r"\s*" if ch == " " else re.escape(ch)
+        branches.append(token + _trie_pattern(node[ch]))
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if terminal:
+        return "(?:" + body + ")?"
+    return body
+
+
+def keyword_pattern(keywords):
+    """키워드 목록 → 대문자 트라이 정규식 문자열 (키워드 안 공백은 \\s*). upper()한 텍스트에 사용."""
+    trie = {}
+    for kw in {re.sub(r"\s+", " ", kw.strip()).upper() for kw in keywords}:
+        node = trie
+        for ch in kw:
+            node = node.setdefault(ch, {})
+        node[""] = True
+    return _trie_pattern(trie)
+
+
+class KeywordHits:
+    """scan() 결과: 서로 다른 적중 표기마다 (첫 등장 순서, 정규화 길이, 라벨 목록)."""
+
+    def __init__(self, hits):
+        self._hits = hits  # [(order, length, [(kind, label), ...])]
+
+    def labels(self, kind):
+        return {label for _, _, tags in self._hits for k, label in tags if k == kind}
+
+    def has(self, kind, label=None):
+        return any(
+            k == kind and (label is None or lbl == label)
+            for _, _, tags in self._hits
+            for k, lbl in tags
+        )
+
+    def best(self, kind):
+        """kind 적중 중 가장 긴 키워드의 라벨 (길이가 같으면 앞쪽). 없으면 None."""
+        best = None
+        for order, length, tags in self._hits:
+            for k, label in tags:
+                if k != kind:
+                    continue
+                if best is None or length > best[0] or (length == best[0] and order < best[1]):
+                    best = (length, order, label)
+        return best[2] if best else None
+
+    def __bool__(self):
+        return bool(self._hits)
+
+
+class KeywordAutomaton:
+    """{(종류, 라벨): [키워드, ...]} → 단일 정규식 스캐너."""
+
+    def __init__(self, groups):
+        self._tags = {}  # 정규화 키워드 → [(kind, label)]
+        for (kind, label), keywords in groups.items():
+            for kw in keywords:
+                tags = self._tags.setdefault(_normalize(kw), [])
+                if (kind, label) not in tags:
+                    tags.append((kind, label))
+
+        # 긴 키워드 적중은 그 안에 든 짧은 키워드 적중을 포함 (매칭은 겹치지 않으므로)
+        self._implied = {
+            key: [other for other in self._tags if other != key and other in key]
+            for key in self._tags
+        }
+
+        # 대문자 리터럴로만 구성 → re가 첫 글자 집합으로 위치를 빠르게 건너뜀 (re.I보다 빠름)
+        self.pattern = re.compile(keyword_pattern(kw for kws in groups.values() for kw in kws))
+        # 적중 원문("RTX  4070TI" 등) → 정규화 키 (같은 표기가 반복되므로 재정규화 생략)
+        self._keys = {}
+
+    def _key(self, raw):
+        key = self._keys.get(raw)
+        if key is None:
+            key = self._keys[raw] = _normalize(raw)
+        return key
+
+    def scan(self, text):
+        # findall + 첫 등장 순서 중복 제거는 C 수준 → 파이썬 루프는 서로 다른 표기 수만큼만
+        hits = []
+        tags_of = self._tags
+        for order, raw in enumerate(dict.fromkeys(self.pattern.findall((text or "").upper()))):
+            key = self._key(raw)
+            tags = tags_of.get(key)
+            if not tags:
+                continue
+            hits.append((order, len(key), tags))
+            for inner in self._implied[key]:
+                hits.append((order, len(inner), tags_of[inner]))
+        return KeywordHits(hits)
@@ -0,0 +1,83 @@
+"""
+list_watermark.py - 카테고리 목록 워터마크 (직전 실행에서 본 상품 ID)
+
+카테고리 목록은 최신/인기순으로 정렬되어, 바뀐 상품은 앞 페이지에 나타난다.
+카테고리별로 직전 실행의 상품 ID 목록(워터마크)을 저장해 두고
+  - 페이지의 ID가 모두 워터마크에 있으면 그 뒤 페이지는 읽지 않고 종료
+    (조용한 카테고리는 1페이지 1회 요청으로 끝남)
+  - 읽지 않은 뒤 페이지의 상품은 워터마크 순서대로 이어받아(carry) 그대로 전달
+  - sweep_every회 실행마다 1회는 전체 순회 (워터마크 없이 끝 페이지까지 — 뒤 페이지 변경·삭제 반영)
+전체 순회 실행이나 워터마크가 없는 카테고리는 known()이 None → 기존처럼 끝까지 순회.
+
+상태는 crawl_state.json의 "list_watermarks" / "list_runs_since_sweep" 에 함께 저장한다.
+
+사용:
+    marks = ListWatermarks(crawl_state, sweep_every=8)
+    known = marks.known(key)             # None이면 전체 순회
+    carried = marks.carry(key, item_ids) # 종료 시 읽지 않은 뒤 페이지 ID
+    ids = marks.assume(key, alive)       # 일괄 열거로 변화 없음이 확인된 카테고리 (목록 요청 없음)
+    marks.update(key, ids)
+    crawl_state.update(marks.state())
+"""
+
+import threading
+
+
+class ListWatermarks:
+    def __init__(self, state, sweep_every):
+        self._marks = dict(state.get("list_watermarks") or {})
+        self.runs = state.get("list_runs_since_sweep", 0)
+        self.full_sweep = not self._marks or self.runs + 1 >= sweep_every
+        self.carried = set()  # 목록에서 보지 못하고 워터마크로 이어받은 ID (증분 재사용 판단용)
+        self._lock = threading.Lock()
+        # stopped: 워터마크로 일찍 끝낸 카테고리, pages: 읽은 목록 페이지,
+        # assumed: 일괄 열거(bulk_ids.py) 결과로 목록을 읽지 않은 카테고리
+        self.stats = {"stopped": 0, "pages": 0, "carried": 0, "assumed": 0}
+
+    def known(self, key):
+        """이번 실행에서 조기 종료 기준으로 쓸 ID 집합 (전체 순회·워터마크 없음이면 None)."""
+        if self.full_sweep or key not in self._marks:
+            return None
+        return set(self._marks[key])
+
+    def count_page(self):
+        with self._lock:
+            self.stats["pages"] += 1
+
+    def carry(self, key, item_ids):
+        """조기 종료: 워터마크 중 이번에 못 본 ID를 순서대로 반환하고 item_ids(dict)에 추가."""
+        rest = [iid for iid in self._marks.get(key, []) if iid not in item_ids]
+        item_ids.update(dict.fromkeys(rest))
+        with self._lock:
+            self.carried.update(rest)
+            self.stats["stopped"] += 1
+            self.stats["carried"] += len(rest)
+        return rest
+
+    def assume(self, key, alive):
+        """일괄 열거로 구성원 변화가 없다고 판단된 카테고리: 워터마크 중 alive에 있는 ID (목록 요청 없음)."""
+        ids = [iid for iid in self._marks.get(key, []) if iid in alive]
+        with self._lock:
+            self.carried.update(ids)
+            self.stats["assumed"] += 1
+        return ids
+
+    def update(self, key, ids):
+        """이번 실행에서 확인한 카테고리 ID 목록으로 교체 (0건이면 이전 워터마크 유지)."""
+        if ids:
+            with self._lock:
+                self._marks[key] = list(ids)
+
+    def state(self):
+        return {
+            "list_watermarks": self._marks,
+            "list_runs_since_sweep": 0 if self.full_sweep else self.runs + 1,
+        }
+
+    def summary(self):
+        st = self.stats
+        mode = "전체 순회" if self.full_sweep else f"조기 종료 {self.runs + 1}회째"
+        return (
+            f"{mode}: 목록 페이지 {st['pages']}건 / 조기 종료 카테고리 {st['stopped']}개 "
+            f"/ 이어받은 상품 {st['carried']}개 / 목록 생략 카테고리 {st['assumed']}개"
+        )
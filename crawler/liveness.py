@@ -0,0 +1,89 @@
+"""
+liveness.py - 상품 상세 페이지 생존 확인 (리다이렉트 비활성 + 앞부분만 읽기)
+
+전체 크롤링 없이 item.php?it_id=X 가 아직 판매 중인지 빠르게 판단한다.
+리다이렉트를 따라가지 않고 상태 코드 / Location 헤더 / 본문 앞 HEAD_BYTES 바이트만 읽고 연결을 닫는다.
+
+판정 (parse_product_page의 리다이렉트·품절 규칙과 같은 기준):
+  - alive:   200 이고 앞부분에 품절 표시가 없음 / 같은 상품(it_id=X)으로의 리다이렉트
+  - soldout: 다른 페이지로 리다이렉트 (품절 시 쇼핑몰이 목록·메인으로 보냄)
+             / 앞부분 <title>·h2 가 "품절" / 품절 클래스
+  - gone:    404·410 또는 "상품정보가 존재하지 않습니다" 류 alert 페이지
+  - error:   429·5xx·네트워크 오류 (판단 보류 — 다음 확인에서 다시 시도)
+
+사용:
+    with requests.Session() as session:
+        result = probe_item(session, "https://.../shop/item.php?it_id=123", "123")
+        result["status"], result["http_status"], result["location"]
+"""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+HEAD_BYTES = 8 * 1024  # <title>·h2·품절 표시가 들어 있는 앞부분만
+PROBE_WORKERS = 8
+
+_TITLE = re.compile(r"<title[^>]*>(.*?)</title>", re.I | re.S)
+_FIRST_H2 = re.compile(r"<h2[^>]*>(.*?)</h2>", re.I | re.S)
+_TAG = re.compile(r"<[^>]+>")
+_SOLDOUT_CLASS = re.compile(r"class=[\"'][^\"']*(?:sold.?out|it_soldout)", re.I)
+_MISSING_ITEM = re.compile(r"alert\(\s*['\"][^'\"]*(?:존재하지 않|없는 상품|판매가능한 상품이 아닙니다)")
+
+
+def _strip(fragment):
+    return _TAG.sub("", fragment or "").strip()
+
+
+def classify_head(item_id, status, location, head):
+    """(HTTP 상태, Location, 본문 앞부분 문자열) → alive / soldout / gone / error."""
+    if status in (301, 302, 303, 307, 308):
+        return "alive" if f"it_id={item_id}" in (location or "") else "soldout"
+    if status in (404, 410):
+        return "gone"
+    if status != 200:
+        return "error"
+    if _MISSING_ITEM.search(head):
+        return "gone"
+    title = _TITLE.search(head)
+    if title and "품절" in _strip(title.group(1)).split("|")[0]:
+        return "soldout"
+    h2 = _FIRST_H2.search(head)
+    if h2 and _strip(h2.group(1)) == "품절":
+        return "soldout"
+    if _SOLDOUT_CLASS.search(head):
+        return "soldout"
+    return "alive"
+
+
+def probe_item(session, url, item_id, timeout=10, limiter=None):
+    """상세 URL 1건 확인 → {"id", "status", "http_status", "location"}. 본문은 HEAD_BYTES까지만 읽음."""
+    if limiter is not None:
+        limiter.acquire(url)
+    try:
+        with session.get(url, timeout=timeout, allow_redirects=False, stream=True) as resp:
+            location = resp.headers.get("Location", "")
+            head = b""
+            if resp.status_code == 200:
+                for chunk in resp.iter_content(HEAD_BYTES):
+                    head += chunk
+                    if len(head) >= HEAD_BYTES:
+                        break
+            text = head.decode("utf-8", errors="replace")
+            return {
+                "id": item_id,
+                "status": classify_head(item_id, resp.status_code, location, text),
+                "http_status": resp.status_code,
+                "location": location,
+            }
+    except Exception as e:
+        return {"id": item_id, "status": "error", "http_status": 0, "location": "", "error": str(e)}
+
+
+def probe_many(make_session, urls, workers=PROBE_WORKERS, limiter=None):
+    """{item_id: url} → {item_id: 결과}. make_session()은 워커 스레드별 Session을 돌려줌."""
+    def run(item):
+        item_id, url = item
+        return probe_item(make_session(), url, item_id, limiter=limiter)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return {r["id"]: r for r in pool.map(run, urls.items())}
@@ -0,0 +1,139 @@
+"""
+pipeline.py - 발견 → 상세 수집 → 기록 스트리밍 파이프라인
+
+단계 사이 배리어 없이 흐르도록 세 부분으로 나눈다.
+  1. 생산자(발견 수집기): 페이지마다 찾은 (item_id, category)를 emit() → 제한 크기 대기열
+  2. 상세 워커 N개: 대기열에서 꺼내 즉시 다운로드·파싱 (배치 단위 대기 없음)
+  3. 기록 스레드 1개: 결과를 순서대로 on_result()에 전달 (all_products 쓰기는 여기서만)
+
+같은 item_id는 처음 emit된 한 번만 처리한다. 대신 emit된 모든 (item_id, category)를
+categories(item_id → {카테고리 이름: category})에 기록해, 수집이 끝난 뒤 여러 카테고리에서
+발견된 상품에 카테고리 태그 합집합을 적용할 수 있게 한다 (먼저 도착한 카테고리 순서에 무관).
+skip(item_id, category)가 참(제외 사유)을 돌려주면 상세 요청 없이 버린다 (목록 메타 사전 필터).
+버린 ID는 처리한 것으로 치지 않아, 다른 카테고리로 다시 emit되면 그 카테고리 기준으로 재판단한다
+(예: 메인 카드에서 가격 미달로 버린 할부 상품을 Installment 수집기가 emit → 통과).
+shortcut(item_id, category)가 상품을 돌려주면(증분 재사용 등) 워커를 거치지 않고 바로 기록.
+prefetch(item_id, category)가 있으면 대기열에 넣을 때 호출해 다운로드를 미리 시작하고(비동기 엔진의
+concurrent Future — 워커를 기다리지 않음), 워커는 process(item_id, category, pending)로 그 결과를 받아 파싱만 한다.
+동시 다운로드 수는 워커 스레드 수가 아니라 대기열 크기와 다운로드 엔진의 호스트별 상한이 정한다.
+
+사용:
+    with DetailPipeline(process, workers=4, on_result=store) as pipe:
+        collect_xxx(..., emit=pipe.emit)
+    # with 블록 종료 시 대기열이 비워질 때까지 기다림
+"""
+
+import queue
+import threading
+
+_STOP = object()
+
+
+class DetailPipeline:
+    def __init__(self, process, workers, on_result, shortcut=None, queue_size=200, skip=None,
+                 prefetch=None):
+        self._process = process
+        self._prefetch = prefetch
+        self.workers = workers
+        self._on_result = on_result
+        self._shortcut = shortcut
+        self._skip = skip
+        self._tasks = queue.Queue(maxsize=queue_size)
+        self._results = queue.Queue()
+        self._seen = set()
+        self._skipped = set()  # skip()으로 버린 ID (다른 카테고리로 다시 emit되면 재판단)
+        self.categories = {}  # item_id → {카테고리 이름: category} (emit 순서)
+        self._seen_lock = threading.Lock()
+        self._threads = []
+        self._writer = None
+        # queued: 워커로 보낸 수, reused: shortcut 처리, fetched: 상품 생성, failed: 제외/실패
+        # skipped: skip()으로 상세 요청 전에 버린 ID 수 (뒤에 다른 카테고리로 통과하면 빠짐)
+        self.stats = {"queued": 0, "reused": 0, "fetched": 0, "failed": 0, "skipped": 0}
+
+    def start(self):
+        for i in range(self.workers):
+            t = threading.Thread(target=self._work, name=f"detail-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        self._writer = threading.Thread(target=self._write, name="detail-writer", daemon=True)
+        self._writer.start()
+        return self
+
+    def emit(self, item_ids, category):
+        """생산자 API (스레드 안전). 처음 보는 ID만 처리, 대기열이 가득 차면 블록."""
+        for iid in item_ids:
+            with self._seen_lock:
+                self.categories.setdefault(iid, {}).setdefault(category.get("name", ""), category)
+                if iid in self._seen:
+                    continue
+                # 제외된 ID는 _seen에 넣지 않음 → 뒤에 다른 카테고리(할부 등)로 emit되면 그 카테고리로 재판단
+                # (판단을 잠금 안에서 해야 동시에 들어온 같은 ID가 판단 전에 중복으로 버려지지 않음)
+                if self._skip is not None and self._skip(iid, category):
+                    if iid not in self._skipped:
+                        self._skipped.add(iid)
+                        self.stats["skipped"] += 1
+                    continue
+                self._seen.add(iid)
+                if iid in self._skipped:
+                    self._skipped.discard(iid)
+                    self.stats["skipped"] -= 1
+            if self._shortcut is not None:
+                product = self._shortcut(iid, category)
+                if product is not None:
+                    self._results.put((iid, category, product, True))
+                    continue
+            with self._seen_lock:
+                self.stats["queued"] += 1
+            pending = self._prefetch(iid, category) if self._prefetch is not None else None
+            self._tasks.put((iid, category, pending))
+
+    def _work(self):
+        while True:
+            task = self._tasks.get()
+            if task is _STOP:
+                return
+            iid, category, pending = task
+            try:
+                if self._prefetch is not None:
+                    product = self._process(iid, category, pending)
+                else:
+                    product = self._process(iid, category)
+            except Exception:
+                product = None
+            self._results.put((iid, category, product, False))
+
+    def _write(self):
+        while True:
+            item = self._results.get()
+            if item is _STOP:
+                return
+            iid, category, product, reused = item
+            if reused:
+                self.stats["reused"] += 1
+            elif product:
+                self.stats["fetched"] += 1
+            else:
+                self.stats["failed"] += 1
+            self._on_result(iid, category, product, reused)
+
+    @property
+    def backlog(self):
+        return self._tasks.qsize()
+
+    def close(self):
+        """생산 종료: 남은 작업을 모두 처리한 뒤 워커·기록 스레드 종료."""
+        for _ in self._threads:
+            self._tasks.put(_STOP)
+        for t in self._threads:
+            t.join()
+        self._results.put(_STOP)
+        if self._writer is not None:
+            self._writer.join()
+        self._threads = []
+        self._writer = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,41 @@
+"""
+rate_limit.py - 호스트별 토큰 버킷 요청 속도 제한
+
+여러 수집기가 동시에 같은 쇼핑몰에 요청해도 호스트 전체 요청 속도는
+rate(초당 건수)를 넘지 않도록 한다. 수집기마다 두던 time.sleep() 대체.
+
+사용:
+    limiter = HostRateLimiter(rate=2.0, burst=2)
+    limiter.acquire(url)   # 토큰이 생길 때까지 대기
+    session.get(url)
+"""
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+class HostRateLimiter:
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._buckets = {}  # host → (남은 토큰, 마지막 갱신 시각)
+        self._lock = threading.Lock()
+        self.waited = 0.0   # acquire()에서 대기한 총 시간(초)
+        self.requests = 0
+
+    def acquire(self, url):
+        host = urlsplit(url).netloc
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, last = self._buckets.get(host, (float(self.burst), now))
+                tokens = min(float(self.burst), tokens + (now - last) * self.rate)
+                if tokens >= 1.0:
+                    self._buckets[host] = (tokens - 1.0, now)
+                    self.requests += 1
+                    return
+                wait = (1.0 - tokens) / self.rate
+                self._buckets[host] = (tokens, now)
+                self.waited += wait
+            time.sleep(wait)
@@ -0,0 +1,321 @@
+"""
+spec_catalog.py - CPU/GPU 스펙 문자열 정규화 카탈로그 (프로세스 내 메모 + 실행 간 영구 저장)
+
+상품 상세의 CPU/VGA 원문은 수백 개 상품에 비해 서로 다른 문자열이 수십 개뿐이다.
+원문 → 정규화 레코드를 한 번만 계산해 메모하고 .cache/spec_catalog.json에 저장해
+다음 실행(파서 프로세스 포함)은 정규식 없이 dict 조회로 끝낸다.
+
+  - GPU: short(RTX 5070 TI), key(fps_reference.json 키와 같으면 그 표기: RTX 5070 Ti),
+         tier, vendor(NVIDIA/AMD/Intel/내장), generation(RTX 50 / RX 9000), vram(GB)
+  - CPU: short(R5 9600X / i5-14400F), vendor(AMD/Intel), generation(라이젠 9000 / 인텔 14세대)
+
+레코드 계산 규칙(이 파일의 코드, GPU_TIER_MAP, fps_reference.json GPU 목록)이 바뀌면
+저장된 카탈로그는 버리고 다시 계산한다 (reparse도 바뀐 규칙으로 다시 계산됨).
+
+환경변수:
+    YJMOD_SPEC_CATALOG_PATH - 저장 위치, 기본 프로젝트 루트 .cache/spec_catalog.json
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+from config import GPU_TIER_MAP
+from keyword_index import KeywordAutomaton
+
+CATALOG_PATH = Path(
+    os.environ.get(
+        "YJMOD_SPEC_CATALOG_PATH",
+        Path(__file__).resolve().parent.parent / ".cache" / "spec_catalog.json",
+    )
+)
+FPS_REFERENCE_PATH = Path(__file__).resolve().parent.parent / "data" / "fps_reference.json"
+# 종류별 최대 보관 수 (오래 전에 추가된 것부터 제거)
+MAX_ENTRIES = 5000
+
+TIER_KEYWORDS = KeywordAutomaton({("tier", tier): kws for tier, kws in GPU_TIER_MAP.items()})
+DEFAULT_TIER = "가성비(FHD)"
+
+
+# ─── 상품명에서 짧은 CPU/GPU 이름 추출 ────────────────────────
+def short_cpu(cpu_full):
+    """AMD/인텔 CPU 전체 이름 → 짧은 모델명
+    예) AMD 라이젠5-6세대 9600X (그래나이트) → R5 9600X
+        코어 아이i5-14세대 14400F (이스트록) → i5-14400F
+    """
+    cpu = cpu_full.upper()
+
+    # AMD 라이젠
+    if "라이젠" in cpu_full or "RYZEN" in cpu:
+        # "라이젠7-6세대 9800X3D" → 세대 숫자를 건너뛰고 모델 번호 추출
+        m = re.search(r"라이젠\s*(\d+).*?(\d{4,5}(?:X3D|X|G|GE|GT)?)", cpu_full, re.I)
+        if m:
+            return f"R{m.group(1)} {m.group(2)}"
+
+    # 인텔 코어 (한국어 표기: "코어 아이i5-14세대 14400F")
+    if "코어" in cpu_full or "CORE" in cpu or "INTEL" in cpu:
+        # 한국어: "코어 아이i5-14세대 14400F" 형식
+        m = re.search(r"i(\d)-\d+세대\s*(\d{4,5}[A-Za-z]{0,3})", cpu_full, re.I)
+        if m:
+            return f"i{m.group(1)}-{m.group(2)}"
+        # 영문: "Core i7-14700KF" 형식
+        m = re.search(r"(i\d-\d{4,5}[A-Za-z]{0,3})", cpu_full, re.I)
+        if m:
+            return m.group(1)
+        # 숫자 모델만 있는 경우 (14400, 13400F 등)
+        m = re.search(r"\b(\d{4,5}[A-Za-z]{0,3})\b", cpu_full)
+        if m and len(m.group(1)) >= 4:
+            return f"i-{m.group(1)}"
+
+    # 제온 (서버/워크스테이션)
+    if "제온" in cpu_full or "XEON" in cpu:
+        m = re.search(r"[Ww]\d[-\s]\d{4,5}[A-Za-z]*", cpu_full)
+        if m:
+            return f"Xeon {m.group(0)}"
+
+    # AMD 스레드리퍼
+    if "스레드리퍼" in cpu_full or "THREADRIPPER" in cpu:
+        m = re.search(r"(\d{4,5}[A-Za-z]*)", cpu_full)
+        if m:
+            return f"TR {m.group(1)}"
+
+    return cpu_full[:12].strip()
+
+
+def short_gpu(gpu_full):
+    """GPU 전체 이름 → 짧은 모델명
+    예) INNO3D 지포스 RTX 5070 OC D7 → RTX 5070
+        SAPPHIRE 라데온 RX 7600 PULSE → RX 7600
+    """
+    # NVIDIA GeForce (RTX/GTX)
+    m = re.search(r"(RTX\s*\d{4}(?:\s*(?:Ti\s*Super|Ti|Super|SUPER))?)", gpu_full, re.I)
+    if m:
+        return re.sub(r"\s+", " ", m.group(1)).strip().upper()
+    m = re.search(r"(GTX\s*\d{4}(?:\s*(?:Ti|Super|SUPER))?)", gpu_full, re.I)
+    if m:
+        return re.sub(r"\s+", " ", m.group(1)).strip().upper()
+    # AMD Radeon (RX)
+    m = re.search(r"(RX\s*\d{4}(?:\s*(?:XT|XTX))?)", gpu_full, re.I)
+    if m:
+        return re.sub(r"\s+", " ", m.group(1)).strip().upper()
+    # NVIDIA 전문가용 (RTX A-series, RTX 6000)
+    m = re.search(r"(RTX\s*(?:A\d{3,4}|6000)[^,\s]*)", gpu_full, re.I)
+    if m:
+        return re.sub(r"\s+", " ", m.group(1)).strip()
+    # 내장 그래픽 (iGPU)
+    if "내장" in gpu_full or "iGPU" in gpu_full.upper():
+        return "내장 그래픽"
+    return gpu_full[:15]
+
+
+def gpu_key(gpu_short):
+    """RTX 5060 Ti → RTX 5060 Ti (정규화)"""
+    return re.sub(r"\s+", " ", gpu_short).strip()
+
+
+# ─── 레코드 계산 ───────────────────────────────────────────────
+_VRAM = re.compile(r"(\d{1,2})\s*GB|\b(\d{1,2})G\b", re.I)
+_GPU_MODEL = re.compile(r"^(RTX|GTX|RX)\s*(\d{3,4})")
+_RYZEN_MODEL = re.compile(r"^R\d\s+(\d)\d{3}")
+_INTEL_MODEL = re.compile(r"^i\d?-(\d{4,5})")
+
+
+def _fps_key_norm(key):
+    """js/utils.js normalizeGpuKey와 같은 비교용 키 (대문자 영숫자만)."""
+    return re.sub(r"[^A-Z0-9]+", "", str(key or "").upper())
+
+
+def load_fps_reference_keys(path=FPS_REFERENCE_PATH):
+    """fps_reference.json의 GPU 키 목록 (파일이 없으면 빈 목록)."""
+    try:
+        return sorted(json.loads(Path(path).read_text(encoding="utf-8")).get("gpus", {}))
+    except (OSError, ValueError):
+        return []
+
+
+def _rules_digest(fps_reference_keys):
+    """레코드 계산 규칙 지문: 이 모듈 소스 + GPU_TIER_MAP + fps_reference GPU 목록."""
+    h = hashlib.sha1(Path(__file__).read_bytes())
+    h.update(json.dumps([GPU_TIER_MAP, sorted(fps_reference_keys)], ensure_ascii=False).encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def _gpu_vendor(short):
+    if short == "내장 그래픽":
+        return "내장"
+    upper = short.upper()
+    if upper.startswith(("RTX", "GTX")) or "지포스" in short:
+        return "NVIDIA"
+    if upper.startswith("RX") or "라데온" in short:
+        return "AMD"
+    if "ARC" in upper or "인텔" in short:
+        return "Intel"
+    return None
+
+
+def _gpu_generation(short):
+    m = _GPU_MODEL.match(short.upper())
+    if not m:
+        return None
+    prefix, number = m.groups()
+    if prefix == "RX":
+        return f"RX {number[0]}000" if len(number) == 4 else f"RX {number[0]}00"
+    # RTX 6000 등 전문가용은 세대 번호 체계가 다름
+    if len(number) != 4 or number.endswith("00"):
+        return None
+    return f"{prefix} {number[:2]}"
+
+
+def _cpu_vendor(raw):
+    upper = raw.upper()
+    if any(k in upper for k in ("라이젠", "RYZEN", "스레드리퍼", "THREADRIPPER", "AMD")):
+        return "AMD"
+    if any(k in upper for k in ("인텔", "INTEL", "코어", "CORE", "제온", "XEON")):
+        return "Intel"
+    return None
+
+
+def _cpu_generation(short):
+    m = _RYZEN_MODEL.match(short)
+    if m:
+        return f"라이젠 {m.group(1)}000"
+    m = _INTEL_MODEL.match(short)
+    if m:
+        number = m.group(1)
+        return f"인텔 {number[:2] if len(number) == 5 else number[0]}세대"
+    return None
+
+
+class SpecCatalog:
+    """CPU/GPU 원문 → 정규화 레코드. 스레드 간 공유 가능, 레코드는 읽기 전용으로 사용."""
+
+    def __init__(self, path=CATALOG_PATH, fps_reference_keys=None):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._fps_reference_keys = fps_reference_keys
+        self._loaded = False
+        self._fps_keys = {}
+        self.rules = ""
+        self.entries = {"cpu": {}, "gpu": {}}
+        self._new = {"cpu": {}, "gpu": {}}  # 이번 프로세스에서 새로 계산한 레코드
+        # parsed: 이번 실행에서 새로 계산 (파서 프로세스 계산분은 merge 때 집계)
+        self.stats = {"parsed": 0}
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            keys = self._fps_reference_keys
+            if keys is None:
+                keys = load_fps_reference_keys()
+            self._fps_keys = {_fps_key_norm(k): k for k in keys if _fps_key_norm(k)}
+            self.rules = _rules_digest(keys)
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if data.get("rules") == self.rules:
+                for kind in ("cpu", "gpu"):
+                    if isinstance(data.get(kind), dict):
+                        self.entries[kind] = data[kind]
+            self._loaded = True
+
+    # ── 조회 ──
+    def _lookup(self, kind, raw, build):
+        self._ensure_loaded()
+        raw = raw or ""
+        record = self.entries[kind].get(raw)
+        if record is not None:
+            return record
+        record = build(raw)
+        with self._lock:
+            self.entries[kind][raw] = record
+            self._new[kind][raw] = record
+            self.stats["parsed"] += 1
+        return record
+
+    def cpu(self, raw):
+        """CPU 원문 → {short, vendor, generation}."""
+        return self._lookup("cpu", raw, self._build_cpu)
+
+    def gpu(self, raw):
+        """GPU 원문 → {short, key, tier, vendor, generation, vram}."""
+        return self._lookup("gpu", raw, self._build_gpu)
+
+    def fps_reference_key(self, gpu_short):
+        """짧은 GPU 이름 → fps_reference.json의 같은 모델 키 (없으면 None)."""
+        self._ensure_loaded()
+        return self._fps_keys.get(_fps_key_norm(gpu_short))
+
+    def _build_cpu(self, raw):
+        short = short_cpu(raw)
+        return {"short": short, "vendor": _cpu_vendor(raw), "generation": _cpu_generation(short)}
+
+    def _build_gpu(self, raw):
+        short = short_gpu(raw)
+        vram = None
+        m = _VRAM.search(raw)
+        if m:
+            vram = int(m.group(1) or m.group(2))
+        return {
+            "short": short,
+            # 프런트엔드(js/utils.js matchGpuFps)가 fps_reference.json을 바로 조회하도록 같은 표기 사용
+            "key": self.fps_reference_key(short) or gpu_key(short),
+            "tier": TIER_KEYWORDS.scan(raw).best("tier") or DEFAULT_TIER,
+            "vendor": _gpu_vendor(short),
+            "generation": _gpu_generation(short),
+            "vram": vram,
+        }
+
+    # ── 파서 프로세스 ↔ 부모 ──
+    def drain_new(self):
+        """이번 프로세스에서 새로 계산한 레코드를 꺼냄 (파서 프로세스 → 부모 전달용)."""
+        with self._lock:
+            new, self._new = self._new, {"cpu": {}, "gpu": {}}
+        return new if new["cpu"] or new["gpu"] else None
+
+    def merge(self, new):
+        """파서 프로세스가 계산한 레코드를 반영 (저장 대상)."""
+        if not new:
+            return
+        self._ensure_loaded()
+        with self._lock:
+            for kind in ("cpu", "gpu"):
+                for raw, record in new.get(kind, {}).items():
+                    if raw not in self.entries[kind]:
+                        self.entries[kind][raw] = record
+                        self._new[kind][raw] = record
+                        self.stats["parsed"] += 1
+
+    # ── 저장 ──
+    def save(self):
+        """새 레코드가 있을 때만 기록. 종류별 MAX_ENTRIES 초과분은 오래된 것부터 제거."""
+        if not self._loaded:
+            return
+        with self._lock:
+            if not (self._new["cpu"] or self._new["gpu"]):
+                return
+            data = {"rules": self.rules}
+            for kind in ("cpu", "gpu"):
+                items = list(self.entries[kind].items())[-MAX_ENTRIES:]
+                data[kind] = dict(items)
+            self._new = {"cpu": {}, "gpu": {}}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def summary(self):
+        return (
+            f"CPU {len(self.entries['cpu'])}종 / GPU {len(self.entries['gpu'])}종 "
+            f"(이번 실행 새로 계산 {self.stats['parsed']}건)"
+        )
+
+
+# 크롤러·파서 프로세스 공용 인스턴스 (첫 조회 때 저장본을 읽음)
+SPEC_CATALOG = SpecCatalog()
@@ -0,0 +1,430 @@
+"""
+stand_in_shop.py - 쇼핑몰 로컬 대역 서버 (오프라인 크롤러 측정용, 지연·장애 주입)
+
+www.youngjaecomputer.com 과 같은 URL 형태로 응답해, 쇼핑몰에 요청하지 않고
+crawl_products.py 를 끝까지 실행하고 성능 변경을 같은 조건에서 반복 측정한다.
+  - /, /shop/                            메인 (카테고리 메뉴 링크 + 노출 상품 카드)
+  - /shop/list.php?ca_id=h0[&ca_id_vi=V&ca_id_index=I][&page=N][&page_rows=N]
+                                         카테고리 목록 (ca_id_vi가 없으면 전체 목록)
+  - /shop/recommendPC.php?...  (POST)     목록 AJAX / Recommend — list.php와 같은 카드 (page는 본문·쿼리)
+  - /shop/Installment.php?ImCode=X       할부 상품 카드
+  - /shop/item.php?it_id=X               상세 — 품절 상품은 302 → list.php, 없는 상품은 alert 페이지
+  - /sitemap.xml, /shop/price/naver.php  --bulk 일 때만 (일괄 열거 bulk_ids.py 측정)
+  - /__stats                             경로별 요청 수·상태 코드·전송량 (JSON, 지연·장애 주입 제외)
+
+상품 원본:
+  - 기본: 합성 상품 --items개 (--seed가 같으면 같은 카탈로그)
+  - --fixtures DIR: bench_parse.py --freeze 코퍼스 / --archive: 원문 보관소(.cache/archive)의 상세 HTML
+
+장애 주입:
+  --latency / --jitter (ms)        모든 응답 전 대기
+  --error-rate P                   500 응답 비율
+  --throttle-rate P / --max-rps N  429 + Retry-After (무작위 비율 / 초당 요청 상한 초과분)
+  --inflate-kb N                   상세·목록 본문 끝에 주석 패딩 (전송량·스트리밍 조기 종료 측정)
+
+실행:
+    cd crawler
+    python stand_in_shop.py --items 600 --latency 80 --jitter 40 --error-rate 0.02 --max-rps 20
+    # 다른 터미널 — 출력·상태 파일은 배포 대상 data/, .cache/ 대신 별도 위치로
+    YJMOD_BASE_URL=http://127.0.0.1:8765 YJMOD_DATA_DIR=../.cache/stand_in/data \\
+    YJMOD_CRAWL_STATE_PATH=../.cache/stand_in/crawl_state.json \\
+        python crawl_products.py --no-cache --no-archive
+    curl http://127.0.0.1:8765/__stats
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from crawl_products import (
+    CATEGORIES,
+    INSTALLMENT_CODES,
+    PRICE_LABELS,
+    RECOMMEND_PAGES,
+    PriceScan,
+    product_name_from_title,
+)
+
+DEFAULT_PORT = 8765
+LIST_ROWS = 40           # 목록 기본 페이지 크기 (page_rows 파라미터로 변경)
+MAIN_ITEMS = 24          # 메인 노출 상품 수
+INSTALLMENT_SHARE = 0.1  # 할부(Installment) 페이지에도 노출되는 상품 비율
+EXTRA_CATEGORIES = 3     # CATEGORIES에 없는 메뉴 (동적 카테고리 탐색 경로)
+
+# 합성 상품 부품 (GPU 이름, 상품명용 약칭, 기준가)
+SYNTH_CPUS = [
+    "[AMD]AMD 라이젠5-5세대 7500F (라파엘)",
+    "[AMD]AMD 라이젠7-6세대 9800X3D (그래나이트 릿지)",
+    "[인텔]인텔 코어 울트라5 시리즈2 225F (애로우레이크)",
+    "[인텔]인텔 코어i7-14세대 14700F (랩터레이크 리프레시)",
+]
+SYNTH_GPUS = [
+    ("[INNO3D]INNO3D 지포스 RTX 5060 OC D7 8GB X2", "RTX 5060", 1_150_000),
+    ("[INNO3D]INNO3D 지포스 RTX 5070 OC D7 12GB X3", "RTX 5070", 1_890_000),
+    ("[MSI]MSI 지포스 RTX 5070 Ti 벤투스 3X OC D7 16GB", "RTX 5070 Ti", 2_590_000),
+    ("[ASUS]ASUS TUF Gaming 지포스 RTX 5080 O16G OC D7 16GB", "RTX 5080", 3_690_000),
+    ("[SAPPHIRE]SAPPHIRE 라데온 RX 9070 XT PULSE D6 16GB", "RX 9070 XT", 2_290_000),
+]
+SYNTH_CASES = ["[리안리]LIAN LI O11 DYNAMIC EVO 화이트", "[NZXT]NZXT H6 Flow 블랙"]
+
+_TITLE = re.compile(r"<title[^>]*>(.*?)</title>", re.I | re.S)
+_H2 = re.compile(r"<h2[^>]*>(.*?)</h2>", re.I | re.S)
+_TAG = re.compile(r"<[^>]+>")
+
+
+def category_keys():
+    """목록 대상 (vi, idx): 고정 카테고리 + Recommend + 메뉴에만 있는 추가 카테고리."""
+    keys = {}
+    for cat in CATEGORIES + RECOMMEND_PAGES:
+        keys.setdefault((cat["vi"], cat["idx"]), cat["name"])
+    for n in range(EXTRA_CATEGORIES):
+        keys.setdefault((str(900 + n), "7"), f"STAND_IN_{n}")
+    return keys
+
+
+def synthetic_item_html(item_id, name, cpu, gpu, case, price):
+    """parse_product_page가 읽는 구조(제목·스펙 라벨/값·정상가/판매가·FPS 문장)의 상세 페이지."""
+    return (
+        f"<html><head><title>{name} | 영재컴퓨터</title>"
+        f'<meta property="product:price:amount" content="{price}"></head>\n'
+        f'<body><div class="nav"><div>CPU</div><div>메뉴</div></div>\n'
+        f"<h2>{name}</h2>\n"
+        f'<form><input type="hidden" id="it_price" value="{price}">'
+        f'<input type="hidden" id="it_stock_qty" value="5"></form>\n'
+        f'<div class="spec"><div>CPU</div><div>{cpu}</div>\n'
+        f"<div>VGA</div><div>{gpu}</div>\n"
+        f"<div>RAM</div><div>[삼성]DDR5 PC5-44800 32GB (16GB x2)</div>\n"
+        f"<div>SSD</div><div>[WD]WD BLACK SN850X M.2 NVMe 1TB</div>\n"
+        f"<div>케이스</div><div>{case}</div></div>\n"
+        f"<p>정상가 {price + 210_000:,}원</p><p>판매가 {price:,}원</p>\n"
+        f"<p>배틀그라운드 QHD 평균 165 FPS, 로스트아크 240 프레임</p>\n"
+        f"<button>바로구매</button> it_id={item_id}\n"
+        f"</body></html>"
+    )
+
+
+def _card_fields(text):
+    """보관된 상세 HTML → 목록 카드용 (상품명, 가격)."""
+    title = _TITLE.search(text)
+    name = product_name_from_title(_TAG.sub("", title.group(1)).strip()) if title else ""
+    if not name:
+        h2 = _H2.search(text)
+        name = _TAG.sub("", h2.group(1)).strip() if h2 else ""
+    scan = PriceScan(text)
+    return name, scan.by_label_order(PRICE_LABELS) or scan.largest()
+
+
+class Catalog:
+    """상품(id → {name, price, html, soldout}) + 목록 구성 (카테고리 / 메인 / Installment)."""
+
+    def __init__(self, seed=0):
+        self.rng = random.Random(seed)
+        self.items = {}
+        self.keys = category_keys()
+        self.members = {key: [] for key in self.keys}
+        self.installment = {code: [] for code in INSTALLMENT_CODES}
+        self.main = []
+        self._names = {name: key for key, name in self.keys.items()}
+
+    def add(self, item_id, name, price, html, category_name=""):
+        self.items[item_id] = {"name": name, "price": price, "html": html, "soldout": False}
+        key = self._names.get(category_name)
+        if key is None:
+            key = self.rng.choice(list(self.keys))
+        self.members[key].append(item_id)
+        # 여러 카테고리 노출 (게임별·브랜드별 중복) — 일부 상품은 1~2개 카테고리에 더
+        for extra in self.rng.sample(list(self.keys), self.rng.choice((0, 0, 1, 2))):
+            if item_id not in self.members[extra]:
+                self.members[extra].append(item_id)
+        if category_name == "INSTALLMENT" or self.rng.random() < INSTALLMENT_SHARE:
+            self.installment[self.rng.choice(INSTALLMENT_CODES)].append(item_id)
+        if len(self.main) < MAIN_ITEMS and self.rng.random() < 0.3:
+            self.main.append(item_id)
+
+    def mark_soldout(self, rate):
+        for item in self.items.values():
+            item["soldout"] = self.rng.random() < rate
+
+    @classmethod
+    def synthetic(cls, count, seed=0, soldout_rate=0.05):
+        catalog = cls(seed)
+        for n in range(count):
+            item_id = str(1_700_000_000 + n)
+            cpu = catalog.rng.choice(SYNTH_CPUS)
+            gpu, short_gpu, base = catalog.rng.choice(SYNTH_GPUS)
+            price = base + catalog.rng.randrange(0, 60) * 10_000
+            name = f"{short_gpu} 게이밍 PC {n + 1:04d}"
+            html = synthetic_item_html(item_id, name, cpu, gpu, catalog.rng.choice(SYNTH_CASES), price)
+            catalog.add(item_id, name, price, html)
+        catalog.mark_soldout(soldout_rate)
+        return catalog
+
+    @classmethod
+    def from_corpus(cls, corpus, seed=0, soldout_rate=0.05):
+        """[(it_id, category, page)] (bench_parse.py 코퍼스 형식) → 보관된 상세 HTML 그대로 응답."""
+        catalog = cls(seed)
+        for item_id, category, page in corpus:
+            name, price = _card_fields(page["text"])
+            catalog.add(item_id, name or item_id, price, page["text"], (category or {}).get("name", ""))
+        catalog.mark_soldout(soldout_rate)
+        return catalog
+
+    def all_ids(self):
+        return list(self.items)
+
+
+class StandInShop:
+    """요청 → (상태, 헤더, 본문). 장애 주입·집계 포함 (HTTP 처리는 StandInHandler)."""
+
+    def __init__(self, catalog, latency=0.0, jitter=0.0, error_rate=0.0, throttle_rate=0.0,
+                 max_rps=0.0, retry_after=1, inflate_kb=0, bulk=False, seed=0):
+        self.catalog = catalog
+        self.latency = latency / 1000
+        self.jitter = jitter / 1000
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.max_rps = max_rps
+        self.retry_after = retry_after
+        self.padding = f"<!-- {'x' * max(0, inflate_kb * 1024 - 9)} -->" if inflate_kb else ""
+        self.bulk = bulk
+        self.rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = max_rps
+        self._refilled = time.monotonic()
+        self.requests = Counter()
+        self.statuses = Counter()
+        self.bytes_sent = 0
+
+    # ─── 장애 주입 ──────────────────────────────────────────────
+    def delay(self):
+        return self.latency + (self.rng.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def _over_rate(self):
+        if self.max_rps <= 0:
+            return False
+        now = time.monotonic()
+        self._tokens = min(self.max_rps, self._tokens + (now - self._refilled) * self.max_rps)
+        self._refilled = now
+        if self._tokens < 1:
+            return True
+        self._tokens -= 1
+        return False
+
+    def fault(self):
+        """주입할 장애 응답 또는 None."""
+        with self._lock:
+            throttled = self._over_rate() or self.rng.random() < self.throttle_rate
+            failed = not throttled and self.rng.random() < self.error_rate
+        if throttled:
+            body = "<html><body>Too Many Requests</body></html>"
+            return 429, {"Retry-After": str(self.retry_after)}, body
+        if failed:
+            return 500, {}, "<html><body>Internal Server Error</body></html>"
+        return None
+
+    def record(self, route, status, size):
+        with self._lock:
+            self.requests[route] += 1
+            self.statuses[str(status)] += 1
+            self.bytes_sent += size
+
+    def stats(self):
+        with self._lock:
+            return {
+                "requests": dict(self.requests),
+                "total": sum(self.requests.values()),
+                "statuses": dict(self.statuses),
+                "bytes_sent": self.bytes_sent,
+            }
+
+    # ─── 페이지 ─────────────────────────────────────────────────
+    def _card(self, item_id, installment=False):
+        item = self.catalog.items[item_id]
+        extra = ""
+        if installment:
+            extra = f'<span class="sct_month">36개월 할부 월 {item["price"] // 36:,}원</span>'
+        return (
+            f'<li class="sct_li"><div class="sct_img"><a href="/shop/item.php?it_id={item_id}">'
+            f'<img src="/data/item/{item_id}_m.jpg" alt=""></a></div>'
+            f'<div class="sct_txt"><a href="/shop/item.php?it_id={item_id}">{item["name"]}</a></div>'
+            f'<div class="sct_cost">{item["price"]:,}원</div>{extra}</li>'
+        )
+
+    def _menu(self):
+        return "".join(
+            f'<a href="/shop/list.php?ca_id=h0&ca_id_vi={vi}&ca_id_index={idx}">{name}</a>'
+            for (vi, idx), name in self.catalog.keys.items()
+        )
+
+    def _page(self, body, menu=True):
+        nav = f'<div id="gnb">{self._menu()}</div>' if menu else ""
+        return f"<html><head><title>영재컴퓨터</title></head><body>{nav}{body}{self.padding}</body></html>"
+
+    def _cards(self, ids, page, rows, installment=False):
+        chunk = ids[(page - 1) * rows: page * rows]
+        return '<ul class="sct">' + "".join(self._card(i, installment) for i in chunk) + "</ul>"
+
+    def _listing(self, query):
+        vi, idx = query.get("ca_id_vi"), query.get("ca_id_index")
+        if vi and idx:
+            return self.catalog.members.get((vi, idx), [])
+        return self.catalog.all_ids()
+
+    def respond(self, method, path, query):
+        """→ (route, status, headers, body 문자열)."""
+        page = max(1, int(query["page"])) if str(query.get("page", "")).isdigit() else 1
+        rows = max(1, int(query["page_rows"])) if str(query.get("page_rows", "")).isdigit() else LIST_ROWS
+
+        if path in ("/", "/index.php", "/shop", "/shop/", "/shop/index.php"):
+            return "main", 200, {}, self._page(self._cards(self.catalog.main, 1, MAIN_ITEMS))
+        if path == "/shop/list.php":
+            return "list", 200, {}, self._page(self._cards(self._listing(query), page, rows))
+        if path == "/shop/recommendPC.php":
+            return "recommend", 200, {}, self._cards(self._listing(query), page, rows) + self.padding
+        if path == "/shop/Installment.php":
+            ids = self.catalog.installment.get(query.get("ImCode", ""), [])
+            return "installment", 200, {}, self._page(self._cards(ids, 1, len(ids) or 1, True), menu=False)
+        if path == "/shop/item.php":
+            item = self.catalog.items.get(query.get("it_id", ""))
+            if item is None:
+                body = "<script>alert('상품정보가 존재하지 않습니다.');history.back();</script>"
+                return "item", 200, {}, body
+            if item["soldout"]:
+                # 쇼핑몰과 같이 품절 상품은 목록으로 리다이렉트
+                return "item", 302, {"Location": "/shop/list.php?ca_id=h0"}, ""
+            html = item["html"]
+            if self.padding:
+                html = html.replace("</body>", self.padding + "</body>", 1)
+            return "item", 200, {}, html
+        if self.bulk and path == "/sitemap.xml":
+            locs = "".join(
+                f"<url><loc>{{base}}/shop/item.php?it_id={i}</loc></url>" for i in self.catalog.all_ids()
+            )
+            return "sitemap", 200, {"Content-Type": "application/xml"}, f"<urlset>{locs}</urlset>"
+        if self.bulk and path == "/shop/price/naver.php":
+            lines = [
+                f"<<<begin>>>\n<<<mapid>>>{i}\n<<<pname>>>{item['name']}\n<<<price>>>{item['price']}\n"
+                f"<<<pgurl>>>{{base}}/shop/item.php?it_id={i}\n<<<ftend>>>"
+                for i, item in self.catalog.items.items()
+                if not item["soldout"]
+            ]
+            return "ep_feed", 200, {"Content-Type": "text/plain"}, "\n".join(lines)
+        return "other", 404, {}, "<html><body>Not Found</body></html>"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    server_version = "StandInShop/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args):
+        if self.server.verbose:
+            super().log_message(fmt, *args)
+
+    def do_GET(self):
+        self._handle("GET", {})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        form = parse_qs(self.rfile.read(length).decode("utf-8", errors="replace"))
+        self._handle("POST", {k: v[-1] for k, v in form.items()})
+
+    def _handle(self, method, form):
+        shop = self.server.shop
+        parts = urlsplit(self.path)
+        if parts.path == "/__stats":
+            self._send(200, {"Content-Type": "application/json"}, json.dumps(shop.stats()))
+            return
+
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        query.update(form)
+        time.sleep(shop.delay())
+        fault = shop.fault()
+        if fault is not None:
+            status, headers, body = fault
+            route = "fault"
+        else:
+            route, status, headers, body = shop.respond(method, parts.path, query)
+            if route in ("sitemap", "ep_feed"):
+                body = body.replace("{base}", f"http://{self.headers.get('Host', 'localhost')}")
+        size = self._send(status, headers, body)
+        shop.record(route, status, size)
+
+    def _send(self, status, headers, body):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", headers.pop("Content-Type", "text/html; charset=utf-8"))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        return len(data)
+
+
+def serve(shop, host="127.0.0.1", port=DEFAULT_PORT, verbose=False):
+    """대역 서버 생성 (serve_forever는 호출 측 — 테스트에서는 스레드로 실행)."""
+    server = ThreadingHTTPServer((host, port), StandInHandler)
+    server.daemon_threads = True
+    server.shop = shop
+    server.verbose = verbose
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="쇼핑몰 로컬 대역 서버 (지연·장애 주입)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--items", type=int, default=400, help="합성 상품 수 (기본 400)")
+    parser.add_argument("--fixtures", help="bench_parse.py --freeze 코퍼스 폴더의 상세 HTML 사용")
+    parser.add_argument("--archive", action="store_true", help="원문 보관소(.cache/archive)의 상세 HTML 사용")
+    parser.add_argument("--seed", type=int, default=0, help="카탈로그·장애 주입 난수 시드")
+    parser.add_argument("--soldout-rate", type=float, default=0.05, help="품절(302 리다이렉트) 상품 비율")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 전 기본 대기 (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 무작위 대기 상한 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--max-rps", type=float, default=0.0, help="초당 요청 상한 — 초과분 429 (0이면 없음)")
+    parser.add_argument("--retry-after", type=int, default=1, help="429 응답의 Retry-After (초)")
+    parser.add_argument("--inflate-kb", type=int, default=0, help="상세·목록 본문 끝 패딩 (KB)")
+    parser.add_argument("--bulk", action="store_true", help="/sitemap.xml · EP 피드 제공 (--discovery bulk)")
+    parser.add_argument("--verbose", action="store_true", help="요청 로그 출력")
+    args = parser.parse_args()
+
+    if args.fixtures or args.archive:
+        from bench_parse import load_archive_corpus, load_fixture_corpus
+
+        corpus = load_fixture_corpus(Path(args.fixtures)) if args.fixtures else load_archive_corpus()
+        catalog = Catalog.from_corpus(corpus, seed=args.seed, soldout_rate=args.soldout_rate)
+    else:
+        catalog = Catalog.synthetic(args.items, seed=args.seed, soldout_rate=args.soldout_rate)
+
+    shop = StandInShop(
+        catalog,
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate, max_rps=args.max_rps, retry_after=args.retry_after,
+        inflate_kb=args.inflate_kb, bulk=args.bulk, seed=args.seed,
+    )
+    server = serve(shop, args.host, args.port, args.verbose)
+    soldout = sum(item["soldout"] for item in catalog.items.values())
+    print(
+        f"[stand-in] http://{args.host}:{args.port} — 상품 {len(catalog.items)}개 (품절 {soldout}), "
+        f"카테고리 {len(catalog.keys)}개, Installment {len(catalog.installment)}개"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"[stand-in] {json.dumps(shop.stats(), ensure_ascii=False)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+여러 카테고리에서 발견된 상품의 분류가 emit 순서와 무관한지 확인.
+
+    cd crawler
+    python -m pytest -q test_category_tags.py
+"""
+
+import itertools
+import json
+
+from crawl_products import (
+    CATEGORIES,
+    MAIN_PAGE_CATEGORY,
+    apply_category_tags,
+    merged_category,
+    parse_product_page,
+    product_url,
+)
+
+OFFICE = next(cat for cat in CATEGORIES if cat["name"] == "사무용")
+BATTLEGROUND = next(cat for cat in CATEGORIES if cat["name"] == "배틀그라운드")
+ITEM_ID = "1700000001"
+
+
+def _page(name, gpu):
+    text = (
+        f"<html><head><title>{name} | 영재컴퓨터</title></head><body>\n"
+        f'<div class="nav"><div>CPU</div><div>메뉴</div></div>\n<h2>{name}</h2>\n'
+        f'<div class="spec"><div>CPU</div><div>[AMD]AMD 라이젠5-5세대 7500F (라파엘)</div>\n'
+        f"<div>VGA</div><div>{gpu}</div>\n"
+        f"<div>RAM</div><div>[삼성]DDR5 PC5-44800 16GB (8GB x2)</div></div>\n"
+        f"<p>정상가 1,290,000원</p><p>판매가 1,090,000원</p>\n"
+        f"<button>바로구매</button> it_id={ITEM_ID}\n</body></html>"
+    )
+    url = product_url(ITEM_ID)
+    return {"url": url, "final_url": url, "status": 200, "text": text}
+
+
+def _classified(page, emit_order):
+    """첫 emit 카테고리로 파싱 → 파이프라인 종료 후 합친 카테고리로 재분류 (main()과 같은 순서)."""
+    product = parse_product_page(ITEM_ID, emit_order[0], page)
+    assert product is not None
+    apply_category_tags(product, merged_category(emit_order))
+    tags = product["categories"]
+    return tuple(tags["games"]), tuple(tags["usage"]), product["badge"]
+
+
+def test_emit_order_does_not_change_tags():
+    pages = [
+        # 이름에 용도 키워드 없음: MAIN_PAGE가 먼저면 파싱 단계에서 "게이밍"이 붙던 경우
+        _page("영재 R5 7500F 3050 조립 컴퓨터", "[MSI]MSI 지포스 RTX 3050 벤투스 2X OC D6 6GB"),
+        _page("사무용 컴퓨터 R5 7500F", "[MSI]MSI 지포스 RTX 3050 벤투스 2X OC D6 6GB"),
+        _page("게이밍 PC RTX 5070", "[INNO3D]INNO3D 지포스 RTX 5070 OC D7 12GB X3"),
+    ]
+    for page in pages:
+        results = {
+            _classified(page, list(order))
+            for order in itertools.permutations([MAIN_PAGE_CATEGORY, OFFICE, BATTLEGROUND])
+        }
+        assert len(results) == 1, results
+
+
+def test_single_category_keeps_parse_result():
+    page = _page("사무용 컴퓨터 R5 7500F", "[MSI]MSI 지포스 RTX 3050 벤투스 2X OC D6 6GB")
+    product = parse_product_page(ITEM_ID, OFFICE, page)
+    before = (product["categories"]["games"], product["categories"]["usage"], product["badge"])
+    apply_category_tags(product, merged_category([OFFICE]))
+    assert (product["categories"]["games"], product["categories"]["usage"], product["badge"]) == before
+
+
+def _reloaded(product, keep_inputs=True):
+    """pc_data.json 저장 → 다음 실행 로드 (main(): 분류 입력은 crawl_state.json에서 다시 붙임)."""
+    previous = json.loads(json.dumps({k: v for k, v in product.items() if k != "_tag_inputs"}))
+    if keep_inputs:
+        previous["_tag_inputs"] = json.loads(json.dumps(product["_tag_inputs"]))
+    return previous
+
+
+def test_streamed_refetch_drops_category_games():
+    # 직전 실행에서 배틀그라운드 목록에 있던 상품이 이번에는 사무용 목록에서만 발견되어 스트리밍 재수집
+    page = _page("사무용 컴퓨터 i5 14400", "[INTEL]인텔 UHD 770 내장그래픽 사용 (별도 그래픽카드 없음)")
+    before = parse_product_page(ITEM_ID, BATTLEGROUND, page)
+    assert "배틀그라운드" in before["categories"]["games"]
+    streamed = dict(page, partial=True)
+    for keep_inputs in (True, False):
+        after = parse_product_page(ITEM_ID, OFFICE, streamed, _reloaded(before, keep_inputs))
+        assert "배틀그라운드" not in after["categories"]["games"]
+        fresh = parse_product_page(ITEM_ID, OFFICE, page)
+        assert after["categories"]["games"] == fresh["categories"]["games"]
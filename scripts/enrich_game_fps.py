@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-import re
+import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
@@ -11,6 +11,13 @@ from bs4 import BeautifulSoup
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA_PATH = ROOT / "data" / "pc_data.json"
+
+sys.path.insert(0, str(ROOT / "crawler"))
+from game_fps import extract_game_fps_map  # noqa: E402
+from http_cache import ResponseCache  # noqa: E402
+
+# 크롤러와 공유하는 상세 페이지 캐시 (.cache/http) — 직전 크롤이 받은 페이지는 재요청 없음
+RESPONSE_CACHE = ResponseCache()
 HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -19,107 +26,13 @@ HEADERS = {
     "Accept-Language": "ko-KR,ko;q=0.9",
 }
 
-FPS_RESOLUTION_PATTERN = re.compile(r"(FHD|QHD|4K)", re.I)
-GAME_FPS_ALIAS_MAP = {
-    "리그오브레전드": ["리그오브레전드", "LOL", "롤"],
-    "배틀그라운드": ["배틀그라운드", "배그", "PUBG"],
-    "로스트아크": ["로스트아크", "로아"],
-    "발로란트": ["발로란트", "발로"],
-    "오버워치2": ["오버워치2", "오버워치"],
-    "아이온2": ["아이온2", "아이온 2"],
-    "디아블로4": ["디아블로4", "디아4"],
-    "디아블로2": ["디아블로2", "디아2"],
-    "붉은사막": ["붉은사막"],
-    "몬스터헌터 와일드": ["몬스터헌터 와일드", "몬스터헌터", "몬헌", "와일즈"],
-    "플심": ["플심", "플라이트 시뮬레이터", "MSFS"],
-    "아크레이더스": ["아크레이더스"],
-    "연운": ["연운"],
-}
-GAME_ALIAS_LOOKUP = {
-    alias.lower(): game
-    for game, aliases in GAME_FPS_ALIAS_MAP.items()
-    for alias in aliases
-}
-GAME_ALIAS_PATTERN = "|".join(
-    re.escape(alias)
-    for alias in sorted(GAME_ALIAS_LOOKUP.keys(), key=len, reverse=True)
-)
-GAME_FPS_FORWARD_PATTERN = re.compile(
-    rf"(?:(FHD|QHD|4K)\s*)?({GAME_ALIAS_PATTERN})[^0-9]{{0,18}}(\d{{2,4}})\s*(?:FPS|프레임)",
-    re.I,
-)
-def normalize_text_compact(text: str) -> str:
-    return re.sub(r"\s+", " ", str(text or "")).strip()
-
-
-def build_game_fps_highlight(game: str, fps: int, resolution: str | None = None) -> str:
-    fps_label = f"{int(fps)} FPS"
-    if resolution:
-        return f"{resolution} {game} {fps_label}"
-    return f"{game} {fps_label}"
-
-
-def should_replace_game_fps(existing: dict | None, candidate: dict) -> bool:
-    if not existing:
-        return True
-    if not existing.get("resolution") and candidate.get("resolution"):
-        return True
-    if existing.get("source") != "detail" and candidate.get("source") == "detail":
-        return True
-    return False
-
-
-def extract_game_fps_map(name: str, page_text: str) -> dict[str, dict]:
-    extracted: dict[str, dict] = {}
-
-    for source_name, raw_text in (("name", name), ("detail", page_text)):
-        text = normalize_text_compact(raw_text)
-        if len(text) < 5:
-            continue
-
-        for match in GAME_FPS_FORWARD_PATTERN.finditer(text):
-            resolution_raw, alias_raw, fps_raw = match.groups()
-
-            try:
-                fps = int(fps_raw)
-            except (TypeError, ValueError):
-                continue
-
-            if fps < 20 or fps > 1000:
-                continue
-
-            alias_key = str(alias_raw or "").lower().strip()
-            game = GAME_ALIAS_LOOKUP.get(alias_key)
-            if not game:
-                continue
-
-            resolution = resolution_raw.upper() if resolution_raw else None
-            if not resolution:
-                window = text[max(0, match.start() - 16): min(len(text), match.end() + 16)]
-                nearby_resolution = FPS_RESOLUTION_PATTERN.search(window)
-                resolution = nearby_resolution.group(1).upper() if nearby_resolution else None
-
-            candidate = {
-                "fps": fps,
-                "resolution": resolution,
-                "label": game,
-                "highlight": build_game_fps_highlight(game, fps, resolution),
-                "source": source_name,
-            }
-
-            if should_replace_game_fps(extracted.get(game), candidate):
-                extracted[game] = candidate
-
-    return extracted
-
 
 def fetch_page_text(session: requests.Session, url: str) -> str:
     if not url:
         return ""
     try:
-        resp = session.get(url, timeout=20)
-        resp.encoding = "utf-8"
-        soup = BeautifulSoup(resp.text, "lxml")
+        page = RESPONSE_CACHE.get(session, url, timeout=20)
+        soup = BeautifulSoup(page["text"], "lxml")
         return soup.get_text(" ", strip=True)
     except Exception:
         return ""
@@ -163,6 +76,7 @@ def main() -> None:
 
     payload["products"] = updated
     DATA_PATH.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"[INFO] http cache: {RESPONSE_CACHE.summary()}")
     print(f"[OK] updated {DATA_PATH}")
 
 
@@ -23,7 +23,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
-from enrich_game_fps import extract_game_fps_map
+from enrich_game_fps import RESPONSE_CACHE
+from game_fps import extract_game_fps_map  # enrich_game_fps가 crawler/를 sys.path에 추가
 
 
 LIVE_URL = "https://ai.youngjaecomputer.com"
@@ -95,9 +96,10 @@ def apply_filters(driver: webdriver.Chrome) -> None:
 
 
 def fetch_detail_fps_map(url: str) -> dict:
-    response = requests.get(url, timeout=20, headers=HEADERS)
-    response.encoding = "utf-8"
-    soup = BeautifulSoup(response.text, "lxml")
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    page = RESPONSE_CACHE.get(session, url, timeout=20)
+    soup = BeautifulSoup(page["text"], "lxml")
     text = soup.get_text(" ", strip=True)
     title = soup.title.get_text(strip=True) if soup.title else ""
     return extract_game_fps_map(title, text)